@@ -7,18 +7,54 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from nutrimatic.models.metadata import Metadata
+from collections.abc import Mapping
+from functools import cache
+from importlib.metadata import PackageNotFoundError, metadata
+from typing import Any, cast
 
-_md = Metadata.from_package("nutri-matic")
+# Package metadata and its fallbacks, read without pydantic so that
+# `nutrimatic --version` starts fast; nutrimatic.models.Metadata builds on it.
+METADATA_DEFAULTS = {"version": "0.1.0", "author": "Jared Cook", "license": "MIT"}
+_METADATA_KEYS = {
+    "__version__": "version",
+    "__author__": "author",
+    "__license__": "license",
+}
+
+
+def package_metadata(package_name: str = "nutri-matic") -> dict[str, str]:
+    """
+    Return the version, author and license of the installed package,
+    falling back to ``METADATA_DEFAULTS`` for the package or fields missing.
+    """
+    try:
+        pkg_meta = cast(Mapping[str, str], metadata(package_name))
+    except PackageNotFoundError:
+        return dict(METADATA_DEFAULTS)
+    return {
+        key: pkg_meta.get(key.title()) or default
+        for key, default in METADATA_DEFAULTS.items()
+    }
+
+
+@cache
+def _metadata() -> dict[str, str]:
+    return package_metadata()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _METADATA_KEYS:
+        return _metadata()[_METADATA_KEYS[name]]
+    if name == "__copyright__":
+        return f"2025 {_metadata()['author']}"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__version__ = _md.version
-__author__ = _md.author
-__license__ = _md.license
-__copyright__ = _md.copyright
 
 __all__ = [
+    "METADATA_DEFAULTS",
     "__author__",
     "__copyright__",
     "__license__",
     "__version__",
+    "package_metadata",
 ]
@@ -8,15 +8,32 @@ Author: Jared Cook
 Description: Initialization of Build Utilities
 """
 
-# from .ansible
-from .readme import readme_generator
-from .sphinx import add_yaml_front_matter, clean_module_docstring, skip_dupes
-from .yaml_front_matter import (
-    add_front_matter_to_dir,
-    add_front_matter_to_file,
-    build_front_matter,
-    compute_folder_depth,
-)
+from importlib import import_module
+from typing import Any
+
+# Public helpers by submodule; submodules are imported on first access, so
+# importing nutrimatic.build does not import Sphinx.
+_EXPORTS = {
+    "add_front_matter_to_dir": "yaml_front_matter",
+    "add_front_matter_to_file": "yaml_front_matter",
+    "add_yaml_front_matter": "sphinx",
+    "build_front_matter": "yaml_front_matter",
+    "clean_module_docstring": "sphinx",
+    "compute_folder_depth": "yaml_front_matter",
+    "has_front_matter": "yaml_front_matter",
+    "init_yaml_front_matter": "sphinx",
+    "readme_generator": "readme",
+    "rewrite_front_matter": "yaml_front_matter",
+    "setup_yaml_front_matter": "sphinx",
+    "skip_dupes": "sphinx",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "add_front_matter_to_dir",
@@ -25,6 +42,10 @@ __all__ = [
     "build_front_matter",
     "clean_module_docstring",
     "compute_folder_depth",
+    "has_front_matter",
+    "init_yaml_front_matter",
     "readme_generator",
+    "rewrite_front_matter",
+    "setup_yaml_front_matter",
     "skip_dupes",
 ]
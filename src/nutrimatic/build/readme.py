@@ -11,11 +11,9 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
 
 
 def _write_front_matter(
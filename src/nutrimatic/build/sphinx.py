@@ -10,13 +10,31 @@ and used in setup function.
 """
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from sphinx.application import Sphinx
 
 from .yaml_front_matter import build_front_matter, compute_folder_depth
 
+FRONT_MATTER_BUILDER = "markdown"
+FRONT_MATTER_EXTENSIONS = ("yml", "yaml", "md")
+
+
+@dataclass
+class _FrontMatterState:
+    """Per-build state of :func:`add_yaml_front_matter`."""
+
+    enabled: bool
+    project: str
+    extensions: set[str]
+    pages: dict[str, str] = field(default_factory=dict)  # docname → front matter
+
+
+_builds: WeakKeyDictionary[Sphinx, _FrontMatterState] = WeakKeyDictionary()
+
 
 def clean_module_docstring(  # noqa: PLR0913
     app: Sphinx,
@@ -43,23 +61,49 @@ def clean_module_docstring(  # noqa: PLR0913
         lines[:] = cleaned_lines  # update the docstring lines in place
 
 
+def init_yaml_front_matter(app: Sphinx) -> None:
+    """
+    Compute the per-build state of :func:`add_yaml_front_matter` once.
+    Connect to the ``builder-inited`` event.
+    """
+    _builds[app] = _FrontMatterState(
+        enabled=app.builder.name == FRONT_MATTER_BUILDER,
+        project=getattr(app.config, "project", None) or "unknown_project",
+        extensions={e.lower() for e in FRONT_MATTER_EXTENSIONS},
+    )
+
+
 def add_yaml_front_matter(app: Sphinx, docname: str, source: list[str]) -> None:
     """
     Prepend YAML front-matter to every generated Markdown page.
+    Connect to the ``source-read`` event; the front matter of each docname
+    is built once per build.
     """
-    project_name = getattr(app.config, "project", "unknown_project")
+    state = _builds.get(app)
+    if state is None:  # builder-inited not connected
+        init_yaml_front_matter(app)
+        state = _builds[app]
 
-    if app.builder.name != "markdown":
+    if not state.enabled:
         return
 
-    relative_to_src = Path(docname)
-
-    depth = compute_folder_depth(relative_to_src)
-    extensions = {e.lower() for e in ["yml", "yaml", "md"]}
-    front_matter = build_front_matter(relative_to_src, extensions, depth, project_name)
+    front_matter = state.pages.get(docname)
+    if front_matter is None:
+        relative_to_src = Path(docname)
+        depth = compute_folder_depth(relative_to_src)
+        front_matter = build_front_matter(
+            relative_to_src, state.extensions, depth, state.project
+        )
+        state.pages[docname] = front_matter
     source[0] = front_matter + source[0]
 
 
+def setup_yaml_front_matter(app: Sphinx) -> None:
+    """Connect the YAML front matter hooks, for use in ``conf.py``'s setup."""
+    app.connect("builder-inited", init_yaml_front_matter)
+    app.connect("source-read", add_yaml_front_matter)
+
+
 def skip_dupes(  # noqa: PLR0913
     app: Sphinx, what: str, name: str, obj: Any, skip: bool, options: Any
 ) -> bool:
@@ -7,13 +7,33 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
+import codecs
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.walk import WalkEntry, walk_files
+from nutrimatic.models import (
+    FileChange,
+    FileFingerprint,
+    FrontMatterManifest,
+    RewriteReport,
+)
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
+
+FRONT_MATTER_CACHE = "front_matter"
+HASH_CHUNK_SIZE = 1024 * 1024
+FRONT_MATTER_FENCE = "---"
+SNIFF_BYTES = 4096
+COPY_CHUNK_SIZE = 256 * 1024
 
 
 def compute_folder_depth(file_path: Path) -> int:
@@ -53,6 +73,84 @@ def build_front_matter(
     return new_text
 
 
+def _sniff(file_path: Path) -> tuple[bool, int]:
+    """
+    Return whether the file, ignoring leading whitespace, begins with '---'
+    and how many bytes were read to tell.  Only the leading block is read.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    head, read = "", 0
+    with open(file_path, "rb") as f:
+        while chunk := f.read(SNIFF_BYTES):
+            read += len(chunk)
+            head = (head + decoder.decode(chunk)).lstrip()
+            if len(head) >= len(FRONT_MATTER_FENCE):
+                break
+    return head.startswith(FRONT_MATTER_FENCE), read
+
+
+def has_front_matter(file_path: Path) -> bool:
+    """
+    True if the file, ignoring leading whitespace, begins with '---'.
+    Only the leading block of the file is read.
+    """
+    return _sniff(file_path)[0]
+
+
+def _prepend(file_path: Path, header: bytes) -> int:
+    """
+    Write ``header`` followed by a chunked copy of the file into a temp file
+    next to it, then atomically replace the file, keeping memory flat.
+    Returns the number of bytes copied from the original.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with open(file_path, "rb") as src, open(fd, "wb") as dst:
+            dst.write(header)
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+            copied = dst.tell() - len(header)
+        os.chmod(tmp_name, stat.S_IMODE(file_path.stat().st_mode))
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return copied
+
+
+def rewrite_front_matter(
+    file_path: Path,
+    extensions: set[str],
+    depth: int,
+    project: str | None = None,
+    *,
+    dry_run: bool = False,
+) -> FileChange:
+    """
+    Add YAML front matter to a single file, unless it already has some.
+    With ``dry_run`` the file is only checked, never written.
+    """
+    project_name = project or "unknown_project"
+
+    # Skip if file already begins with '---'
+    skip, read = _sniff(file_path)
+    if skip:
+        return FileChange(path=file_path, bytes_read=read)
+    if dry_run:
+        return FileChange(path=file_path, modified=True, bytes_read=read)
+
+    header = build_front_matter(file_path, extensions, depth, project_name)
+    encoded = header.encode("utf-8")
+    copied = _prepend(file_path, encoded)
+    return FileChange(
+        path=file_path,
+        modified=True,
+        bytes_read=read + copied,
+        bytes_written=len(encoded) + copied,
+    )
+
+
 def add_front_matter_to_file(
     file_path: Path,
     extensions: set[str],
@@ -63,43 +161,140 @@ def add_front_matter_to_file(
     Add YAML front matter to a single file.
     Returns True if modified, False if skipped.
     """
-    project_name = project or "unknown_project"
+    return rewrite_front_matter(file_path, extensions, depth, project).modified
 
-    original_content = file_path.read_text(encoding="utf-8")
-    # Skip if file already begins with '---'
-    if original_content.lstrip().startswith("---"):
-        return False
 
-    new_text = (
-        build_front_matter(file_path, extensions, depth, project_name)
-        + original_content
+def _fingerprint(file_path: Path) -> FileFingerprint:
+    """Return the current (mtime, size, sha256) of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    st = file_path.stat()
+    return FileFingerprint(
+        mtime_ns=st.st_mtime_ns, size=st.st_size, sha256=digest.hexdigest()
     )
 
-    file_path.write_text(new_text, encoding="utf-8")
-    return True
 
+def _unchanged(entry: WalkEntry, known: FileFingerprint | None) -> FileFingerprint | None:
+    """
+    Return the fingerprint to record if the file still matches ``known``:
+    by the walker's cached mtime and size without opening it, or by content
+    hash if only the mtime changed (e.g. a touch or a fresh checkout).
+    None if it changed.
+    """
+    if known is None:
+        return None
+    st = entry.stat()
+    if st.st_size != known.size:
+        return None
+    if st.st_mtime_ns == known.mtime_ns:
+        return known
+    current = _fingerprint(entry.path)
+    return current if current.sha256 == known.sha256 else None
+
+
+def _manifest_path(directory: Path, cache_dir: Path) -> Path:
+    key = hashlib.sha256(str(directory.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / FRONT_MATTER_CACHE / f"{key}.json"
+
+
+def _load_manifest(path: Path) -> FrontMatterManifest:
+    try:
+        return FrontMatterManifest.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        return FrontMatterManifest()
+
+
+def _save_manifest(path: Path, manifest: FrontMatterManifest) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(manifest.model_dump_json())
+    os.replace(tmp_name, path)
+
+
+def _process_file(  # noqa: PLR0913
+    entry: WalkEntry,
+    extensions: set[str],
+    project: str | None,
+    known: FileFingerprint | None,
+    *,
+    incremental: bool,
+    dry_run: bool,
+) -> tuple[FileChange, FileFingerprint | None]:
+    """
+    Add front matter to one file, unless the manifest says it is unchanged.
+    Returns the change and the fingerprint to record.
+    """
+    if incremental and (unchanged := _unchanged(entry, known)):
+        logger.debug(f" - unchanged since last run: {entry.path}")
+        return FileChange(path=entry.path), unchanged
+
+    depth = compute_folder_depth(Path(entry.rel_path))
+    change = rewrite_front_matter(
+        entry.path, extensions, depth, project, dry_run=dry_run
+    )
+    if change.modified:
+        action = "would add front matter" if dry_run else "front matter added"
+        logger.debug(f" - {action}: {entry.path}")
+    fingerprint = _fingerprint(entry.path) if incremental and not dry_run else None
+    return change, fingerprint
 
-def add_front_matter_to_dir(
+
+def add_front_matter_to_dir(  # noqa: PLR0913
     directory: Path,
     extensions: set[str],
     project: str | None = None,
-) -> int:
+    *,
+    max_workers: int | None = None,
+    incremental: bool = False,
+    cache_dir: Path | None = None,
+    dry_run: bool = False,
+) -> RewriteReport:
     """
     Walk a directory recursively, adding front matter to all valid extensions.
-    Returns the number of files modified.
-    """
-    count = 0
-    for file_path in directory.rglob("*"):
-        if not file_path.is_file():
-            continue
-        logger.debug(f"Checking file: {file_path}")
-        if file_path.suffix.lower().lstrip(".") not in extensions:
-            logger.info(f" - skipped due to extension: {file_path.suffix}")
-            continue
-        file_path_rel = file_path.relative_to(directory)
-        depth = compute_folder_depth(file_path_rel)
-        if add_front_matter_to_file(file_path, extensions, depth, project):
-            logger.info(f" - front matter added: {file_path}")
-            count += 1
-
-    return count
+    Returns a report of files scanned and modified, bytes read and written
+    and the time taken.
+
+    Files are processed on a thread pool of ``max_workers``
+    (``CLIConfig.max_workers`` by default; 1 processes them in order).
+    With ``incremental``, a manifest of (path, mtime, size, sha256) per
+    directory is kept under ``cache_dir`` (``CLIConfig.cache_dir`` by
+    default) and files unchanged since the last run are not opened again.
+    With ``dry_run`` files are only checked: nothing is written and the
+    manifest is left as is.
+    """
+    start = time.perf_counter()
+    entries = list(walk_files(directory, extensions=extensions))
+
+    cli_cfg = ensure_config()
+    manifest_path = _manifest_path(directory, cache_dir or cli_cfg.cache_dir)
+    known = _load_manifest(manifest_path).files if incremental else {}
+
+    def process(entry: WalkEntry) -> tuple[FileChange, FileFingerprint | None]:
+        return _process_file(
+            entry,
+            extensions,
+            project,
+            known.get(entry.rel_path),
+            incremental=incremental,
+            dry_run=dry_run,
+        )
+
+    with ThreadPoolExecutor(max_workers or cli_cfg.max_workers) as executor:
+        results = list(executor.map(process, entries))
+
+    if incremental and not dry_run:
+        files = {
+            entry.rel_path: fingerprint
+            for entry, (_, fingerprint) in zip(entries, results, strict=True)
+            if fingerprint is not None
+        }
+        _save_manifest(manifest_path, FrontMatterManifest(files=files))
+
+    report = RewriteReport.from_changes(
+        (change for change, _ in results), time.perf_counter() - start, dry_run
+    )
+    logger.debug(f"Front matter: {report.summary()}")
+    return report
@@ -10,13 +10,23 @@ Description: Command-line interface for Cookiecutter build automation utilities.
 
 import typer
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.models import CLIConfig
+from .lazy import LazySpec, lazy_group
+from .options import init_context
 
-from .commands.nmbuild import add_yaml_front_matter, build_readme
-from .options import verbose_mode
+COMMANDS = {
+    "readme": LazySpec(
+        "nutrimatic.cli.commands.nmbuild.readme:build_readme",
+        "Build README.md using Jekyll exactly like the Makefile target.",
+    ),
+    "add-yaml-front-matter": LazySpec(
+        "nutrimatic.cli.commands.nmbuild.yaml_front_matter:add_yaml_front_matter",
+        "Add YAML front matter to all files in DIRECTORY matching extensions.",
+    ),
+}
 
-app = typer.Typer(help="Cookiecutter build automation utilities.")
+app = typer.Typer(
+    help="Cookiecutter build automation utilities.", cls=lazy_group(COMMANDS)
+)
 
 
 @app.callback(invoke_without_command=True)
@@ -30,20 +40,14 @@ def main(
     Main CLI entrypoint for nutri-matic build:
     Initialize configuration and logging for all subcommands.
     """
-    # Ensure config exists and load it
-    cfg: CLIConfig = ensure_config()
-
-    # Attach shared objects to context
-    ctx.obj = verbose_mode(cfg, verbose)
+    # Load config and logger, attaching shared objects to context
+    ctx.obj = init_context(verbose)
 
 
 # -----------------------------
 # Register commands:
 # -----------------------------
-# nm-build Command:
-# -----------------------------
-app.command(name="readme")(build_readme)
-app.command()(add_yaml_front_matter)
+# nm-build Command: (COMMANDS, loaded on first use)
 # -----------------------------
 
 
@@ -21,7 +21,7 @@ app = typer.Typer(
 )
 
 
-def add_yaml_front_matter(
+def add_yaml_front_matter(  # noqa: PLR0913, PLR0917
     ctx: typer.Context,
     directory: Path = typer.Argument(
         ..., exists=True, file_okay=False, help="Directory to scan"
@@ -37,15 +37,50 @@ def add_yaml_front_matter(
         "--project",
         help="Project or top-level name used for top parent pages.",
     ),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", min=1, help="Parallel workers (default: max_workers)."
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Skip files unchanged since the last run (manifest in cache_dir).",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Report the files to modify without writing."
+    ),
+    report_path: Path = typer.Option(
+        None, "--report", help="Write the run report as JSON to this file."
+    ),
 ) -> None:
     """
     Add YAML front matter to all files in DIRECTORY matching extensions.
     """
     _ = ctx.obj["logger"]
-    _ = ctx.obj["cfg"]
+    cli_cfg = ctx.obj["cfg"]
 
     extensions = {e.lower() for e in ext}
 
-    modified = add_front_matter_to_dir(directory, extensions, project)
+    report = add_front_matter_to_dir(
+        directory,
+        extensions,
+        project,
+        max_workers=workers,
+        incremental=incremental,
+        cache_dir=cli_cfg.cache_dir,
+        dry_run=dry_run,
+    )
+
+    if report_path:
+        report_path.write_text(report.model_dump_json(indent=2))
+
+    action = "would add front matter" if dry_run else "front matter added"
+    for path in report.modified:
+        typer.echo(f" - {action}: {path}")
 
-    typer.echo(f"✅ Added YAML front matter to {modified} file(s) under {directory}")
+    if dry_run:
+        typer.echo(f"🔎 Dry run under {directory}: {report.summary()}")
+    else:
+        typer.echo(
+            f"✅ Added YAML front matter to {report.files_modified} file(s) "
+            f"under {directory}: {report.summary()}"
+        )
@@ -8,5 +8,6 @@ Author: Jared Cook
 """
 
 from .generate import generate
+from .sync import sync
 
-__all__ = ["generate"]
+__all__ = ["generate", "sync"]
@@ -0,0 +1,57 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Sync templates into the local template store.
+"""
+
+import typer
+from git import GitCommandError
+
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.store import TemplateStore
+from nutrimatic.hooks.post_gen_logic.docs import DOCS_REPOS, TEMPLATE_URL
+
+
+def sync(
+    repos: list[str] | None = typer.Argument(
+        None,
+        help="Template repo URLs or paths (default: stored templates + docs)",
+    ),
+    ref: str | None = typer.Option(
+        None, "--ref", "-r", help="Branch or tag to sync (default branch if unset)"
+    ),
+) -> None:
+    """
+    Fetch templates and store versioned checkouts under the cache directory.
+
+    Nested renders (docs templates, add-docs, run) use the stored checkout
+    when one exists, so project generation works offline.
+    """
+    store = TemplateStore.from_config(ensure_config())
+
+    targets: list[tuple[str, str | None]]
+    if repos:
+        targets = [(repo, ref) for repo in repos]
+    else:
+        targets = [(t.url, t.ref) for t in store.manifest().templates.values()]
+        for repo in DOCS_REPOS.values():
+            url = TEMPLATE_URL.format(repo=repo)
+            if store.key(url) not in store.manifest().templates:
+                targets.append((url, None))
+
+    failed = 0
+    for url, target_ref in targets:
+        try:
+            stored = store.sync(url, target_ref)
+        except (GitCommandError, OSError, ValueError) as e:
+            failed += 1
+            typer.echo(f"❌ {url}: {e}", err=True)
+            continue
+        typer.echo(f"✅ {url}@{stored.ref} → {stored.commit[:12]} ({stored.path})")
+
+    if failed:
+        raise typer.Exit(code=1)
@@ -8,13 +8,14 @@ Author: Jared Cook
 """
 
 from .docs import add_docs
-from .extract import extract
+from .extract import extract, extract_batch
 from .list import list_namespace
 from .run import run
 
 __all__ = [
     "add_docs",
     "extract",
+    "extract_batch",
     "list_namespace",
     "run",
 ]
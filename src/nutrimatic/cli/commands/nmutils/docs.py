@@ -16,6 +16,8 @@ from pathlib import Path
 import typer
 from cookiecutter.main import cookiecutter
 
+from nutrimatic.core.store import DEFAULT_REF, resolve_template
+
 
 def add_docs(
     ctx: typer.Context,
@@ -24,12 +26,15 @@ def add_docs(
         "git@github.com:jcook3701/github-docs-cookiecutter.git",
         help="GitHub docs template repo",
     ),
-    branch: str = typer.Option("main", help="Branch of the template repo"),
+    branch: str = typer.Option(
+        DEFAULT_REF, help="Branch of the template repo (default branch if HEAD)"
+    ),
     force: bool = typer.Option(False, help="Overwrite existing files if they exist"),
 ) -> None:
     """
     Pull all files from the cookiecutter template into ./docs/<target_dir>
-    in the target project root.
+    in the target project root.  Uses the local template store copy of
+    ``template_repo@branch`` when it was synced with ``nutrimatic template sync``.
     """
     _ = ctx.obj["logger"]
     _ = ctx.obj["cfg"]
@@ -37,11 +42,14 @@ def add_docs(
     # Create a temp dir to render template
     with tempfile.TemporaryDirectory() as tmpdir:
         typer.echo(f"Running {template_repo} cookiecutter... {tmpdir} ...")
-        cookiecutter(template_repo, checkout=branch, no_input=True, output_dir=tmpdir)
+        template = resolve_template(template_repo, branch)
+        checkout = None if template != template_repo else branch
+        cookiecutter(template, checkout=checkout, no_input=True, output_dir=tmpdir)
 
-        # Find the rendered template folder (the first directory in tmpdir)
         rendered_path = Path(tmpdir)
 
+        # os.walk lists every directory, so empty template directories are
+        # created too.
         for root, _dirs, files in os.walk(rendered_path):
             rel_path = Path(root).relative_to(rendered_path)
             dest_root = Path(target_dir) / rel_path
@@ -8,55 +8,127 @@ Author: Jared Cook
 Description: handles extracting and cleaning cookiecutter.json
 
 This module provides functions to:
-  - Clone a Cookiecutter template repository from GitHub.
-  - Extract the `cookiecutter.json` configuration file.
+  - Mirror a Cookiecutter template repository from GitHub into the cache.
+  - Read the `cookiecutter.json` configuration file from the mirror.
   - Remove Jinja placeholders from the config.
   - Save a cleaned version locally for use in automated template rendering.
+  - Do all of the above for many repos in parallel (extract-batch).
 """
 
-import json
-import re
-import tempfile
 from pathlib import Path
 
 import typer
-from git import Repo  # Requires GitPython
 
+from nutrimatic.core.github import iter_namespace
+from nutrimatic.core.mirror import MirrorCache
+from nutrimatic.core.template import (
+    extract_config,
+    extract_many,
+    read_manifest,
+    write_config,
+)
+from nutrimatic.models import ExtractJob
 
-def extract(
+
+def extract(  # noqa: PLR0913, PLR0917
     ctx: typer.Context,
     repo: str = typer.Argument(
         ..., help="GitHub repo URL of the cookiecutter template"
     ),
     branch: str = typer.Option("main", help="Branch to use"),
     output: str = typer.Option("clean_cookiecutter.json", help="Output JSON file path"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Fetch the cached mirror even if it is fresh."
+    ),
+    jinja_lexer: bool = typer.Option(
+        False,
+        "--jinja-lexer",
+        help="Detect templated values with Jinja's lexer (honours _jinja2_env_vars).",
+    ),
 ) -> None:
     """
     Clone a repo, extract cookiecutter.json, remove Jinja placeholders, save locally.
+
+    Repos are kept as bare mirrors under the cache directory and the config
+    is read from the object database, so re-extracting skips the clone.
     """
     _ = ctx.obj["logger"]
-    _ = ctx.obj["cfg"]
+    cli_cfg = ctx.obj["cfg"]
+
+    mirrors = MirrorCache.from_config(cli_cfg, refresh=refresh)
+    typer.echo(f"Reading {repo} from {mirrors.path(repo)} ...")
+    try:
+        cleaned_data = extract_config(repo, branch, mirrors, jinja_lexer)
+    except FileNotFoundError:
+        typer.echo(f"Error: No cookiecutter.json found in {repo}", err=True)
+        raise typer.Exit(code=1) from None
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        typer.echo(f"Cloning {repo} into {tmpdir} ...")
-        Repo.clone_from(repo, tmpdir, branch=branch, depth=1)
+    output_path = Path(output)
+    write_config(cleaned_data, output_path)
 
-        config_path = Path(tmpdir) / "cookiecutter.json"
-        if not config_path.exists():
-            typer.echo(f"Error: No cookiecutter.json found in {repo}", err=True)
-            raise typer.Exit(code=1)
+    typer.echo(f"Saved cleaned config to {output_path}")
+
+
+def extract_batch(  # noqa: PLR0913, PLR0917
+    ctx: typer.Context,
+    repos: list[str] | None = typer.Argument(
+        None, help="Repo URLs or paths of cookiecutter templates"
+    ),
+    manifest: Path | None = typer.Option(
+        None, "--manifest", "-m", help="File listing one '<repo> [branch]' per line."
+    ),
+    namespace: str | None = typer.Option(
+        None, "--namespace", "-n", help="Extract every template of a GitHub namespace."
+    ),
+    branch: str = typer.Option("main", help="Branch to use when none is given"),
+    output_dir: Path = typer.Option(
+        Path("clean_configs"), "--output-dir", "-o", help="Directory for the configs"
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", min=1, help="Parallel workers (default: max_workers)."
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Fetch cached mirrors even if they are fresh."
+    ),
+    jinja_lexer: bool = typer.Option(
+        False,
+        "--jinja-lexer",
+        help="Detect templated values with Jinja's lexer (honours _jinja2_env_vars).",
+    ),
+) -> None:
+    """
+    Extract cleaned cookiecutter.json files of many repos in parallel.
+
+    Writes one <repo>.json per template plus report.json with per-repo
+    timing and failures to the output directory.
+    """
+    logger = ctx.obj["logger"]
+    cli_cfg = ctx.obj["cfg"]
 
-        with open(config_path) as f:
-            data: dict[str, object] = json.load(f)
+    jobs = [ExtractJob(repo=repo, branch=branch) for repo in repos or []]
+    if manifest:
+        jobs += read_manifest(manifest, branch)
+    if namespace:
+        jobs += [
+            ExtractJob(repo=t.repo.clone_url, branch=t.repo.default_branch)
+            for t in iter_namespace(namespace)
+        ]
+    if not jobs:
+        typer.echo("Error: give repos, --manifest or --namespace", err=True)
+        raise typer.Exit(code=1)
 
-        cleaned_data: dict[str, object] = {
-            k: v
-            for k, v in data.items()
-            if not (isinstance(v, str) and re.search(r"{{\s*cookiecutter", v))
-        }
+    mirrors = MirrorCache.from_config(cli_cfg, refresh=refresh)
+    report = extract_many(jobs, output_dir, mirrors, workers, jinja_lexer)
 
-        output_path = Path(output)
-        with open(output_path, "w") as f:
-            json.dump(cleaned_data, f, indent=4)
+    for result in report.results:
+        status = f"❌ {result.error}" if result.error else f"✅ {result.output}"
+        logger.info(f"{result.seconds:7.2f}s  {result.repo}  {status}")
 
-        typer.echo(f"Saved cleaned config to {output_path}")
+    report_path = output_dir / "report.json"
+    report_path.write_text(report.model_dump_json(indent=4))
+    logger.info(
+        f"Extracted {len(report.results) - len(report.failures)}/{len(report.results)} "
+        f"templates in {report.seconds:.2f}s (report: {report_path})"
+    )
+    if report.failures:
+        raise typer.Exit(code=1)
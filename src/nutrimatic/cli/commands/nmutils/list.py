@@ -7,32 +7,103 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
+import time
+from pathlib import Path
+
 import typer
 
-from nutrimatic.core.github import fetch_namespace
-from nutrimatic.models import Namespace
+from nutrimatic.core.cache import DiskCache
+from nutrimatic.core.index import TemplateIndex
+from nutrimatic.models import IndexEntry
+
 
-app = typer.Typer(help="List available cookiecutter templates under a namespace.")
+def _describe(entry: IndexEntry) -> str:
+    if entry.ccmeta:
+        author = entry.ccmeta.template.maintainer or "Unknown"
+    elif entry.template and entry.template.config:
+        author = entry.template.config.author or "Unknown"
+    else:
+        author = "Unknown"
+    return f"- {entry.name}: {entry.description or 'No description'} by {author}"
 
 
-def list_namespace(
+def list_namespace(  # noqa: PLR0913, PLR0917
     ctx: typer.Context,
     namespace: str = typer.Argument(
         ..., help="GitHub username or organization to search for templates"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached results and re-fetch from GitHub."
+    ),
+    graphql: bool = typer.Option(
+        False,
+        "--graphql",
+        help="Fetch repos and configs in one GraphQL query per 100 repos (requires github.auth.token).",
+    ),
+    search: str | None = typer.Option(
+        None, "--search", "-s", help="Search the local index by name or description."
+    ),
+    tag: str | None = typer.Option(
+        None, "--tag", help="Filter the local index by tag."
+    ),
+    language: str | None = typer.Option(
+        None, "--language", help="Filter the local index by language."
+    ),
+    ccmeta: Path | None = typer.Option(
+        None, "--ccmeta", help="Also index ccmeta (teabag.toml) templates in this dir."
+    ),
 ) -> None:
     """List all available cookiecutter templates in a GitHub namespace."""
     logger = ctx.obj["logger"]
-    # cfg = ctx.obj["cfg"] NOTE: Need to differentiate between this and cookiecutter.json configuration file.
+    cli_cfg = ctx.obj["cfg"]
 
-    ns: Namespace = fetch_namespace(namespace)
-    if not ns.templates:
+    cache = DiskCache.from_config(cli_cfg, "github", refresh=refresh)
+
+    with TemplateIndex.from_config(cli_cfg) as index:
+        namespaces = [namespace]
+        if ccmeta:
+            count = index.add_ccmeta(ccmeta)
+            namespaces.append(str(ccmeta.resolve()))
+            logger.info(f"Indexed {count} ccmeta template(s) from {ccmeta}")
+
+        if search or tag or language:
+            if refresh or not index.has_namespace(namespace):
+                for _ in index.refresh_namespace(
+                    namespace, cache=cache, graphql=graphql, full=refresh
+                ):
+                    pass
+
+            start = time.perf_counter()
+            entries = index.search(search, tag, language, namespaces)
+            elapsed = time.perf_counter() - start
+
+            logger.info(f"Templates matching under {namespace}:\n")
+            for entry in entries:
+                logger.info(_describe(entry))
+            if not entries:
+                logger.warning("No indexed templates match the given filters")
+            logger.debug(f"Index search took {elapsed * 1000:.2f} ms")
+            return
+
+        logger.info(f"Templates under {namespace}:\n")
+        count = 0
+        # Templates are printed as they resolve instead of after the whole scan,
+        # and only repos pushed to since the last listing are fetched again.
+        for template in index.refresh_namespace(
+            namespace, cache=cache, graphql=graphql, full=refresh
+        ):
+            cfg = template.config
+            logger.info(
+                f"- {template.repo.name}: {cfg.description if cfg else 'No description'} by {cfg.author if cfg else 'Unknown'}"
+            )
+            count += 1
+
+    if not count:
         logger.warning(f"No templates found under '{namespace}'")
-        return
-
-    logger.info(f"Templates under {namespace}:\n")
-    for template in ns.templates:
-        cfg = template.config
-        logger.info(
-            f"- {template.repo.name}: {cfg.description if cfg else 'No description'} by {cfg.author if cfg else 'Unknown'}"
-        )
+
+    stats = cache.stats
+    logger.info(
+        f"Cache: {stats.hits} hits, {stats.revalidations} revalidated, "
+        f"{stats.downloads} downloaded ({stats.bytes_downloaded} bytes), "
+        f"{stats.bytes_saved} bytes saved"
+    )
@@ -18,6 +18,8 @@ import json
 import typer
 from cookiecutter.main import cookiecutter
 
+from nutrimatic.core.store import resolve_template
+
 
 def run(
     ctx: typer.Context,
@@ -28,6 +30,7 @@ def run(
 ) -> None:
     """
     Run a cookiecutter template using a pre-supplied JSON config.
+    Uses the local template store copy of the template, if synced.
     """
     _ = ctx.obj["logger"]
     _ = ctx.obj["cfg"]
@@ -35,9 +38,10 @@ def run(
     with open(config) as f:
         extra_context = json.load(f)
 
+    source = resolve_template(template, branch)
     cookiecutter(
-        template,
-        checkout=branch,
+        source,
+        checkout=None if source != template else branch,
         no_input=True,
         extra_context=extra_context,
         output_dir=output_dir,
@@ -10,13 +10,17 @@ Description: Command-line interface for Cookiecutter configuration utilities.
 
 import typer
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.models import CLIConfig
+from .lazy import LazySpec, lazy_group
+from .options import init_context
 
-from .commands.nmconfig import show_config
-from .options import verbose_mode
+COMMANDS = {
+    "show": LazySpec(
+        "nutrimatic.cli.commands.nmconfig.config:show_config",
+        "Print the current CLI configuration to the screen.",
+    ),
+}
 
-app = typer.Typer(help="nutri-matic configuration tools.")
+app = typer.Typer(help="nutri-matic configuration tools.", cls=lazy_group(COMMANDS))
 
 
 @app.callback(invoke_without_command=True)
@@ -30,19 +34,14 @@ def main(
     Main CLI entrypoint for nutri-matic configuration:
     Initialize configuration and logging for all subcommands.
     """
-    # Ensure config exists and load it
-    cfg: CLIConfig = ensure_config()
-
-    # Attach shared objects to context
-    ctx.obj = verbose_mode(cfg, verbose)
+    # Load config and logger, attaching shared objects to context
+    ctx.obj = init_context(verbose)
 
 
 # -----------------------------
 # Register commands
 # -----------------------------
-# nm-config commands:
-# -----------------------------
-app.command(name="show")(show_config)
+# nm-config commands: (COMMANDS, loaded on first use)
 # -----------------------------
 
 
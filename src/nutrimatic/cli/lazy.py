@@ -0,0 +1,78 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Lazy command registry for the Typer CLIs.
+
+Subcommands are registered by import path and short help only; the module
+implementing a subcommand (and its heavy dependencies: cookiecutter,
+GitPython, requests, Sphinx, ...) is imported when the subcommand is
+invoked, so ``--help`` and ``--version`` stay fast.
+"""
+
+from functools import cached_property
+from importlib import import_module
+from typing import Any, NamedTuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazySpec(NamedTuple):
+    """Import path (``module:attr``) and short help of a lazy subcommand."""
+
+    path: str
+    help: str
+
+
+class LazyCommand(TyperCommand):
+    """
+    Placeholder for a subcommand, loaded on first use.
+
+    Group help only needs the name and short help; parsing and invoking the
+    subcommand is delegated to the real command, built from the Typer
+    command function imported from ``path``.
+    """
+
+    def __init__(self, name: str, spec: LazySpec) -> None:
+        super().__init__(name, help=spec.help)
+        self.path = spec.path
+
+    # Click types are spelled Any: newer typer releases vendor click.
+
+    @cached_property
+    def command(self) -> Any:
+        module, _, attr = self.path.partition(":")
+        app = typer.Typer(add_completion=False)
+        app.command(name=self.name)(getattr(import_module(module), attr))
+        return typer.main.get_command(app)
+
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: Any = None,
+        **extra: Any,
+    ) -> Any:
+        return self.command.make_context(info_name, args, parent, **extra)
+
+    def invoke(self, ctx: Any) -> Any:
+        return self.command.invoke(ctx)
+
+
+def lazy_group(commands: dict[str, LazySpec]) -> type[TyperGroup]:
+    """
+    Return a TyperGroup class registering ``commands`` lazily, for use as
+    ``typer.Typer(cls=lazy_group({...}))``.
+    """
+
+    class LazyGroup(TyperGroup):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            for name, spec in commands.items():
+                self.add_command(LazyCommand(name, spec))
+
+    return LazyGroup
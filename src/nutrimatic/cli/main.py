@@ -10,6 +10,7 @@ Description: Command-line interface Cookiecutter automation utilities.
 Provides commands to:
   - extract: Clone a Cookiecutter template repo, clean
     its cookiecutter.json of Jinja placeholders, and save locally.
+  - extract-batch: Extract many templates in parallel with a summary report.
   - run: Render a Cookiecutter template using a pre-supplied JSON config file.
 """
 
@@ -18,13 +19,39 @@ import typer
 from nutrimatic.cli.build import app as build_app
 from nutrimatic.cli.config import app as config_app
 from nutrimatic.cli.templates import app as template_app
-from nutrimatic.core.config import ensure_config
-from nutrimatic.models import CLIConfig
 
-from .commands.nmutils import add_docs, extract, list as list_cmds, run
-from .options import verbose_mode, version_mode
+from .lazy import LazySpec, lazy_group
+from .options import init_context, version_mode
 
-app = typer.Typer(help="Nutri-Matic: Cookiecutter automation utilities")
+NMUTILS = "nutrimatic.cli.commands.nmutils"
+COMMANDS = {
+    "add-docs": LazySpec(
+        f"{NMUTILS}.docs:add_docs",
+        "Pull all files from the cookiecutter template into ./docs/<target_dir> "
+        "in the target project root.",
+    ),
+    "extract": LazySpec(
+        f"{NMUTILS}.extract:extract",
+        "Clone a repo, extract cookiecutter.json, remove Jinja placeholders, "
+        "save locally.",
+    ),
+    "extract-batch": LazySpec(
+        f"{NMUTILS}.extract:extract_batch",
+        "Extract cleaned cookiecutter.json files of many repos in parallel.",
+    ),
+    "list": LazySpec(
+        f"{NMUTILS}.list:list_namespace",
+        "List all available cookiecutter templates in a GitHub namespace.",
+    ),
+    "run": LazySpec(
+        f"{NMUTILS}.run:run",
+        "Run a cookiecutter template using a pre-supplied JSON config.",
+    ),
+}
+
+app = typer.Typer(
+    help="Nutri-Matic: Cookiecutter automation utilities", cls=lazy_group(COMMANDS)
+)
 
 
 @app.callback(invoke_without_command=True)
@@ -45,22 +72,14 @@ def main(
     Main CLI entrypoint for nutri-matic Cookiecutter utilities:
     Initialize configuration and logging for all subcommands.
     """
-    # Ensure config exists and load it
-    cfg: CLIConfig = ensure_config()
-
-    # Attach shared objects to context
-    ctx.obj = verbose_mode(cfg, verbose)
+    # Load config and logger, attaching shared objects to context
+    ctx.obj = init_context(verbose)
 
 
 # -----------------------------
 # Register commands
 # -----------------------------
-# nm-util commands:
-# -----------------------------
-app.command()(add_docs)
-app.command()(extract)
-app.add_typer(list_cmds.app, name="list")
-app.command()(run)
+# nm-util commands: (COMMANDS, loaded on first use)
 # -----------------------------
 # nm-config commands:
 # -----------------------------
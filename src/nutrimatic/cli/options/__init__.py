@@ -7,10 +7,11 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from .verbose import verbose_mode
+from .verbose import init_context, verbose_mode
 from .version import version_mode
 
 __all__ = [
+    "init_context",
     "verbose_mode",
     "version_mode",
 ]
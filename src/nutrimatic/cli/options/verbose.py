@@ -7,24 +7,38 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from dataclasses import replace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from nutrimatic.core.logger import setup_logging
-from nutrimatic.models import CLIConfig
+if TYPE_CHECKING:
+    from nutrimatic.models import CLIConfig
 
+# Config, logging and pydantic are imported when a command runs, not when
+# the CLI is imported, so --help and --version do not pay for them.
 
-def verbose_mode(cfg: CLIConfig, verbose: bool) -> Any:
+
+def verbose_mode(cfg: "CLIConfig", verbose: bool) -> Any:
     """
     Handle the --verbose / -v flag.
 
     Override verbosity if CLI flag provided
     """
+    from nutrimatic.core.logger import setup_logging  # noqa: PLC0415
+
     if verbose:
-        cfg = replace(cfg, verbose=True)
+        cfg = cfg.model_copy(update={"verbose": True})
     logger = setup_logging(cfg)
 
     logger.debug("Verbose mode enabled.")
     logger.debug(f"Loaded configuration: {cfg}")
 
     return {"cfg": cfg, "logger": logger}
+
+
+def init_context(verbose: bool) -> Any:
+    """
+    Load the config (creating it if missing) and the logger for a command
+    group callback, returning the shared ``ctx.obj``.
+    """
+    from nutrimatic.core.config import ensure_config  # noqa: PLC0415
+
+    return verbose_mode(ensure_config(), verbose)
@@ -10,13 +10,21 @@ Description: Command-line interface for Cookiecutter template utilities.
 
 import typer
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.models import CLIConfig
+from .lazy import LazySpec, lazy_group
+from .options import init_context
 
-from .commands.nmtemplates import generate
-from .options import verbose_mode
+COMMANDS = {
+    "generate": LazySpec(
+        "nutrimatic.cli.commands.nmtemplates.generate:generate",
+        "Generate README.md and Makefile for a nm-template project.",
+    ),
+    "sync": LazySpec(
+        "nutrimatic.cli.commands.nmtemplates.sync:sync",
+        "Fetch templates and store versioned checkouts under the cache directory.",
+    ),
+}
 
-app = typer.Typer(help="nm-templates tools.")
+app = typer.Typer(help="nm-templates tools.", cls=lazy_group(COMMANDS))
 
 
 @app.callback(invoke_without_command=True)
@@ -30,19 +38,14 @@ def main(
     Main CLI entrypoint for nutri-matic templates:
     Initialize configuration and logging for all subcommands.
     """
-    # Ensure config exists and load it
-    cfg: CLIConfig = ensure_config()
-
-    # Attach shared objects to context
-    ctx.obj = verbose_mode(cfg, verbose)
+    # Load config and logger, attaching shared objects to context
+    ctx.obj = init_context(verbose)
 
 
 # -----------------------------
 # Register commands
 # -----------------------------
-# nm-templates commands:
-# -----------------------------
-app.command()(generate)
+# nm-templates commands: (COMMANDS, loaded on first use)
 # -----------------------------
 
 
@@ -9,21 +9,40 @@ Description: Core Imports.
 """
 
 from .bash import (
+    add_make_targets,
     clean,
     make,
+    make_targets,
+    stream_command,
     tree,
 )
+from .cache import DiskCache
+from .client import GitHubClient, get_client
 from .config import ensure_config
-from .github import fetch_namespace
+from .github import fetch_namespace, iter_namespace
+from .index import TemplateIndex
 from .logger import setup_logging
+from .pipeline import Pipeline
 from .utils import make_dirs
+from .walk import WalkEntry, walk_files
 
 __all__ = [
+    "DiskCache",
+    "GitHubClient",
+    "Pipeline",
+    "TemplateIndex",
+    "WalkEntry",
+    "add_make_targets",
     "clean",
     "ensure_config",
     "fetch_namespace",
+    "get_client",
+    "iter_namespace",
     "make",
     "make_dirs",
+    "make_targets",
     "setup_logging",
+    "stream_command",
     "tree",
+    "walk_files",
 ]
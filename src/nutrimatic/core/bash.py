@@ -8,17 +8,27 @@ Author: Jared Cook
 Description: Bash commands ported to python.
 """
 
+import logging
 import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from functools import partial
 from pathlib import Path
+from typing import IO
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.pipeline import Pipeline
+from nutrimatic.models import CommandResult, PipelineReport
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
+
+TAIL_LINES = 50
+MAX_LINE_BYTES = 64 * 1024  # longer lines are logged in pieces
 
 
 def clean() -> None:
@@ -32,27 +42,135 @@ def clean() -> None:
         logger.info("_shared_hooks directory does not exist, nothing to remove.")
 
 
-def make(cmd: str, *, verbose: bool = False) -> None:
-    """Run a make target inside post-gen, exiting on failure."""
+def stream_command(
+    args: Sequence[str],
+    *,
+    cwd: Path | None = None,
+    prefix: str = "",
+    level: int = logging.INFO,
+    tail: int = TAIL_LINES,
+) -> CommandResult:
+    """
+    Run ``args``, forwarding stdout and stderr to the logger line by line
+    as they arrive.
+
+    Each pipe is drained by its own reader thread (``select`` only works on
+    sockets on Windows), so neither can fill up and stall the process, and
+    only the current line and the last ``tail`` lines (kept for error
+    reports) are held in memory.
+    """
+    lines: deque[str] = deque(maxlen=tail)
+    lock = threading.Lock()
+
+    def emit(raw: bytes) -> None:
+        line = raw.decode("utf-8", errors="replace").rstrip()
+        with lock:
+            lines.append(line)
+            logger.log(level, f"{prefix}{line}")
+
+    def pump(pipe: IO[bytes]) -> None:
+        cut = False  # the previous piece was a long line cut at MAX_LINE_BYTES
+        with pipe:
+            for raw in iter(partial(pipe.readline, MAX_LINE_BYTES), b""):
+                if not (cut and raw == b"\n"):
+                    emit(raw)
+                cut = not raw.endswith(b"\n")
+
+    start = time.perf_counter()
+    with subprocess.Popen(
+        list(args), cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as proc:
+        if proc.stdout is None or proc.stderr is None:
+            raise RuntimeError(f"Could not capture the output of {args[0]}")
+        readers = [
+            threading.Thread(target=pump, args=(pipe,), daemon=True)
+            for pipe in (proc.stdout, proc.stderr)
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        returncode = proc.wait()
+
+    return CommandResult(
+        args=list(args),
+        returncode=returncode,
+        seconds=time.perf_counter() - start,
+        tail=list(lines),
+    )
+
+
+def make(cmd: str, *, verbose: bool = False, cwd: Path | None = None) -> None:
+    """
+    Run a make target inside post-gen (in ``cwd``), exiting on failure.
+    Output is streamed to the logger as it is produced (at INFO level when
+    ``verbose``, DEBUG otherwise); on failure its tail is logged as an error.
+    """
     logger.info(f"▶ Running: make {cmd}")
-    try:
-        result = subprocess.run(
-            ["make", cmd],
-            check=True,
-            capture_output=True,
-            text=True,
+    result = stream_command(
+        ["make", cmd],
+        cwd=cwd,
+        prefix=f"[{cmd}] ",
+        level=logging.INFO if verbose else logging.DEBUG,
+    )
+    if not result.ok:
+        logger.error(f"❌ Command failed: make {cmd} (exit {result.returncode})")
+        if result.tail:
+            logger.error("Last output:\n" + "\n".join(result.tail))
+        sys.exit(result.returncode)
+    logger.info(f"✅ Command succeeded: make {cmd} ({result.seconds:.2f}s)")
+
+
+def add_make_targets(  # noqa: PLR0913
+    pipeline: Pipeline,
+    targets: Sequence[str],
+    *,
+    deps: Mapping[str, Iterable[str]] | None = None,
+    after: Iterable[str] = (),
+    verbose: bool = False,
+    cwd: Path | None = None,
+) -> Pipeline:
+    """
+    Add one ``make <target>`` stage per target to ``pipeline``.
+
+    Each stage runs after the ``after`` stages and after the targets it
+    depends on in ``deps`` (dependencies outside ``targets`` are ignored),
+    so independent targets run concurrently.
+    """
+    deps = deps or {}
+    after = list(after)
+    for target in targets:
+        needs = [f"make {dep}" for dep in deps.get(target, ()) if dep in targets]
+        pipeline.add(
+            f"make {target}",
+            partial(make, target, verbose=verbose, cwd=cwd),
+            after=after + needs,
+        )
+    return pipeline
+
+
+def make_targets(
+    targets: Sequence[str],
+    *,
+    deps: Mapping[str, Iterable[str]] | None = None,
+    verbose: bool = False,
+    cwd: Path | None = None,
+    max_workers: int | None = None,
+) -> PipelineReport:
+    """
+    Run make targets, concurrently where ``deps`` allows, and return the
+    per-target timings.  Raises SystemExit if a target fails.
+
+    Example::
+
+        make_targets(
+            ["install", "git-init", "pre-commit-init"],
+            deps={"pre-commit-init": ["install", "git-init"]},
         )
-        if verbose and result.stdout:
-            logger.info(result.stdout.rstrip())
-        logger.info(f"✅ Command succeeded: make {cmd}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"❌ Command failed: make {cmd}")
-        # Optionally log stdout/stderr captured from the failed command
-        if e.stdout:
-            logger.error(f"STDOUT: {e.stdout}")
-        if e.stderr:
-            logger.error(f"STDERR: {e.stderr}")
-        sys.exit(e.returncode)
+    """
+    pipeline = Pipeline(max_workers)
+    add_make_targets(pipeline, targets, deps=deps, verbose=verbose, cwd=cwd)
+    return pipeline.run()
 
 
 def tree() -> None:
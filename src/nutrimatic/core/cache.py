@@ -0,0 +1,192 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Persistent on-disk cache stored under CLIConfig.cache_dir.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.models import CacheEntry, CacheStats, CLIConfig
+
+logger = lazy_logger()  # configured on first use
+
+
+class DiskCache:
+    """
+    JSON file cache with a TTL and size-bounded, least-recently-used eviction.
+
+    Each key is stored in its own file named after the key's SHA-256 digest.
+    Reads refresh the file's mtime, so eviction removes the entries that were
+    used least recently once the directory grows past ``max_bytes``.
+
+    When ``refresh`` is set, reads always miss but writes still go through,
+    which re-populates the cache from the network.
+
+    Entries may carry ``ETag``/``Last-Modified`` validators; stale entries are
+    still available through :meth:`get_stale` so callers can revalidate them
+    with a conditional request.  Hits, revalidations and downloads are
+    counted in ``stats``.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        ttl: float,
+        max_bytes: int,
+        refresh: bool = False,
+    ) -> None:
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    @classmethod
+    def from_config(
+        cls, cli_cfg: CLIConfig, name: str, refresh: bool = False
+    ) -> "DiskCache":
+        """Create the cache ``name`` inside ``CLIConfig.cache_dir``."""
+        return cls(
+            cli_cfg.cache_dir / name,
+            cli_cfg.cache_ttl,
+            cli_cfg.cache_max_bytes,
+            refresh,
+        )
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.root / f"{digest}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the fresh entry stored for ``key``, or None on a miss."""
+        if self.refresh:
+            return None
+
+        entry = self.get_stale(key)
+        if entry is None or not entry.is_fresh(self.ttl):
+            return None
+
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += entry.size
+        logger.debug(f"Cache hit: {key}")
+        return entry
+
+    def get_stale(self, key: str) -> CacheEntry | None:
+        """Return the entry stored for ``key`` regardless of its age."""
+        try:
+            entry = CacheEntry.model_validate_json(self._path(key).read_bytes())
+        except (OSError, ValidationError):
+            return None
+        return entry if entry.key == key else None
+
+    def revalidate(self, entry: CacheEntry) -> CacheEntry:
+        """Mark a stale entry as confirmed unchanged (``304 Not Modified``)."""
+        with self._lock:
+            self.stats.revalidations += 1
+            self.stats.bytes_saved += entry.size
+        logger.debug(f"Cache revalidated: {entry.key}")
+        return self._write(entry.model_copy(update={"stored_at": time.time()}))
+
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        value: Any,
+        *,
+        url: str | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        size: int = 0,
+    ) -> CacheEntry:
+        """
+        Store ``value`` under ``key``, evicting old entries if needed.
+
+        ``size`` is the number of bytes downloaded to produce ``value``;
+        a non-zero size is counted as a full download.
+        """
+        if size:
+            with self._lock:
+                self.stats.downloads += 1
+                self.stats.bytes_downloaded += size
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            size=size,
+        )
+        return self._write(entry)
+
+    def _write(self, entry: CacheEntry) -> CacheEntry:
+        data = entry.model_dump_json().encode("utf-8")
+        path = self._path(entry.key)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            size = self._current_size()
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_name, path)
+            self._size = size + len(data) - old_size
+            if self.max_bytes and self._size > self.max_bytes:
+                self._evict()
+
+        return entry
+
+    def clear(self) -> None:
+        """Remove every entry of this cache."""
+        with self._lock:
+            for path in self.root.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return (mtime, size, path) of every entry, oldest first."""
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return sorted(entries, key=lambda item: item[0])
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(item[1] for item in self._entries())
+        return self._size
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under ``max_bytes``."""
+        entries = self._entries()
+        size = sum(item[1] for item in entries)
+        for _mtime, file_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= file_size
+            logger.debug(f"Cache evicted: {path.name}")
+        self._size = size
@@ -0,0 +1,173 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Shared HTTP client for GitHub with connection pooling, retries
+and rate-limit awareness.
+"""
+
+import threading
+import time
+from functools import cache
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+
+logger = lazy_logger()  # configured on first use
+
+GITHUB_HOSTS = frozenset({"api.github.com", "github.com", "raw.githubusercontent.com"})
+USER_AGENT = "nutri-matic"
+
+
+class GitHubTokenAuth(AuthBase):
+    """Attach a GitHub token, but only to requests for GitHub hosts."""
+
+    def __init__(self, token: str, hosts: frozenset[str] = GITHUB_HOSTS) -> None:
+        self.token = token
+        self.hosts = hosts
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        if urlparse(r.url).hostname in self.hosts:
+            r.headers["Authorization"] = f"Bearer {self.token}"
+        return r
+
+
+class GitHubClient:
+    """
+    Pooled, keep-alive HTTP session for talking to GitHub.
+
+    - Connections are pooled per host (``pool_size`` kept alive), so
+      concurrent fetches reuse TLS connections instead of opening new ones.
+    - Every request has a timeout.
+    - Connection errors and 5xx responses are retried with exponential backoff.
+    - ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` are tracked; once the
+      quota is exhausted, requests wait for the reset (up to
+      ``max_rate_limit_wait`` seconds) instead of failing.
+    - ``token`` is sent as a bearer token to GitHub hosts, which raises the
+      API quota.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str | None = None,
+        *,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        pool_size: int = 8,
+        max_rate_limit_wait: float = 60.0,
+    ) -> None:
+        self.timeout = timeout
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.rate_limit_remaining: int | None = None
+        self.rate_limit_reset: float | None = None
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Accept": "application/vnd.github+json", "User-Agent": USER_AGENT}
+        )
+        if token:
+            self.session.auth = GitHubTokenAuth(token)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET ``url`` through the pooled session."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST to ``url`` through the pooled session."""
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, waiting out an exhausted rate limit first."""
+        kwargs.setdefault("timeout", self.timeout)
+
+        self._wait_for_rate_limit()
+        resp = self.session.request(method, url, **kwargs)
+        self._update_rate_limit(resp)
+
+        if self._is_rate_limited(resp) and self._wait_for_rate_limit():
+            resp = self.session.request(method, url, **kwargs)
+            self._update_rate_limit(resp)
+
+        return resp
+
+    def _update_rate_limit(self, resp: requests.Response) -> None:
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        retry_after = resp.headers.get("Retry-After")
+        with self._lock:
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            if reset is not None:
+                self.rate_limit_reset = float(reset)
+            if retry_after is not None and self._is_rate_limited(resp):
+                self.rate_limit_remaining = 0
+                self.rate_limit_reset = time.time() + float(retry_after)
+
+    @staticmethod
+    def _is_rate_limited(resp: requests.Response) -> bool:
+        return resp.status_code in (403, 429) and (
+            resp.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in resp.headers
+        )
+
+    def _wait_for_rate_limit(self) -> bool:
+        """
+        Sleep until the rate limit resets if the quota is exhausted.
+
+        Returns True if it waited.  Waits longer than ``max_rate_limit_wait``
+        are skipped, letting the request fail with GitHub's error instead.
+        """
+        with self._lock:
+            if self.rate_limit_remaining != 0 or self.rate_limit_reset is None:
+                return False
+            delay = self.rate_limit_reset - time.time()
+            if delay > self.max_rate_limit_wait:
+                logger.warning(
+                    f"GitHub rate limit exhausted; resets in {delay:.0f}s. "
+                    "Configure github.auth.token to raise the quota."
+                )
+                return False
+            if delay > 0:
+                logger.info(f"⏳ GitHub rate limit reached, waiting {delay:.1f}s...")
+                time.sleep(delay)
+            self.rate_limit_remaining = None
+            return True
+
+
+@cache
+def get_client() -> GitHubClient:
+    """Return the shared GitHubClient configured from CLIConfig."""
+    cli_cfg = ensure_config()
+    token = cli_cfg.github.auth.token if cli_cfg.github else None
+    return GitHubClient(
+        token=token,
+        timeout=cli_cfg.http_timeout,
+        retries=cli_cfg.http_retries,
+        pool_size=cli_cfg.max_workers,
+    )
@@ -9,20 +9,21 @@ Description: Configuration initialization
 """
 
 import json
-from functools import cache
+from functools import cache, partial
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import ValidationError
 
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import bootstrap_logger, lazy_logger
 from nutrimatic.models import DEFAULT_CONFIG, CLIConfig
 
 CONFIG_EXT = ".yml"
 CONFIG_PATH = Path.home() / ".config" / "nutri-matic" / f"config{CONFIG_EXT}"
 
-logger = setup_logging(DEFAULT_CONFIG)
+# Bootstrap logger for loading the config itself (get_logger needs the config).
+logger = lazy_logger(partial(bootstrap_logger, DEFAULT_CONFIG))
 
 
 def _read_config(path: Path) -> dict[str, Any]:
@@ -9,69 +9,364 @@ Description: Github API Core
 """
 
 import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import requests
 
-from nutrimatic.models import ConfigData, GitHubRepo, Namespace, TemplateRepo
+from nutrimatic.core.cache import DiskCache
+from nutrimatic.core.client import get_client
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.models import (
+    CacheEntry,
+    ConfigData,
+    GitHubRepo,
+    Namespace,
+    TemplateRepo,
+)
 
+logger = lazy_logger()  # configured on first use
 
-def fetch_config(repo_url: str) -> ConfigData | None:
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_PER_PAGE = 100
+DEFAULT_BRANCHES = ["main", "master"]
+
+# One query returns a page of repos together with each repo's config.json
+# blob from its default branch, replacing a request per repo.
+GRAPHQL_NAMESPACE_QUERY = """
+query($login: String!, $first: Int!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(
+      first: $first
+      after: $cursor
+      ownerAffiliations: OWNER
+      orderBy: {field: NAME, direction: ASC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        description
+        url
+        sshUrl
+        isTemplate
+        owner { login }
+        defaultBranchRef { name }
+        primaryLanguage { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        pushedAt
+        config: object(expression: "HEAD:config.json") {
+          ... on Blob { text }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _parse_config(text: str) -> ConfigData | None:
+    """Parse the text of a config.json into ConfigData."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return ConfigData(
+        project_name=data.get("project_name", ""),
+        author=data.get("author", ""),
+        version=data.get("version", ""),
+        description=data.get("description", ""),
+        variables=data,
+    )
+
+
+def _cached_config(entry: CacheEntry) -> ConfigData | None:
+    return ConfigData.model_validate(entry.value) if entry.value else None
+
+
+def fetch_config(
+    repo_url: str,
+    cache: DiskCache | None = None,
+    branch: str | None = None,
+) -> ConfigData | None:
     """
-    Fetch cookiecutter.json from a GitHub repo,
-    trying both main and master branches.
+    Fetch cookiecutter.json from a GitHub repo.
+
+    Only ``branch`` is tried when it is known (e.g. the ``default_branch``
+    of the repo listing), otherwise both main and master branches are tried.
+
+    When a ``cache`` is given, results are served from and stored in it,
+    keyed by repo URL.  Stale entries are revalidated with their
+    ``ETag``/``Last-Modified`` validators, so an unchanged config only costs
+    a ``304 Not Modified``.  A repo is only cached as having no config when
+    every branch answered ``404``; any other status (a 5xx left after
+    retries, a 403 rate limit, ...) raises ``requests.HTTPError`` and is not
+    cached.
     """
-    branches = ["main", "master"]
+    key = f"config:{repo_url}"
+    if cache and (entry := cache.get(key)):
+        return _cached_config(entry)
+
+    stale = cache.get_stale(key) if cache else None
+    branches = [branch] if branch else DEFAULT_BRANCHES
+    urls = [f"{repo_url}/raw/{name}/config.json" for name in branches]
+    if stale and stale.url in urls:
+        # Revalidate where the config was found last time before anything else.
+        urls.remove(stale.url)
+        urls.insert(0, stale.url)
+
+    for raw_url in urls:
+        headers = stale.validators() if stale and stale.url == raw_url else {}
+        resp = get_client().get(raw_url, headers=headers)
 
-    for branch in branches:
-        raw_url = f"{repo_url}/raw/{branch}/config.json"
-        resp = requests.get(raw_url)
+        if resp.status_code == 304 and cache and stale:
+            return _cached_config(cache.revalidate(stale))
 
         if resp.status_code == 200:
-            try:
-                data = json.loads(resp.text)
-                return ConfigData(
-                    project_name=data.get("project_name", ""),
-                    author=data.get("author", ""),
-                    version=data.get("version", ""),
-                    description=data.get("description", ""),
-                    variables=data,
+            config = _parse_config(resp.text)
+            if cache:
+                cache.set(
+                    key,
+                    config.model_dump(mode="json") if config else None,
+                    url=raw_url,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                    size=len(resp.content),
                 )
-            except json.JSONDecodeError:
-                return None
+            return config
 
+        if resp.status_code != 404:
+            raise requests.HTTPError(
+                f"{resp.status_code} {resp.reason} for url: {raw_url}", response=resp
+            )
+
+    if cache:
+        cache.set(key, None)
     return None
 
 
-def fetch_namespace(namespace: str) -> Namespace:
-    """Fetch all repositories in a namespace and their configs."""
-    url = f"https://api.github.com/users/{namespace}/repos"
-    resp = requests.get(url)
-    resp.raise_for_status()
-    repos = resp.json()
-
-    templates = []
-    for repo in repos:
-        repo_url = repo["html_url"]
-        config = fetch_config(repo_url)
-        owner = repo["owner"]["login"] if "owner" in repo else namespace
-
-        if config:
-            templates.append(
-                TemplateRepo(
-                    repo=GitHubRepo(
-                        owner=owner,
-                        namespace=owner,
-                        name=repo.get("name", ""),
-                        full_name=repo.get("full_name", ""),
-                        description=repo.get("description", ""),
-                        url=repo.get("url", ""),
-                        html_url=repo_url,
-                        ssh_url=repo.get("ssh_url", ""),
-                        clone_url=repo.get("clone_url", ""),
-                        is_template=repo.get("is_template", ""),
-                    ),
-                    config=config,
-                )
+def github_repo(repo: dict[str, Any], namespace: str) -> GitHubRepo:
+    """Build a GitHubRepo from an entry of the REST repository listing."""
+    owner = repo["owner"]["login"] if "owner" in repo else namespace
+    return GitHubRepo(
+        owner=owner,
+        namespace=owner,
+        name=repo.get("name", ""),
+        full_name=repo.get("full_name", ""),
+        description=repo.get("description") or "",
+        url=repo.get("url", ""),
+        html_url=repo["html_url"],
+        ssh_url=repo.get("ssh_url", ""),
+        clone_url=repo.get("clone_url", ""),
+        is_template=repo.get("is_template", False),
+        default_branch=repo.get("default_branch") or "main",
+        language=repo.get("language") or "",
+        topics=repo.get("topics") or [],
+        pushed_at=repo.get("pushed_at") or "",
+    )
+
+
+def fetch_template(
+    repo: dict[str, Any],
+    namespace: str,
+    cache: DiskCache | None = None,
+) -> TemplateRepo | None:
+    """
+    Fetch the config of a single repo listing entry, if it is a template.
+    Raises ``requests.RequestException`` if the config could not be fetched.
+    """
+    config = fetch_config(repo["html_url"], cache, repo.get("default_branch"))
+    if not config:
+        return None
+    return TemplateRepo(repo=github_repo(repo, namespace), config=config)
+
+
+def fetch_template_or_skip(
+    repo: dict[str, Any],
+    namespace: str,
+    cache: DiskCache | None = None,
+) -> TemplateRepo | None:
+    """:func:`fetch_template`, logging and skipping repos that fail."""
+    try:
+        return fetch_template(repo, namespace, cache)
+    except requests.RequestException as e:
+        logger.warning(f"⚠️  Skipping {repo.get('full_name', repo['html_url'])}: {e}")
+        return None
+
+
+def _graphql_template(node: dict[str, Any], api_url: str) -> TemplateRepo | None:
+    """Build a TemplateRepo from a repository node of the GraphQL query."""
+    blob = node.get("config") or {}
+    config = _parse_config(blob["text"]) if blob.get("text") else None
+    if not config:
+        return None
+
+    owner = node["owner"]["login"]
+    return TemplateRepo(
+        repo=GitHubRepo(
+            owner=owner,
+            namespace=owner,
+            name=node["name"],
+            full_name=node["nameWithOwner"],
+            description=node.get("description") or "",
+            url=f"{api_url}/repos/{node['nameWithOwner']}",
+            html_url=node["url"],
+            ssh_url=node.get("sshUrl", ""),
+            clone_url=f"{node['url']}.git",
+            is_template=node.get("isTemplate", False),
+            default_branch=(node.get("defaultBranchRef") or {}).get("name", "main"),
+            language=(node.get("primaryLanguage") or {}).get("name", ""),
+            topics=[
+                t["topic"]["name"]
+                for t in (node.get("repositoryTopics") or {}).get("nodes", [])
+            ],
+            pushed_at=node.get("pushedAt") or "",
+        ),
+        config=config,
+    )
+
+
+def iter_namespace_graphql(
+    namespace: str,
+    api_url: str = GITHUB_API_URL,
+    cache: DiskCache | None = None,
+) -> Iterator[TemplateRepo]:
+    """
+    Lazily yield the template repositories of a namespace using GraphQL.
+
+    Each query returns up to 100 repos with their config.json inlined, so a
+    namespace costs one request per 100 repos instead of one per repo.
+    GitHub only serves GraphQL to authenticated clients, so
+    ``github.auth.token`` must be configured.
+    """
+    cursor: str | None = None
+    while True:
+        key = f"graphql:{api_url}/{namespace}:{cursor}"
+        page: dict[str, Any]
+        if cache and (entry := cache.get(key)):
+            page = entry.value
+        else:
+            resp = get_client().post(
+                f"{api_url}/graphql",
+                json={
+                    "query": GRAPHQL_NAMESPACE_QUERY,
+                    "variables": {
+                        "login": namespace,
+                        "first": GITHUB_PER_PAGE,
+                        "cursor": cursor,
+                    },
+                },
             )
+            resp.raise_for_status()
+            payload = resp.json()
+            if payload.get("errors"):
+                messages = "; ".join(e.get("message", "") for e in payload["errors"])
+                raise RuntimeError(f"GitHub GraphQL query failed: {messages}")
 
-    return Namespace(templates=templates)
+            owner = (payload.get("data") or {}).get("repositoryOwner")
+            if owner is None:
+                return
+            repos = owner["repositories"]
+            templates = (_graphql_template(n, api_url) for n in repos["nodes"])
+            page_info = repos["pageInfo"]
+            page = {
+                "templates": [t.model_dump(mode="json") for t in templates if t],
+                "next": page_info["endCursor"] if page_info["hasNextPage"] else None,
+            }
+            if cache:
+                cache.set(key, page, size=len(resp.content))
+
+        yield from (TemplateRepo.model_validate(t) for t in page["templates"])
+        if not page["next"]:
+            return
+        cursor = page["next"]
+
+
+def iter_repo_pages(
+    namespace: str,
+    api_url: str = GITHUB_API_URL,
+    cache: DiskCache | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Yield the repository listing of a namespace one page at a time,
+    following the ``Link: rel="next"`` headers returned by GitHub.
+
+    When a ``cache`` is given, each page is served from and stored in it,
+    keyed by the page URL (which includes the namespace), and stale pages
+    are revalidated with a conditional request.
+    """
+    url: str | None = f"{api_url}/users/{namespace}/repos?per_page={GITHUB_PER_PAGE}"
+    while url:
+        key = f"repos:{url}"
+        page: dict[str, Any]
+        if cache and (entry := cache.get(key)):
+            page = entry.value
+        else:
+            stale = cache.get_stale(key) if cache else None
+            resp = get_client().get(url, headers=stale.validators() if stale else {})
+            if resp.status_code == 304 and cache and stale:
+                page = cache.revalidate(stale).value
+            else:
+                resp.raise_for_status()
+                page = {
+                    "repos": resp.json(),
+                    "next": resp.links.get("next", {}).get("url"),
+                }
+                if cache:
+                    cache.set(
+                        key,
+                        page,
+                        url=url,
+                        etag=resp.headers.get("ETag"),
+                        last_modified=resp.headers.get("Last-Modified"),
+                        size=len(resp.content),
+                    )
+        yield page["repos"]
+        url = page["next"]
+
+
+def iter_namespace(
+    namespace: str,
+    max_workers: int | None = None,
+    api_url: str = GITHUB_API_URL,
+    cache: DiskCache | None = None,
+    graphql: bool = False,
+) -> Iterator[TemplateRepo]:
+    """
+    Lazily yield the template repositories of a namespace.
+
+    Pages are requested only as they are consumed, and the configs of each
+    page are fetched concurrently on a bounded thread pool
+    (``CLIConfig.max_workers`` unless overridden).  Templates are yielded as
+    soon as they resolve, in the same order as the GitHub repository listing.
+    Listing pages and configs go through ``cache`` when one is given.
+
+    With ``graphql`` the listing and configs are batched into one GraphQL
+    query per page instead (see :func:`iter_namespace_graphql`).
+    """
+    if graphql:
+        yield from iter_namespace_graphql(namespace, api_url, cache)
+        return
+
+    workers = max_workers or ensure_config().max_workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for page in iter_repo_pages(namespace, api_url, cache):
+            results = executor.map(
+                lambda repo: fetch_template_or_skip(repo, namespace, cache), page
+            )
+            yield from (template for template in results if template)
+
+
+def fetch_namespace(
+    namespace: str,
+    max_workers: int | None = None,
+    api_url: str = GITHUB_API_URL,
+    cache: DiskCache | None = None,
+    graphql: bool = False,
+) -> Namespace:
+    """Fetch all repositories in a namespace and their configs."""
+    return Namespace(
+        templates=list(iter_namespace(namespace, max_workers, api_url, cache, graphql))
+    )
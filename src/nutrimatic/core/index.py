@@ -0,0 +1,299 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Persistent local template index (SQLite) with fast search.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import requests
+from pydantic import ValidationError
+
+from nutrimatic.ccmeta import find_templates, load_teabag
+from nutrimatic.core.cache import DiskCache
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.github import (
+    GITHUB_API_URL,
+    fetch_template,
+    github_repo,
+    iter_namespace_graphql,
+    iter_repo_pages,
+)
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.models import CCMeta, CLIConfig, IndexEntry, TemplateRepo
+
+logger = lazy_logger()  # configured on first use
+
+INDEX_FILE = "index.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    language TEXT NOT NULL COLLATE NOCASE,
+    pushed_at TEXT NOT NULL,
+    is_template INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace, is_template);
+CREATE INDEX IF NOT EXISTS entries_language ON entries (language, is_template);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL COLLATE NOCASE,
+    key TEXT NOT NULL REFERENCES entries (key) ON DELETE CASCADE,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+"""
+
+
+class TemplateIndex:
+    """
+    Local SQLite index of GitHub template repos and ccmeta templates.
+
+    Each record is stored as an :class:`IndexEntry` JSON document alongside
+    indexed ``namespace``/``language``/``tag`` columns, so searches never
+    touch the network.  GitHub repos without a config are kept as
+    non-template rows, so an incremental refresh does not re-check them
+    until they are pushed to again.  GitHub namespaces are stored and
+    matched lowercase.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, cli_cfg: CLIConfig) -> "TemplateIndex":
+        """Open the index stored inside ``CLIConfig.cache_dir``."""
+        return cls(cli_cfg.cache_dir / INDEX_FILE)
+
+    def __enter__(self) -> "TemplateIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+    def upsert(self, entry: IndexEntry, is_template: bool = True) -> None:
+        """Insert or replace an entry and its tags."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.key,
+                entry.source,
+                entry.namespace,
+                entry.name,
+                entry.description,
+                entry.language,
+                entry.pushed_at,
+                int(is_template),
+                entry.model_dump_json(),
+            ),
+        )
+        self.conn.execute("DELETE FROM tags WHERE key = ?", (entry.key,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tags VALUES (?, ?)",
+            [(tag, entry.key) for tag in entry.tags],
+        )
+
+    def refresh_namespace(  # noqa: PLR0913
+        self,
+        namespace: str,
+        *,
+        api_url: str = GITHUB_API_URL,
+        cache: DiskCache | None = None,
+        max_workers: int | None = None,
+        graphql: bool = False,
+        full: bool = False,
+    ) -> Iterator[TemplateRepo]:
+        """
+        Incrementally re-index a GitHub namespace, yielding its templates.
+
+        The repository listing is always read, but a repo's config is only
+        fetched again when its ``pushed_at`` differs from the indexed one
+        (with ``full``, every config is fetched again).  A repo whose config
+        could not be fetched keeps its previous record, so it is retried on
+        the next refresh.  Repos that disappeared from the listing are
+        removed once the listing has been fully consumed.  With ``graphql``
+        every config arrives inline with the listing, so all records are
+        simply replaced.
+        """
+        if graphql:
+            yield from self._refresh_graphql(namespace, api_url, cache)
+            return
+
+        known: dict[str, str] = {}
+        if not full:
+            known = dict(
+                self.conn.execute(
+                    "SELECT key, pushed_at FROM entries "
+                    "WHERE source = 'github' AND namespace = ? AND pushed_at != ''",
+                    (namespace.lower(),),
+                ).fetchall()
+            )
+        seen: set[str] = set()
+        workers = max_workers or ensure_config().max_workers
+
+        def fetch(repo: dict[str, Any]) -> tuple[bool, TemplateRepo | None]:
+            try:
+                return True, fetch_template(repo, namespace, cache)
+            except requests.RequestException as e:
+                logger.warning(f"⚠️  Could not fetch {repo['full_name']}: {e}")
+                return False, None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for page in iter_repo_pages(namespace, api_url, cache):
+                changed = [
+                    repo
+                    for repo in page
+                    if not repo.get("pushed_at")
+                    or known.get(repo["full_name"]) != repo["pushed_at"]
+                ]
+                fetched = dict(
+                    zip(
+                        (repo["full_name"] for repo in changed),
+                        executor.map(fetch, changed),
+                        strict=True,
+                    )
+                )
+                for repo in page:
+                    full_name = repo["full_name"]
+                    seen.add(full_name)
+                    ok, template = fetched.get(full_name, (False, None))
+                    if ok:
+                        template = self._store_repo(repo, namespace, template)
+                    else:
+                        template = self._indexed_template(full_name)
+                    if template:
+                        yield template
+                self.conn.commit()
+
+        self._prune(namespace, seen)
+
+    def _refresh_graphql(
+        self, namespace: str, api_url: str, cache: DiskCache | None
+    ) -> Iterator[TemplateRepo]:
+        seen: set[str] = set()
+        for template in iter_namespace_graphql(namespace, api_url, cache):
+            self.upsert(IndexEntry.from_template(template))
+            seen.add(template.repo.full_name)
+            yield template
+        # GraphQL only returns templates, so drop every other row as well.
+        self._prune(namespace, seen)
+
+    def _store_repo(
+        self, repo: dict[str, Any], namespace: str, template: TemplateRepo | None
+    ) -> TemplateRepo | None:
+        if template:
+            self.upsert(IndexEntry.from_template(template))
+        else:
+            plain = TemplateRepo(repo=github_repo(repo, namespace))
+            self.upsert(IndexEntry.from_template(plain), is_template=False)
+        return template
+
+    def _indexed_template(self, key: str) -> TemplateRepo | None:
+        row = self.conn.execute(
+            "SELECT record FROM entries WHERE key = ? AND is_template = 1", (key,)
+        ).fetchone()
+        return IndexEntry.model_validate_json(row[0]).template if row else None
+
+    def _prune(self, namespace: str, keep: set[str]) -> None:
+        rows = self.conn.execute(
+            "SELECT key FROM entries WHERE source = 'github' AND namespace = ?",
+            (namespace.lower(),),
+        ).fetchall()
+        stale = [(key,) for (key,) in rows if key not in keep]
+        self.conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+        self.conn.commit()
+
+    def add_ccmeta(self, base_dir: Path) -> int:
+        """
+        Index every ccmeta template (``teabag.toml``) found under ``base_dir``.
+        Returns the number of templates indexed.
+        """
+        count = 0
+        for template_dir in find_templates(base_dir):
+            try:
+                meta = CCMeta.model_validate(load_teabag(template_dir / "teabag.toml"))
+            except (ValidationError, ValueError) as e:
+                logger.warning(f"Skipping invalid ccmeta template {template_dir}: {e}")
+                continue
+            self.upsert(IndexEntry.from_ccmeta(template_dir, base_dir, meta))
+            count += 1
+        self.conn.commit()
+        return count
+
+    # -----------------------------
+    # Querying
+    # -----------------------------
+    def has_namespace(self, namespace: str) -> bool:
+        """Return True if the namespace has been indexed before."""
+        row = self.conn.execute(
+            "SELECT 1 FROM entries WHERE namespace IN (?, ?) LIMIT 1",
+            (namespace, namespace.lower()),
+        ).fetchone()
+        return row is not None
+
+    def search(
+        self,
+        text: str | None = None,
+        tag: str | None = None,
+        language: str | None = None,
+        namespaces: list[str] | None = None,
+    ) -> list[IndexEntry]:
+        """
+        Return indexed templates matching every given filter.
+
+        ``text`` is a case-insensitive substring match on name and description;
+        ``tag`` and ``language`` are case-insensitive exact matches, and
+        ``namespaces`` limits results to GitHub namespaces (case-insensitive)
+        or ccmeta directories.
+        """
+        query = "SELECT e.record FROM entries e"
+        clauses = ["e.is_template = 1"]
+        params: list[str] = []
+        if tag:
+            query += " JOIN tags t ON t.key = e.key AND t.tag = ?"
+            params.append(tag)
+        if namespaces:
+            names = sorted({*namespaces, *(n.lower() for n in namespaces)})
+            clauses.append(f"e.namespace IN ({', '.join('?' * len(names))})")
+            params.extend(names)
+        if language:
+            clauses.append("e.language = ?")
+            params.append(language)
+        if text:
+            clauses.append("(e.name LIKE ? OR e.description LIKE ?)")
+            params.extend([f"%{text}%"] * 2)
+        query += " WHERE " + " AND ".join(clauses) + " ORDER BY e.name"
+
+        return [
+            IndexEntry.model_validate_json(record)
+            for (record,) in self.conn.execute(query, params)
+        ]
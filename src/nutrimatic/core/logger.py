@@ -10,14 +10,20 @@ Description: Project logger.
 
 import logging
 import sys
+from collections.abc import Callable
 from functools import cache
 from pathlib import Path
-from typing import TextIO
+from typing import Any, TextIO, cast
 
 import typer
 
 from nutrimatic.models import CLIConfig
 
+LOGGER_NAME = "nutri-matic"
+
+# Loggers set up from a loaded config; lazy loggers use them as they are.
+_configured: set[str] = set()
+
 
 @cache
 class TyperHandler(logging.Handler):
@@ -73,18 +79,70 @@ def _file_handler(cfg: CLIConfig) -> logging.FileHandler:
     return file_handler
 
 
-def setup_logging(cfg: CLIConfig, log_to_file: bool = True) -> logging.Logger:
+def setup_logging(
+    cfg: CLIConfig, log_to_file: bool = True, *, bootstrap: bool = False
+) -> logging.Logger:
     """
     Configure and return the main nutri-matic logger.
 
-    Can be called at CLI startup, or once globally from config.
+    Can be called at CLI startup, or once globally from config.  Unless
+    ``bootstrap`` is set, the logger is marked as configured, so lazy
+    loggers (:func:`get_logger`) keep this setup, e.g. ``--verbose``.
     """
-    logger = logging.getLogger("nutri-matic")  # create a module-wide logger
+    logger = logging.getLogger(LOGGER_NAME)  # create a module-wide logger
     logger.setLevel(logging.DEBUG if cfg.verbose else logging.INFO)
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()  # avoid duplicate logs in repeated runs
 
     logger.addHandler(_console_handler(cfg, cfg.verbose))
     if log_to_file:
         logger.addHandler(_file_handler(cfg))
 
+    if not bootstrap:
+        _configured.add(LOGGER_NAME)
     return logger
+
+
+def get_logger() -> logging.Logger:
+    """
+    Return the nutri-matic logger, configured from the config on first use
+    unless :func:`setup_logging` already configured it.
+    """
+    if LOGGER_NAME in _configured:
+        return logging.getLogger(LOGGER_NAME)
+    # config imports this module (it logs while loading), so import lazily
+    from nutrimatic.core.config import ensure_config  # noqa: PLC0415
+
+    return setup_logging(ensure_config())
+
+
+def bootstrap_logger(cfg: CLIConfig) -> logging.Logger:
+    """
+    Return the nutri-matic logger for code running before the config is
+    loaded: as configured if it already is, otherwise set up from ``cfg``
+    until :func:`get_logger` or the CLI configures it from the config.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    if LOGGER_NAME in _configured or logger.handlers:
+        return logger
+    return setup_logging(cfg, bootstrap=True)
+
+
+class _LazyLogger:
+    """Proxy forwarding to a logger that is only created on first use."""
+
+    def __init__(self, factory: Callable[[], logging.Logger]) -> None:
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._factory(), name)
+
+
+def lazy_logger(factory: Callable[[], logging.Logger] = get_logger) -> logging.Logger:
+    """
+    Return a module-level logger that defers reading the config, creating
+    the log directory and opening the log file until it first logs, so
+    importing a module stays cheap.
+    """
+    return cast(logging.Logger, _LazyLogger(factory))
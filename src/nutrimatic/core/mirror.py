@@ -0,0 +1,116 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Bare git mirror cache stored under CLIConfig.cache_dir.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from pathlib import Path
+
+from git import GitCommandError, Repo  # Requires GitPython
+
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.models import CLIConfig
+
+logger = lazy_logger()  # configured on first use
+
+FETCHED_MARKER = "nutrimatic-fetched"
+
+
+class MirrorCache:
+    """
+    Cache of bare ``git clone --mirror`` repositories.
+
+    The first request for a repo clones a bare mirror; later requests reuse
+    it and only run an incremental ``git fetch`` once the mirror is older
+    than ``ttl`` seconds (or always, when ``refresh`` is set).  Files are
+    read straight from the object database with ``git show``, so no working
+    tree is ever checked out.
+    """
+
+    def __init__(self, root: Path, ttl: float, refresh: bool = False) -> None:
+        self.root = root
+        self.ttl = ttl
+        self.refresh = refresh
+        self._locks: dict[Path, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cli_cfg: CLIConfig, refresh: bool = False) -> "MirrorCache":
+        """Create the mirror cache inside ``CLIConfig.cache_dir``."""
+        return cls(cli_cfg.cache_dir / "mirrors", cli_cfg.cache_ttl, refresh)
+
+    def path(self, url: str) -> Path:
+        """Return the mirror directory used for ``url``."""
+        local = Path(url).expanduser()
+        if local.exists():
+            url = str(local.resolve())
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        name = re.sub(r"\.git$", "", url.rstrip("/")).rsplit("/", 1)[-1]
+        name = re.sub(r"[^\w.-]", "_", name.rsplit(":", 1)[-1])
+        return self.root / f"{name}-{digest}.git"
+
+    def _lock(self, path: Path) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _is_fresh(self, path: Path) -> bool:
+        try:
+            age = time.time() - (path / FETCHED_MARKER).stat().st_mtime
+        except OSError:
+            return False
+        return not self.refresh and age < self.ttl
+
+    def _fetch(self, repo: Repo, path: Path) -> None:
+        logger.debug(f"Fetching mirror {path.name}")
+        repo.git.fetch("--prune", "origin")
+        (path / FETCHED_MARKER).touch()
+
+    def mirror(self, url: str) -> Repo:
+        """
+        Return an up-to-date bare mirror of ``url``, cloning it on first use
+        and fetching it incrementally once it is stale.
+        """
+        return self._mirror(url)[0]
+
+    def _mirror(self, url: str) -> tuple[Repo, bool]:
+        """Return the mirror and whether it was just cloned or fetched."""
+        path = self.path(url)
+        with self._lock(path):
+            if not (path / "HEAD").exists():
+                logger.info(f"Mirroring {url} into {path} ...")
+                self.root.mkdir(parents=True, exist_ok=True)
+                repo = Repo.clone_from(url, path, mirror=True)
+                (path / FETCHED_MARKER).touch()
+                return repo, True
+
+            repo = Repo(path)
+            if self._is_fresh(path):
+                return repo, False
+            self._fetch(repo, path)
+            return repo, True
+
+    def read_file(self, url: str, branch: str, filename: str) -> str | None:
+        """
+        Return the content of ``filename`` on ``branch`` of ``url``, or None
+        if it does not exist.  A cached mirror that lacks the branch or file
+        is fetched once before giving up.
+        """
+        repo, updated = self._mirror(url)
+        for attempt in range(2):
+            try:
+                return str(repo.git.show(f"{branch}:{filename}"))
+            except GitCommandError:
+                if updated or attempt:
+                    return None
+            path = Path(repo.git_dir)
+            with self._lock(path):
+                self._fetch(repo, path)
+        return None
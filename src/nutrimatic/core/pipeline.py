@@ -0,0 +1,162 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Dependency-aware (DAG) executor running independent stages
+concurrently.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.models import PipelineReport, Stage, StageResult
+
+logger = lazy_logger()  # configured on first use
+
+
+class Pipeline:
+    """
+    A set of named stages with dependencies, run as a DAG.
+
+    A stage starts as soon as every stage it runs ``after`` has succeeded,
+    so independent stages run concurrently on a thread pool of
+    ``max_workers`` (``CLIConfig.max_workers`` by default).  Stages
+    depending on a failed stage are skipped.  Every stage is timed and the
+    timings are logged and returned as a :class:`PipelineReport`.
+
+    Example::
+
+        pipeline = Pipeline()
+        pipeline.add("dirs", make_project_dirs)
+        pipeline.add("docs", render_docs)
+        pipeline.add("install", install, after=["dirs", "docs"])
+        pipeline.run()
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers
+        self.stages: dict[str, Stage] = {}
+
+    def add(
+        self, name: str, func: Callable[[], Any], after: Iterable[str] = ()
+    ) -> "Pipeline":
+        """Add a stage running ``func`` once the ``after`` stages succeeded."""
+        if name in self.stages:
+            raise ValueError(f"Duplicate pipeline stage: {name}")
+        self.stages[name] = Stage(name=name, func=func, after=list(after))
+        return self
+
+    def order(self) -> list[str]:
+        """
+        Return the stage names in a valid execution order.
+        Raises ValueError on unknown dependencies or cycles.
+        """
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.after if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown {unknown}")
+
+        order: list[str] = []
+        pending = {name: set(stage.after) for name, stage in self.stages.items()}
+        while pending:
+            ready = [name for name, deps in pending.items() if not deps]
+            if not ready:
+                raise ValueError(f"Pipeline has a dependency cycle: {sorted(pending)}")
+            for name in ready:
+                del pending[name]
+                order.append(name)
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return order
+
+    def run(self, raise_on_error: bool = True) -> PipelineReport:
+        """
+        Run every stage, concurrently where dependencies allow.
+
+        Once a stage fails no new stages are started; running stages finish.
+        With ``raise_on_error`` the first failure is re-raised after the
+        report has been logged.
+        """
+        order = self.order()
+        results: dict[str, StageResult] = {}
+        errors: list[BaseException] = []
+        running: dict[Future[tuple[float, BaseException | None]], str] = {}
+        start = time.perf_counter()
+
+        def succeeded(name: str) -> bool:
+            return name in results and results[name].status == "ok"
+
+        def ready() -> list[str]:
+            return [
+                name
+                for name in order
+                if name not in results
+                and name not in running.values()
+                and all(succeeded(dep) for dep in self.stages[name].after)
+            ]
+
+        workers = self.max_workers or ensure_config().max_workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                if not errors:
+                    for name in ready():
+                        logger.info(f"▶ Stage {name}")
+                        future = executor.submit(_timed, self.stages[name].func)
+                        running[future] = name
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    seconds, error = future.result()
+                    results[name] = _stage_result(name, seconds, error)
+                    if error is not None:
+                        errors.append(error)
+
+        for name in order:
+            if name not in results:
+                results[name] = StageResult(name=name, status="skipped")
+                logger.info(f"⏭️ Stage {name} skipped")
+
+        report = PipelineReport(
+            results=list(results.values()), seconds=time.perf_counter() - start
+        )
+        summary = ", ".join(
+            f"{r.name} {r.seconds:.2f}s"
+            + ("" if r.status == "ok" else f" ({r.status})")
+            for r in report.results
+        )
+        logger.info(f"⏱️ Pipeline finished in {report.seconds:.2f}s: {summary}")
+        if errors and raise_on_error:
+            raise errors[0]
+        return report
+
+
+def _timed(func: Callable[[], Any]) -> tuple[float, BaseException | None]:
+    """Run ``func``, returning its wall-clock time and exception, if any."""
+    start = time.perf_counter()
+    try:
+        func()
+    # SystemExit (e.g. from core.bash.make) is a stage failure, not an exit
+    # of the worker thread.
+    except BaseException as e:
+        return time.perf_counter() - start, e
+    return time.perf_counter() - start, None
+
+
+def _stage_result(
+    name: str, seconds: float, error: BaseException | None
+) -> StageResult:
+    if error is None:
+        logger.info(f"✅ Stage {name} finished in {seconds:.2f}s")
+        return StageResult(name=name, status="ok", seconds=seconds)
+    logger.error(f"❌ Stage {name} failed after {seconds:.2f}s: {error!r}")
+    return StageResult(name=name, status="failed", seconds=seconds, error=repr(error))
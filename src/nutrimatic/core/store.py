@@ -0,0 +1,177 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Local store of versioned template checkouts under
+CLIConfig.cache_dir, used to render nested templates offline.
+"""
+
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import threading
+from pathlib import Path
+
+from git import GitCommandError
+
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.mirror import MirrorCache
+from nutrimatic.models import CLIConfig, StoredTemplate, StoreManifest
+
+logger = lazy_logger()  # configured on first use
+
+STORE_DIR = "templates"
+MANIFEST_FILE = "store.json"
+DEFAULT_REF = "HEAD"
+
+_GITHUB_URL_RE = re.compile(
+    r"^(?:https?://|ssh://git@|git@)github\.com[:/](?P<slug>[^/]+/[^/]+?)(?:\.git)?/?$"
+)
+
+
+def _extract(archive: Path, dest: Path) -> None:
+    """
+    Extract a ``git archive`` tarball into ``dest``, refusing members that
+    would land outside it.  Uses tarfile's ``data`` filter where available
+    (Python 3.11.4+) and an equivalent path check before that.
+    """
+    with tarfile.open(archive) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest, filter="data")
+            return
+        root = dest.resolve()
+        for member in tar.getmembers():
+            target = (root / member.name).resolve()
+            if member.issym():
+                link = (target.parent / member.linkname).resolve()
+            elif member.islnk():
+                link = (root / member.linkname).resolve()
+            else:
+                link = target
+            inside = all(p == root or root in p.parents for p in (target, link))
+            if not inside or member.isdev():
+                raise ValueError(f"Unsafe path in template archive: {member.name}")
+        tar.extractall(dest)  # members checked above
+
+
+def normalize_url(url: str) -> str:
+    """
+    Return a canonical form of a template location, so that the SSH and
+    HTTPS URLs of a GitHub repo (with or without ``.git``) share a key.
+    """
+    if match := _GITHUB_URL_RE.match(url):
+        return f"github.com/{match['slug']}"
+    local = Path(url).expanduser()
+    if local.exists():
+        return str(local.resolve())
+    return url
+
+
+class TemplateStore:
+    """
+    Managed store of exported template checkouts.
+
+    ``sync`` fetches a template through the bare mirror cache and exports
+    the tree of ``ref`` into ``<root>/<repo>/<commit>/``, recording it in a
+    manifest.  ``resolve`` only reads the manifest, so nested renders can
+    use a synced template without any network access.
+    """
+
+    def __init__(self, root: Path, mirrors: MirrorCache) -> None:
+        self.root = root
+        self.mirrors = mirrors
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cli_cfg: CLIConfig) -> "TemplateStore":
+        """Open the store inside ``CLIConfig.cache_dir``; syncs always fetch."""
+        return cls(
+            cli_cfg.cache_dir / STORE_DIR,
+            MirrorCache.from_config(cli_cfg, refresh=True),
+        )
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_FILE
+
+    def manifest(self) -> StoreManifest:
+        """Return the store manifest (empty if the store was never synced)."""
+        try:
+            return StoreManifest.model_validate_json(self.manifest_path.read_bytes())
+        except (OSError, ValueError):
+            return StoreManifest()
+
+    def _save(self, manifest: StoreManifest) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(manifest.model_dump_json(indent=2))
+        os.replace(tmp_name, self.manifest_path)
+
+    @staticmethod
+    def key(url: str, ref: str | None = None) -> str:
+        return f"{normalize_url(url)}@{ref or DEFAULT_REF}"
+
+    def resolve(self, url: str, ref: str | None = None) -> StoredTemplate | None:
+        """Return the stored checkout of ``url`` at ``ref``, if synced."""
+        stored = self.manifest().templates.get(self.key(url, ref))
+        if stored and stored.path.is_dir():
+            return stored
+        return None
+
+    def sync(self, url: str, ref: str | None = None) -> StoredTemplate:
+        """
+        Fetch ``url`` and export ``ref`` (default branch if None) into the
+        store.  A commit that is already exported is reused; older exports of
+        the same ``url``/``ref`` are removed.
+        """
+        ref = ref or DEFAULT_REF
+        repo = self.mirrors.mirror(url)
+        try:
+            commit = repo.git.rev_parse(f"{ref}^{{commit}}")
+        except GitCommandError as e:
+            raise ValueError(f"Unknown ref '{ref}' in {url}") from e
+
+        repo_dir = self.root / self.mirrors.path(url).name.removesuffix(".git")
+        path = repo_dir / commit
+        if not path.is_dir():
+            logger.info(f"📥 Exporting {url}@{ref} ({commit[:12]}) → {path}")
+            repo_dir.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(dir=repo_dir, prefix=".tmp-"))
+            try:
+                archive = tmp_dir / "tree.tar"
+                with open(archive, "wb") as f:
+                    repo.archive(f, treeish=commit, format="tar")
+                _extract(archive, tmp_dir / "tree")
+                os.replace(tmp_dir / "tree", path)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        stored = StoredTemplate(url=url, ref=ref, commit=commit, path=path)
+        with self._lock:
+            manifest = self.manifest()
+            previous = manifest.templates.get(self.key(url, ref))
+            manifest.templates[self.key(url, ref)] = stored
+            self._save(manifest)
+            in_use = {t.path for t in manifest.templates.values()}
+        if previous and previous.path not in in_use:
+            shutil.rmtree(previous.path, ignore_errors=True)
+        return stored
+
+
+def resolve_template(url: str, ref: str | None = None) -> str:
+    """
+    Return the local store checkout of ``url`` if it was synced with
+    ``nutrimatic template sync``, otherwise ``url`` itself.
+    """
+    stored = TemplateStore.from_config(ensure_config()).resolve(url, ref)
+    if stored:
+        logger.debug(f"Using stored template {stored.path} for {url}")
+        return str(stored.path)
+    return url
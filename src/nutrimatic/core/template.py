@@ -5,4 +5,184 @@
 See the LICENSE file for more details.
 
 Author: Jared Cook
+Description: Extract and clean cookiecutter.json from template repos.
 """
+
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+
+from jinja2 import Environment, TemplateSyntaxError
+
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.mirror import MirrorCache
+from nutrimatic.models import ExtractJob, ExtractReport, ExtractResult
+
+logger = lazy_logger()  # configured on first use
+
+COOKIECUTTER_JSON = "cookiecutter.json"
+# Start of any Jinja variable ``{{``, block ``{%`` or comment ``{#``.
+PLACEHOLDER_RE = re.compile(r"\{[{%#]")
+JINJA_TAG_TOKENS = frozenset({"variable_begin", "block_begin", "comment_begin"})
+# Holds the Jinja delimiters themselves, so it is never cleaned.
+JINJA_ENV_KEY = "_jinja2_env_vars"
+
+
+def is_templated(value: str, env: Environment | None = None) -> bool:
+    """
+    Return True if ``value`` contains Jinja syntax cookiecutter would render.
+
+    Without ``env`` the precompiled regex for the default delimiters is used.
+    With ``env`` the value is tokenized by that environment's Jinja lexer, so
+    custom delimiters are honoured; values the lexer rejects are treated as
+    templated, since cookiecutter could not render them either.
+    """
+    if env is None:
+        return PLACEHOLDER_RE.search(value) is not None
+
+    starts = (
+        env.variable_start_string,
+        env.block_start_string,
+        env.comment_start_string,
+    )
+    if not any(start in value for start in starts):
+        return False
+    try:
+        return any(token in JINJA_TAG_TOKENS for _, token, _ in env.lex(value))
+    except TemplateSyntaxError:
+        return True
+
+
+def _clean(value: object, env: Environment | None) -> object:
+    if isinstance(value, dict):
+        return {
+            k: v if k == JINJA_ENV_KEY else _clean(v, env)
+            for k, v in value.items()
+            if not (isinstance(v, str) and is_templated(v, env))
+        }
+    if isinstance(value, list):
+        return [
+            _clean(v, env)
+            for v in value
+            if not (isinstance(v, str) and is_templated(v, env))
+        ]
+    return value
+
+
+def clean_config(data: dict[str, object], use_lexer: bool = False) -> dict[str, object]:
+    """
+    Remove every templated string from a cookiecutter config in one pass.
+
+    Nested dicts (e.g. ``_hooks``) and lists are walked recursively; templated
+    dict values are dropped together with their key and templated list items
+    are dropped from the list.
+
+    With ``use_lexer`` values are checked with Jinja's lexer, configured from
+    the template's ``_jinja2_env_vars`` (e.g. custom delimiters).
+    """
+    env = None
+    if use_lexer:
+        env_vars = data.get(JINJA_ENV_KEY)
+        env = Environment(**(env_vars if isinstance(env_vars, dict) else {}))
+    return cast("dict[str, object]", _clean(data, env))
+
+
+def extract_config(
+    repo: str, branch: str, mirrors: MirrorCache, use_lexer: bool = False
+) -> dict[str, object]:
+    """
+    Read and clean cookiecutter.json of ``repo`` from its cached mirror.
+    Raises FileNotFoundError if the branch has no cookiecutter.json.
+    """
+    text = mirrors.read_file(repo, branch, COOKIECUTTER_JSON)
+    if text is None:
+        raise FileNotFoundError(f"No {COOKIECUTTER_JSON} found in {repo} ({branch})")
+    data: dict[str, object] = json.loads(text)
+    return clean_config(data, use_lexer)
+
+
+def write_config(data: dict[str, object], output_path: Path) -> None:
+    """Save a cleaned config as indented JSON."""
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def read_manifest(path: Path, branch: str = "main") -> list[ExtractJob]:
+    """
+    Read a manifest with one ``<repo> [branch]`` per line.
+    Blank lines and ``#`` comments are ignored.
+    """
+    jobs = []
+    for line in path.read_text().splitlines():
+        fields = line.split("#", 1)[0].split()
+        if fields:
+            jobs.append(
+                ExtractJob(
+                    repo=fields[0], branch=fields[1] if len(fields) > 1 else branch
+                )
+            )
+    return jobs
+
+
+def output_name(repo: str) -> str:
+    """Return the output file stem used for ``repo`` (its repository name)."""
+    name = repo.rstrip("/").removesuffix(".git")
+    return re.split(r"[/:]", name)[-1] or "template"
+
+
+def _extract_job(
+    job: ExtractJob, output_path: Path, mirrors: MirrorCache, use_lexer: bool
+) -> ExtractResult:
+    start = time.perf_counter()
+    result = ExtractResult(repo=job.repo, branch=job.branch)
+    try:
+        data = extract_config(job.repo, job.branch, mirrors, use_lexer)
+        write_config(data, output_path)
+        result.output = output_path
+    except Exception as e:  # a failed repo must not stop the batch
+        result.error = f"{type(e).__name__}: {e}"
+        logger.error(f"❌ {job.repo}: {result.error}")
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def extract_many(
+    jobs: list[ExtractJob],
+    output_dir: Path,
+    mirrors: MirrorCache,
+    max_workers: int | None = None,
+    use_lexer: bool = False,
+) -> ExtractReport:
+    """
+    Extract the cleaned cookiecutter.json of every job into ``output_dir``
+    on a bounded thread pool (``CLIConfig.max_workers`` unless overridden).
+
+    Each config is written to ``<repo name>.json``; repos sharing a name get
+    a numeric suffix.  Failures are recorded in the report instead of
+    aborting the batch.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths: list[Path] = []
+    seen: dict[str, int] = {}
+    for job in jobs:
+        name = output_name(job.repo)
+        seen[name] = seen.get(name, 0) + 1
+        suffix = f"-{seen[name]}" if seen[name] > 1 else ""
+        paths.append(output_dir / f"{name}{suffix}.json")
+
+    start = time.perf_counter()
+    workers = max_workers or ensure_config().max_workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda job, path: _extract_job(job, path, mirrors, use_lexer),
+                jobs,
+                paths,
+            )
+        )
+    return ExtractReport(results=results, seconds=time.perf_counter() - start)
@@ -9,15 +9,14 @@ Author: Jared Cook
 
 from pathlib import Path
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
 
 
-def make_dirs(dirs: list[str], project_dir: Path = Path.cwd()) -> None:
-    """Generate project directories"""
+def make_dirs(dirs: list[str], project_dir: Path | None = None) -> None:
+    """Generate project directories (in the current directory by default)"""
+    project_dir = project_dir or Path.cwd()
     for d in dirs:
         dir_path = project_dir / d
         if not dir_path.exists():
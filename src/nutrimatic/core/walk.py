@@ -0,0 +1,106 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Shared os.scandir-based directory walker with glob pruning,
+extension filtering and cached stat data.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from fnmatch import translate
+from pathlib import Path
+from typing import NamedTuple
+
+from nutrimatic.core.logger import lazy_logger
+
+logger = lazy_logger()  # configured on first use
+
+
+class WalkEntry(NamedTuple):
+    """
+    A file found by :func:`walk_files`.
+
+    ``entry`` is the ``os.DirEntry`` of the file; its ``stat()`` result is
+    cached, so callers reuse it instead of stat-ing the file again.
+    """
+
+    entry: os.DirEntry[str]
+    rel_path: str  # relative to the walked root, '/'-separated
+
+    @property
+    def path(self) -> Path:
+        return Path(self.entry.path)
+
+    @property
+    def name(self) -> str:
+        return self.entry.name
+
+    def stat(self) -> os.stat_result:
+        return self.entry.stat()
+
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch globs into one regex (None when there are none)."""
+    globs = [translate(pat) for pat in patterns]
+    return re.compile("|".join(globs)) if globs else None
+
+
+def walk_files(
+    root: Path,
+    *,
+    ignore: Iterable[str] = (),
+    extensions: Iterable[str] | None = None,
+    max_bytes: int = 0,
+) -> Iterator[WalkEntry]:
+    """
+    Yield the files below ``root``.
+
+    - ``ignore``: fnmatch globs matched against each entry's name and its
+      path relative to ``root``.  Matching directories are pruned, so their
+      subtrees are never listed.
+    - ``extensions``: only yield files with these extensions (without the
+      dot, case-insensitive).
+    - ``max_bytes``: skip (and log) files larger than this (0 disables the
+      cap).
+
+    Symlinked directories are not followed.  Directories that cannot be
+    listed are skipped.
+    """
+    ignored = _compile_globs(ignore)
+    exts = None if extensions is None else {e.lower().lstrip(".") for e in extensions}
+
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
+            continue
+
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if ignored and (ignored.match(entry.name) or ignored.match(rel_path)):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+                    continue
+                if not entry.is_file():
+                    continue
+                if exts is not None:
+                    ext = os.path.splitext(entry.name)[1].lstrip(".").lower()
+                    if ext not in exts:
+                        continue
+                if max_bytes and entry.stat().st_size > max_bytes:
+                    logger.info(f"Skipping file over {max_bytes} bytes: {entry.path}")
+                    continue
+            except OSError:
+                continue
+            yield WalkEntry(entry, rel_path)
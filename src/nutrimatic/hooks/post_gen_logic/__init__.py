@@ -12,11 +12,13 @@ from .auto_vars import replace_placeholders_in_dir
 from .changelogs import generate_cliff_changelog_dirs
 from .docs import generate_docs_templates
 from .make import get_make_cmds
+from .pipeline import post_gen_pipeline
 
 __all__ = [
     "generate_ansible_dirs",
     "generate_cliff_changelog_dirs",
     "generate_docs_templates",
     "get_make_cmds",
+    "post_gen_pipeline",
     "replace_placeholders_in_dir",
 ]
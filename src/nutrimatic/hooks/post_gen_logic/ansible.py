@@ -7,15 +7,15 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from pathlib import Path
+
+from nutrimatic.core.logger import lazy_logger
 from nutrimatic.core.utils import make_dirs
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
 
 
-def generate_ansible_dirs() -> None:
+def generate_ansible_dirs(project_dir: Path | None = None) -> None:
     """Generate ansible project directories"""
     ansible_dirs = [
         "plugins",
@@ -41,4 +41,4 @@ def generate_ansible_dirs() -> None:
         "tests/integration",
         "tests/integration/targets",
     ]
-    make_dirs(ansible_dirs)
+    make_dirs(ansible_dirs, project_dir or Path.cwd())
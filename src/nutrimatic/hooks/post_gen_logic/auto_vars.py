@@ -7,58 +7,264 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
+import codecs
+import mmap
 import os
+import re
+import stat
+import tempfile
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.walk import WalkEntry, walk_files
+from nutrimatic.models import FileChange, RewriteReport
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
 
+# Matched against file/directory names and paths relative to the project root.
+DEFAULT_IGNORE = (
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".pytest_cache",
+    ".tox",
+    ".nox",
+    "post_gen_project.py",  # this hook script itself
+)
+# No size cap by default: large files are streamed (see STREAM_THRESHOLD).
+DEFAULT_MAX_FILE_BYTES = 0
+SNIFF_BYTES = 8192
+# Files at least this large are pre-checked with mmap and rewritten in chunks.
+STREAM_THRESHOLD = 1024 * 1024
+CHUNK_SIZE = 256 * 1024
 
-def replace_placeholders_in_file(
+
+def compile_placeholders(replacements: dict[str, Any]) -> re.Pattern[str]:
+    """
+    Compile every placeholder into a single alternation regex.
+
+    Longer placeholders come first, so one that contains another
+    (e.g. ``PKG_NAME`` and ``PKG``) is replaced as a whole.
+    """
+    placeholders = sorted(replacements, key=len, reverse=True)
+    return re.compile("|".join(re.escape(p) for p in placeholders))
+
+
+@lru_cache(maxsize=32)
+def _bytes_pattern(pattern: re.Pattern[str]) -> re.Pattern[bytes]:
+    """The UTF-8 bytes form of a :func:`compile_placeholders` matcher."""
+    return re.compile(pattern.pattern.encode("utf-8"))
+
+
+def has_placeholder_bytes(filepath: Path, pattern: re.Pattern[str]) -> bool:
+    """
+    Return True if the raw bytes of ``filepath`` contain a placeholder.
+    The file is memory-mapped and searched without being decoded.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _bytes_pattern(pattern).search(mm) is not None
+
+
+def _stream_replace(
     filepath: Path,
     replacements: dict[str, Any],
-) -> None:
-    """Reads a file, replaces the placeholder, and writes it back."""
+    pattern: re.Pattern[str],
+    chunk_size: int,
+) -> int:
+    """
+    Rewrite ``filepath`` chunk by chunk into a temp file, then atomically
+    replace it.  Returns the number of replacements.
+
+    Text after the last complete line (or, if placeholders may span lines,
+    the last ``longest placeholder - 1`` characters) of every chunk is held
+    back until the next one arrives, so a placeholder crossing a chunk
+    boundary is still matched, and the incremental decoder keeps multi-byte
+    characters split across chunks intact.
+    """
+    hold = max(map(len, replacements)) - 1
+    line_safe = not any("\n" in p for p in replacements)
+
+    def repl(m: re.Match[str]) -> str:
+        return str(replacements[m.group()])
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    fd, tmp_name = tempfile.mkstemp(
+        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+    )
+    count = 0
     try:
-        text = filepath.read_text(encoding="utf-8")
+        with (
+            open(filepath, "rb") as src,
+            open(fd, "w", encoding="utf-8", newline="") as dst,
+        ):
+            carry = ""
+            while True:
+                chunk = src.read(chunk_size)
+                text = carry + decoder.decode(chunk, final=not chunk)
+                if not chunk:
+                    text, n = pattern.subn(repl, text)
+                    dst.write(text)
+                    count += n
+                    break
+
+                # Matches starting before ``cut`` are complete within ``text``.
+                cut = max(len(text) - hold, 0)
+                split = text.rfind("\n", 0, cut) + 1 if line_safe else 0
+                if split:
+                    # No match can span a line break: replace whole lines at once.
+                    head, n = pattern.subn(repl, text[:split])
+                    dst.write(head)
+                    count += n
+                    carry = text[split:]
+                    continue
+
+                parts, pos = [], 0
+                for m in pattern.finditer(text):
+                    if m.start() >= cut:
+                        break
+                    parts += [text[pos : m.start()], repl(m)]
+                    pos = m.end()
+                    count += 1
+                keep = max(pos, cut)
+                parts.append(text[pos:keep])
+                dst.write("".join(parts))
+                carry = text[keep:]
+
+        os.chmod(tmp_name, stat.S_IMODE(filepath.stat().st_mode))
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def replace_placeholders_in_file(  # noqa: PLR0913
+    filepath: Path,
+    replacements: dict[str, Any],
+    pattern: re.Pattern[str] | None = None,
+    *,
+    stream_threshold: int = STREAM_THRESHOLD,
+    chunk_size: int = CHUNK_SIZE,
+    dry_run: bool = False,
+) -> FileChange:
+    """
+    Reads a file, replaces every placeholder in one pass, and writes it back.
+    ``pattern`` is the compiled :func:`compile_placeholders` matcher; it is
+    built from ``replacements`` when not given.  Returns what was changed,
+    and with ``dry_run`` only reports whether the file would change.
+
+    Files of at least ``stream_threshold`` bytes are streamed: they are only
+    decoded if :func:`has_placeholder_bytes` finds a match, and are then
+    rewritten in ``chunk_size`` chunks through a temp file and an atomic
+    rename, so memory use does not grow with the file size.
+    """
+    change = FileChange(path=filepath)
+    if not replacements:
+        return change
+    if pattern is None:
+        pattern = compile_placeholders(replacements)
+
+    try:
+        size = filepath.stat().st_size
+        if size >= stream_threshold:
+            change.bytes_read = size
+            found = has_placeholder_bytes(filepath, pattern)
+            if found and not dry_run:
+                change.bytes_read += size
+                count = _stream_replace(filepath, replacements, pattern, chunk_size)
+                change.bytes_written = filepath.stat().st_size
+                logger.debug(f"Updated: {filepath} ({count} replacements, streamed)")
+            # Only set once the rewrite succeeded.
+            change.modified = found
+            return change
+        # Decoded without newline translation, so CRLF line endings are kept.
+        text = filepath.read_bytes().decode("utf-8")
+        change.bytes_read = size
     except UnicodeDecodeError:
         logger.debug(f"Skipping binary file: {filepath}")
-        return
+        return change
     except Exception as e:
         logger.info(f"An error occurred processing file {filepath}: {e}")
-        return
+        return FileChange(path=filepath)
 
-    changed = False
+    text, count = pattern.subn(lambda m: str(replacements[m.group()]), text)
 
-    for placeholder, value in replacements.items():
-        if placeholder in text:
-            text = text.replace(placeholder, str(value))
-            changed = True
-
-    if changed:
-        filepath.write_text(text, encoding="utf-8")
+    if count and not dry_run:
+        data = text.encode("utf-8")
+        filepath.write_bytes(data)
+        change.bytes_written = len(data)
         logger.debug(f"Updated: {filepath}")
+    change.modified = count > 0
+    return change
+
+
+def is_binary(filepath: Path, sniff_bytes: int = SNIFF_BYTES) -> bool:
+    """Guess whether a file is binary from a NUL byte in its first bytes."""
+    try:
+        with open(filepath, "rb") as f:
+            return b"\0" in f.read(sniff_bytes)
+    except OSError:
+        return True
 
 
-def replace_placeholders_in_dir(
+def replace_placeholders_in_dir(  # noqa: PLR0913
     replacements: dict[str, Any],
-    path: Path = Path.cwd(),
-) -> None:
+    path: Path | None = None,
+    *,
+    ignore: Iterable[str] = DEFAULT_IGNORE,
+    max_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    max_workers: int | None = None,
+    dry_run: bool = False,
+) -> RewriteReport:
     """
     Walk through every file in the newly generated project directory
-    and replace placeholders in all files.
+    (the current directory by default) and replace placeholders in all files.
+    Returns a report of files scanned and modified, bytes read and written
+    and the time taken; with ``dry_run`` no file is written.
+
+    ``ignore`` globs prune directories such as ``.git`` and ``node_modules``,
+    files over ``max_bytes`` (no cap by default, as large files are streamed)
+    are skipped and logged, and binary files are detected from their first
+    bytes instead of a failed decode.  Files are processed on a thread pool
+    of ``max_workers`` (``CLIConfig.max_workers`` by default).
     """
-    for root, _dirs, files in os.walk(path):
-        for file in files:
-            # Exclude this hook script itself from the replacement
-            if file == "post_gen_project.py":
-                continue
+    start = time.perf_counter()
+    if not replacements:
+        return RewriteReport(dry_run=dry_run)
+    # Built once and shared by every file of the walk.
+    pattern = compile_placeholders(replacements)
+
+    def process(entry: WalkEntry) -> FileChange:
+        sniffed = min(entry.stat().st_size, SNIFF_BYTES)
+        if is_binary(entry.path):
+            logger.debug(f"Skipping binary file: {entry.path}")
+            return FileChange(path=entry.path, bytes_read=sniffed)
+        change = replace_placeholders_in_file(
+            entry.path, replacements, pattern, dry_run=dry_run
+        )
+        change.bytes_read += sniffed
+        return change
 
-            file_path: Path = Path(root) / file
-            replace_placeholders_in_file(file_path, replacements)
+    entries = walk_files(path or Path.cwd(), ignore=ignore, max_bytes=max_bytes)
+    workers = max_workers or ensure_config().max_workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        changes = list(executor.map(process, entries))
 
-    logger.debug("Timestamp injection complete.")
+    report = RewriteReport.from_changes(changes, time.perf_counter() - start, dry_run)
+    logger.debug(f"Timestamp injection complete: {report.summary()}")
+    return report
@@ -7,18 +7,18 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from pathlib import Path
+
+from nutrimatic.core.logger import lazy_logger
 from nutrimatic.core.utils import make_dirs
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+logger = lazy_logger()  # configured on first use
 
 
-def generate_cliff_changelog_dirs() -> None:
+def generate_cliff_changelog_dirs(project_dir: Path | None = None) -> None:
     """Generate changelog project directories"""
     changelog_dirs = [
         "changelogs",
         "changelogs/releases",
     ]
-    make_dirs(changelog_dirs)
+    make_dirs(changelog_dirs, project_dir or Path.cwd())
@@ -7,26 +7,174 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
+import hashlib
+import json
+import logging
+import os
 import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from cookiecutter.main import cookiecutter
-
+from nutrimatic.core.bash import stream_command
 from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
+from nutrimatic.core.logger import lazy_logger
+from nutrimatic.core.store import TemplateStore
+
+logger = lazy_logger()  # configured on first use
+
+TEMPLATE_URL = "https://github.com/{repo}.git"
+DOCS_CACHE = "docs"
+DOCS_REPOS = {
+    "github": "jcook3701/github-docs-cookiecutter",
+    "sphinx": "jcook3701/sphinx-cookiecutter",
+}
 
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+
+# Renders run in a child interpreter: cookiecutter changes the working
+# directory while rendering, and multiprocessing would re-run the top level
+# of the unguarded hook script (``__main__``) in every worker.
+_RENDER_SCRIPT = """\
+import json, sys
+from cookiecutter.main import cookiecutter
+url, extra_ctx, output_dir = sys.argv[1], json.loads(sys.argv[2]), sys.argv[3]
+cookiecutter(url, no_input=True, extra_context=extra_ctx, output_dir=output_dir)
+"""
 
 
-def generate_docs_templates(context: dict[str, Any]) -> None:
-    """Generate one or more documentation templates inside docs/"""
-    project_dir = Path.cwd()
+def _render(url: str, extra_ctx: dict[str, Any], output_dir: Path) -> Path:
+    """
+    Bake a template into the empty ``output_dir`` in a separate Python
+    process and return the generated directory.
+    """
+    result = stream_command(
+        [
+            sys.executable,
+            "-c",
+            _RENDER_SCRIPT,
+            url,
+            json.dumps(extra_ctx),
+            str(output_dir),
+        ],
+        cwd=output_dir,
+        prefix="   ",
+        level=logging.DEBUG,
+    )
+    if not result.ok:
+        details = "\n".join(result.tail)
+        raise RuntimeError(f"cookiecutter exited with {result.returncode}:\n{details}")
+    generated = [p for p in output_dir.iterdir() if p.is_dir()]
+    if len(generated) != 1:
+        raise RuntimeError(f"Expected one generated directory in {output_dir}")
+    return generated[0]
+
+
+def _cache_key(repo: str, extra_ctx: dict[str, Any], commit: str | None = None) -> str:
+    data = json.dumps(
+        {"repo": repo, "commit": commit, "context": extra_ctx},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _cached_render(cache_dir: Path, key: str, ttl: float) -> Path | None:
+    """Return the cached render for ``key`` if it is younger than ``ttl``."""
+    path = cache_dir / key
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+    return path if age < ttl else None
+
+
+def _store_render(cache_dir: Path, key: str, generated: Path) -> None:
+    """Copy a fresh render into the cache, replacing any older copy."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=cache_dir, prefix=".tmp-"))
+    shutil.copytree(generated, tmp / "render")
+    os.utime(tmp / "render")
+    shutil.rmtree(cache_dir / key, ignore_errors=True)
+    os.replace(tmp / "render", cache_dir / key)
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _render_templates(
+    templates: dict[str, dict[str, Any]],
+    docs_dir: Path,
+    cache_dir: Path,
+    workers: int,
+) -> list[str]:
+    """
+    Render templates concurrently, each into its own temp directory, and
+    return the names of the templates that failed to render.
+    """
+    docs_dir = docs_dir.resolve()
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dirs: list[Path] = []
+    failed: list[str] = []
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            renders: dict[str, Future[Path]] = {}
+            for key, template in templates.items():
+                tmp_dir = Path(tempfile.mkdtemp(dir=docs_dir, prefix=f"_tmp_{key}_"))
+                tmp_dirs.append(tmp_dir)
+                logger.info(
+                    f"📦 Generating {template['name']} docs from {template['repo']} "
+                    f"→ {template['target']}"
+                )
+                renders[key] = executor.submit(
+                    _render, template["url"], template["extra_ctx"], tmp_dir
+                )
+
+            for key, future in renders.items():
+                name = templates[key]["name"]
+                target = templates[key]["target"]
+                try:
+                    generated = future.result()
+                    _store_render(cache_dir, templates[key]["cache_key"], generated)
+                    if target.exists():
+                        target.rmdir()  # only empty targets are rendered
+                    shutil.move(generated, target)
+                    logger.info(f"✅ {name} Docs generated in {target}")
+                except Exception as e:
+                    failed.append(name)
+                    logger.info(f"⚠️  Skipping {name} Docs generation: {e}")
+    finally:
+        for tmp_dir in tmp_dirs:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return failed
+
+
+def generate_docs_templates(
+    context: dict[str, Any],
+    project_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Generate one or more documentation templates inside docs/
+
+    Each template renders into its own temporary directory, and templates
+    that need rendering are rendered concurrently, each by a separate
+    ``python`` process.
+    Renders are cached under ``CLIConfig.cache_dir`` per (repo, context
+    hash) for ``cache_ttl`` seconds, so regenerating a project with the
+    same docs settings copies the cached render instead of cloning.
+    Templates synced into the local template store (``nutrimatic template
+    sync``) are rendered from the store, without network access.
+    """
+    project_dir = project_dir or Path.cwd()
     docs_dir = project_dir / "docs"
-    tmp_dir = docs_dir / "_tmp_docs"
+    cli_cfg = ensure_config()
+    cache_dir = cli_cfg.cache_dir / DOCS_CACHE
+    store = TemplateStore.from_config(cli_cfg)
 
-    tmp_dir.mkdir(parents=True, exist_ok=True)
+    if context.get("_is_sub_template", False):
+        logger.info("⏭️ Skipping docs: project is a sub-template.")
+        return
 
     project_name = context.get("package_name") or context.get("project_name")
 
@@ -41,7 +189,7 @@ def generate_docs_templates(context: dict[str, Any]) -> None:
         "github": {
             "enabled": context.get("add_github_docs", True),
             "name": "Github",
-            "repo": "jcook3701/github-docs-cookiecutter",
+            "repo": DOCS_REPOS["github"],
             "target": docs_dir / "jekyll",
             "extra_ctx": {
                 **base_ctx,
@@ -56,7 +204,7 @@ def generate_docs_templates(context: dict[str, Any]) -> None:
         "sphinx": {
             "enabled": context.get("add_sphinx_docs", True),
             "name": "Sphinx",
-            "repo": "jcook3701/sphinx-cookiecutter",
+            "repo": DOCS_REPOS["sphinx"],
             "target": docs_dir / "sphinx",
             "extra_ctx": {
                 **base_ctx,
@@ -64,49 +212,39 @@ def generate_docs_templates(context: dict[str, Any]) -> None:
         },
     }
 
-    for _key, cfg in templates.items():
-        if not cfg.get("enabled", True):
-            logger.info(f"🚫 Skipping {cfg['name']} docs (disabled)")
-            continue
+    pending: dict[str, dict[str, Any]] = {}
+    for key, template in templates.items():
+        name = template["name"]
+        target = template["target"]
 
-        sub_template = cfg["_is_sub_template"]
-        name = cfg["name"]
-        repo = cfg["repo"]
-        target = cfg["target"]
-        extra_ctx = cfg["extra_ctx"]
+        if not template.get("enabled", True):
+            logger.info(f"🚫 Skipping {name} docs (disabled)")
+            continue
 
-        if sub_template or (target.exists() and any(target.iterdir())):
+        if target.exists() and any(target.iterdir()):
             logger.info(f"⏭️ Skipping {name}: {target} already exists.")
             continue
 
-        logger.info(f"📦 Generating {name} docs from {repo} → {target}")
-        try:
-            # Bake template into temp directory
-            cookiecutter(
-                f"https://github.com/{repo}.git",
-                no_input=True,
-                extra_context=extra_ctx,
-                output_dir=tmp_dir,
-            )
-
-            # Find the generated folder (Cookiecutter creates a subfolder automatically)
-            subdirs = [d for d in tmp_dir.iterdir() if d.is_dir()]
-            if not subdirs:
-                logger.info(f"⚠️  No generated directory found for {name}")
-                continue
-
-            generated_dir = subdirs[0]
-
-            shutil.move(generated_dir, target)
-
-            # Clean up tmp
-            for d in tmp_dir.iterdir():
-                if d.is_dir():
-                    shutil.rmtree(d)
+        url = TEMPLATE_URL.format(repo=template["repo"])
+        stored = store.resolve(url)
+        template["url"] = str(stored.path) if stored else url
+        template["cache_key"] = _cache_key(
+            template["repo"], template["extra_ctx"], stored.commit if stored else None
+        )
+        cached = _cached_render(cache_dir, template["cache_key"], cli_cfg.cache_ttl)
+        if cached:
+            shutil.copytree(cached, target, dirs_exist_ok=True)
+            logger.info(f"♻️  {name} Docs restored from cache in {target}")
+            continue
 
-            logger.info(f"✅ {name} Docs generated in {target}")
+        pending[key] = template
 
-        except Exception as e:
-            logger.info(f"⚠️  Skipping {name} Docs generation: {e}")
+    failed: list[str] = []
+    if pending:
+        workers = min(len(pending), max_workers or cli_cfg.max_workers)
+        failed = _render_templates(pending, docs_dir, cache_dir, workers)
 
+    if failed:
+        logger.warning(f"⚠️  Docs generation failed for: {', '.join(failed)}")
+    else:
         logger.info("🎉 All documentation templates generated successfully!")
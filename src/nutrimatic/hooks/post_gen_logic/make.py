@@ -9,11 +9,20 @@ Author: Jared Cook
 
 from typing import Any
 
-from nutrimatic.core.config import ensure_config
-from nutrimatic.core.logger import setup_logging
-
-cfg = ensure_config()  # loads singleton config
-logger = setup_logging(cfg)  # loads singleton logger
+from nutrimatic.core.logger import lazy_logger
+
+logger = lazy_logger()  # configured on first use
+
+# Ordering constraints between the post-gen make targets; targets not
+# listed here (or not depending on each other) may run concurrently.
+# ``changelog`` and ``build-docs`` both ``git add`` into the repository made
+# by ``git-init``, so they run one after the other to avoid racing on the
+# git index lock, and after ``install`` for the tools they use.
+MAKE_TARGET_DEPS: dict[str, list[str]] = {
+    "pre-commit-init": ["install", "git-init"],
+    "changelog": ["install", "git-init"],
+    "build-docs": ["install", "git-init", "changelog"],
+}
 
 
 def get_make_cmds(context: dict[str, Any]) -> list[str]:
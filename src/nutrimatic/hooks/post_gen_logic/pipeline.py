@@ -0,0 +1,92 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Declarative post-gen pipeline of the post_gen_logic hooks.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from nutrimatic.core.bash import add_make_targets
+from nutrimatic.core.pipeline import Pipeline
+
+from .ansible import generate_ansible_dirs
+from .auto_vars import replace_placeholders_in_dir
+from .changelogs import generate_cliff_changelog_dirs
+from .docs import generate_docs_templates
+from .make import MAKE_TARGET_DEPS, get_make_cmds
+
+
+def post_gen_pipeline(  # noqa: PLR0913
+    context: dict[str, Any],
+    *,
+    project_dir: Path | None = None,
+    ansible: bool = False,
+    changelogs: bool = False,
+    docs: bool = False,
+    replacements: dict[str, Any] | None = None,
+    make_cmds: list[str] | None = None,
+    verbose: bool = False,
+    max_workers: int | None = None,
+) -> Pipeline:
+    """
+    Build the post-gen pipeline of a generated project.
+
+    Stages and their dependencies:
+      - ``ansible-dirs``, ``changelog-dirs`` and ``docs`` are independent
+        and run concurrently.
+      - ``auto-vars`` replaces ``replacements`` once all of them are done, so
+        generated directories and docs are covered too.
+      - ``make <target>`` runs each of ``make_cmds``
+        (``get_make_cmds(context)`` by default) after all of the above,
+        concurrently except for the ``MAKE_TARGET_DEPS`` constraints (e.g.
+        ``pre-commit-init`` waits for ``install`` and ``git-init``).
+
+    Disabled or empty stages are left out.  Every stage works on
+    ``project_dir`` (the current directory by default) explicitly, so stages
+    do not depend on the process working directory.
+
+    Example (``hooks/post_gen_project.py``)::
+
+        post_gen_pipeline(
+            {{ cookiecutter | jsonify }},
+            changelogs=True,
+            docs=True,
+            replacements={"__YEAR__": datetime.now().year},
+        ).run()
+    """
+    project_dir = project_dir or Path.cwd()
+    pipeline = Pipeline(max_workers)
+
+    if ansible:
+        pipeline.add("ansible-dirs", lambda: generate_ansible_dirs(project_dir))
+    if changelogs:
+        pipeline.add(
+            "changelog-dirs", lambda: generate_cliff_changelog_dirs(project_dir)
+        )
+    if docs:
+        pipeline.add("docs", lambda: generate_docs_templates(context, project_dir))
+
+    if replacements:
+        pipeline.add(
+            "auto-vars",
+            lambda: replace_placeholders_in_dir(replacements, project_dir),
+            after=list(pipeline.stages),
+        )
+
+    cmds = get_make_cmds(context) if make_cmds is None else make_cmds
+    if cmds:
+        add_make_targets(
+            pipeline,
+            cmds,
+            deps=MAKE_TARGET_DEPS,
+            after=list(pipeline.stages),
+            verbose=verbose,
+            cwd=project_dir,
+        )
+
+    return pipeline
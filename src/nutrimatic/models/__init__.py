@@ -9,11 +9,19 @@ Description: Init python models (types)
 """
 
 from .accounts import Accounts
+from .cache import CacheEntry, CacheStats
 from .ccmeta import CCMeta
 from .cctemplate import CCTemplate, CCTemplateVariable
+from .command import CommandResult
 from .config import DEFAULT_CONFIG, CLIConfig
+from .extract import ExtractJob, ExtractReport, ExtractResult
+from .front_matter import FileFingerprint, FrontMatterManifest
 from .github import GitHubAccount, GitHubAuth, GitHubRepo
+from .index import IndexEntry
 from .metadata import DEFAULT_METADATA, Metadata
+from .pipeline import PipelineReport, Stage, StageResult
+from .rewrite import FileChange, RewriteReport
+from .store import StoredTemplate, StoreManifest
 from .template import ConfigData, Namespace, TemplateRepo
 
 __all__ = [
@@ -24,11 +32,27 @@ __all__ = [
     "CCTemplate",
     "CCTemplateVariable",
     "CLIConfig",
+    "CacheEntry",
+    "CacheStats",
+    "CommandResult",
     "ConfigData",
+    "ExtractJob",
+    "ExtractReport",
+    "ExtractResult",
+    "FileChange",
+    "FileFingerprint",
+    "FrontMatterManifest",
     "GitHubAccount",
     "GitHubAuth",
     "GitHubRepo",
+    "IndexEntry",
     "Metadata",
     "Namespace",
+    "PipelineReport",
+    "RewriteReport",
+    "Stage",
+    "StageResult",
+    "StoreManifest",
+    "StoredTemplate",
     "TemplateRepo",
 ]
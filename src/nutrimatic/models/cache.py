@@ -0,0 +1,70 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Cache Models:
+(CacheEntry, CacheStats)
+"""
+
+import time
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class CacheEntry(BaseModel):
+    """
+    A single on-disk cache record.
+
+    Attributes:
+         key: (str) Human readable cache key (e.g. ``config:<repo_url>``).
+         stored_at: (float) Unix timestamp of when the entry was written.
+         value: (Any) JSON serializable cached value.
+         url: (str | None) URL the value was downloaded from.
+         etag: (str | None) ``ETag`` validator returned with the value.
+         last_modified: (str | None) ``Last-Modified`` validator returned with the value.
+         size: (int) Size in bytes of the downloaded response body.
+    """
+
+    key: str
+    stored_at: float = Field(default_factory=time.time)
+    value: Any = None
+    url: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    size: int = 0
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Return True if the entry is younger than ``ttl`` seconds."""
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheStats(BaseModel):
+    """
+    Counters describing how requests were served.
+
+    Attributes:
+         hits: (int) Requests served from a fresh cache entry without any network.
+         revalidations: (int) Stale entries confirmed unchanged by a ``304 Not Modified``.
+         downloads: (int) Full downloads of a response body.
+         bytes_downloaded: (int) Bytes of response bodies downloaded.
+         bytes_saved: (int) Bytes of response bodies served from cache instead.
+    """
+
+    hits: int = 0
+    revalidations: int = 0
+    downloads: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
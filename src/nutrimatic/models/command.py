@@ -0,0 +1,34 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Subprocess Models:
+(CommandResult)
+"""
+
+from pydantic import BaseModel, Field
+
+
+class CommandResult(BaseModel):
+    """
+    Outcome of a streamed subprocess.
+
+    Attributes:
+         args: (list[str]) Command line that was run.
+         returncode: (int) Exit status of the process.
+         seconds: (float) Wall-clock time of the process.
+         tail: (list[str]) Last output lines (stdout and stderr interleaved),
+            bounded by the tail size of the run.
+    """
+
+    args: list[str]
+    returncode: int
+    seconds: float = 0.0
+    tail: list[str] = Field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
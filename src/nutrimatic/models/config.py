@@ -12,7 +12,7 @@ Configuration file location: ~/.config/nutri-matic/config.yml
 
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .accounts import Accounts
 from .github import GitHubAccount, GitHubAuth
@@ -28,6 +28,11 @@ class CLIConfig(BaseModel):
          accounts: (Accounts) User accounts.
          default_template_branch: (str)
          cache_dir: (Path) Path to cache directory.
+         cache_ttl: (int) Seconds before cached GitHub results are re-fetched.
+         cache_max_bytes: (int) Size bound of the on-disk cache.
+         max_workers: (int) Maximum number of concurrent network workers.
+         http_timeout: (float) Timeout in seconds for HTTP requests.
+         http_retries: (int) Retries for failed HTTP requests.
          log_file: (Path) Path to log file.
          verbose: (bool) Enable/Disable verbose mode.
     """
@@ -39,6 +44,11 @@ class CLIConfig(BaseModel):
     default_template_branch: str = "main"
 
     cache_dir: Path = Path.home() / ".cache" / "nutri-matic"
+    cache_ttl: int = Field(default=3600, ge=0)
+    cache_max_bytes: int = Field(default=50 * 1024 * 1024, ge=0)
+    max_workers: int = Field(default=8, ge=1)
+    http_timeout: float = Field(default=10.0, gt=0)
+    http_retries: int = Field(default=3, ge=0)
     log_file: Path = Path.home() / ".nutri-matic" / "nutri-matic.log"
 
     verbose: bool = False
@@ -0,0 +1,64 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Extract Models:
+(ExtractJob, ExtractResult, ExtractReport)
+"""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class ExtractJob(BaseModel):
+    """
+    A template repo whose cookiecutter.json should be extracted.
+
+    Attributes:
+         repo: (str) Git URL or local path of the template repo.
+         branch: (str) Branch to read cookiecutter.json from.
+    """
+
+    repo: str
+    branch: str = "main"
+
+
+class ExtractResult(BaseModel):
+    """
+    Outcome of extracting a single template repo.
+
+    Attributes:
+         repo: (str) Git URL or local path of the template repo.
+         branch: (str) Branch cookiecutter.json was read from.
+         output: (Path | None) Path of the cleaned config, if it was written.
+         seconds: (float) Wall-clock time spent on this repo.
+         error: (str | None) Failure reason, or None on success.
+    """
+
+    repo: str
+    branch: str
+    output: Path | None = None
+    seconds: float = 0.0
+    error: str | None = None
+
+
+class ExtractReport(BaseModel):
+    """
+    Summary of a batch extract.
+
+    Attributes:
+         results: (list[ExtractResult]) Per-repo results, in input order.
+         seconds: (float) Wall-clock time of the whole batch.
+    """
+
+    results: list[ExtractResult] = Field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failures(self) -> list[ExtractResult]:
+        """Results that did not produce a cleaned config."""
+        return [r for r in self.results if r.error]
@@ -0,0 +1,38 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: YAML Front Matter Models:
+(FileFingerprint, FrontMatterManifest)
+"""
+
+from pydantic import BaseModel, Field
+
+
+class FileFingerprint(BaseModel):
+    """
+    State of a file after front matter injection last saw it.
+
+    Attributes:
+         mtime_ns: (int) Modification time in nanoseconds.
+         size: (int) Size in bytes.
+         sha256: (str) Hex digest of the content.
+    """
+
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+class FrontMatterManifest(BaseModel):
+    """
+    Files of a directory already handled by front matter injection.
+
+    Attributes:
+         files: (dict[str, FileFingerprint]) Fingerprints by relative path.
+    """
+
+    files: dict[str, FileFingerprint] = Field(default_factory=dict)
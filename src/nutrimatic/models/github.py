@@ -12,7 +12,7 @@ Description: Github Models:
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class GitHubAuth(BaseModel):
@@ -62,6 +62,10 @@ class GitHubRepo(BaseModel):
          ssh_url: (str).
          clone_url: (str).
          is_template: (bool).
+         default_branch: (str) GitHub repository default branch.
+         language: (str) GitHub repository primary language.
+         topics: (list[str]) GitHub repository topics.
+         pushed_at: (str) Timestamp of the last push, used to detect changes.
     """
 
     owner: str = ""
@@ -74,3 +78,7 @@ class GitHubRepo(BaseModel):
     ssh_url: str = ""
     clone_url: str = ""
     is_template: bool = False
+    default_branch: str = "main"
+    language: str = ""
+    topics: list[str] = Field(default_factory=list)
+    pushed_at: str = ""
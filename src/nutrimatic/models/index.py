@@ -0,0 +1,82 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Template Index Models:
+(IndexEntry)
+"""
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .ccmeta import CCMeta
+from .template import TemplateRepo
+
+
+class IndexEntry(BaseModel):
+    """
+    A template record of the local template index.
+
+    Attributes:
+         key: (str) Unique key; GitHub full name or local template path.
+         source: (Literal['github', 'ccmeta']) Where the record was indexed from.
+         namespace: (str) GitHub namespace (lowercase, as GitHub logins are
+            case-insensitive), or the scanned directory for ccmeta.
+         name: (str) Template name.
+         description: (str) Template description.
+         language: (str) Template language (e.g. "python").
+         tags: (list[str]) Tags, GitHub topics and features.
+         pushed_at: (str) Last push timestamp used for incremental refresh.
+         template: (TemplateRepo | None) GitHub template repo and its ConfigData.
+         ccmeta: (CCMeta | None) Template definition read from a ccmeta file.
+    """
+
+    key: str
+    source: Literal["github", "ccmeta"] = "github"
+    namespace: str = ""
+    name: str = ""
+    description: str = ""
+    language: str = ""
+    tags: list[str] = Field(default_factory=list)
+    pushed_at: str = ""
+    template: TemplateRepo | None = None
+    ccmeta: CCMeta | None = None
+
+    @classmethod
+    def from_template(cls, template: TemplateRepo) -> "IndexEntry":
+        """Create an entry from a GitHub template repo."""
+        repo = template.repo
+        config = template.config
+        return cls(
+            key=repo.full_name,
+            source="github",
+            namespace=repo.namespace.lower(),
+            name=repo.name,
+            description=(config.description if config else "") or repo.description,
+            language=repo.language,
+            tags=repo.topics,
+            pushed_at=repo.pushed_at,
+            template=template,
+        )
+
+    @classmethod
+    def from_ccmeta(cls, path: Path, base_dir: Path, meta: CCMeta) -> "IndexEntry":
+        """Create an entry from a ccmeta template found under ``base_dir``."""
+        cctemplate = meta.template
+        return cls(
+            key=str(path.resolve()),
+            source="ccmeta",
+            namespace=str(base_dir.resolve()),
+            name=cctemplate.name,
+            description=cctemplate.description or "",
+            language=cctemplate.language or "",
+            tags=sorted(
+                {*meta.tags, *meta.features, *cctemplate.tags, *cctemplate.features}
+            ),
+            ccmeta=meta,
+        )
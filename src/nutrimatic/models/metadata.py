@@ -7,12 +7,10 @@ See the LICENSE file for more details.
 Author: Jared Cook
 """
 
-from collections.abc import Mapping
-from importlib.metadata import PackageNotFoundError, metadata
-from typing import cast
-
 from pydantic import BaseModel
 
+from nutrimatic import METADATA_DEFAULTS, package_metadata
+
 
 class Metadata(BaseModel):
     """
@@ -40,17 +38,7 @@ class Metadata(BaseModel):
 
         Falls back to defaults if the package is not found.
         """
-        try:
-            pkg_meta = metadata(package_name)
-            pkg_meta_dict = cast(Mapping[str, str], pkg_meta)
-
-            return cls(
-                version=pkg_meta_dict.get("Version", "0.1.0"),
-                author=pkg_meta_dict.get("Author", "Jared Cook"),
-                license=pkg_meta_dict.get("License", "MIT"),
-            )
-        except PackageNotFoundError:
-            return DEFAULT_METADATA
+        return cls(**package_metadata(package_name))
 
 
-DEFAULT_METADATA = Metadata(version="0.1.0", author="Jared Cook", license="MIT")
+DEFAULT_METADATA = Metadata(**METADATA_DEFAULTS)
@@ -0,0 +1,66 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Pipeline Models:
+(Stage, StageResult, PipelineReport)
+"""
+
+from collections.abc import Callable
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class Stage(BaseModel):
+    """
+    A named unit of work of a pipeline.
+
+    Attributes:
+         name: (str) Unique stage name.
+         func: (Callable[[], Any]) Work to run; takes no arguments.
+         after: (list[str]) Names of stages that must succeed first.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    after: list[str] = Field(default_factory=list)
+
+
+class StageResult(BaseModel):
+    """
+    Outcome of a single pipeline stage.
+
+    Attributes:
+         name: (str) Stage name.
+         status: (Literal['ok', 'failed', 'skipped']) Skipped stages did not
+            run because a dependency failed.
+         seconds: (float) Wall-clock time of the stage.
+         error: (str | None) Failure reason.
+    """
+
+    name: str
+    status: Literal["ok", "failed", "skipped"]
+    seconds: float = 0.0
+    error: str | None = None
+
+
+class PipelineReport(BaseModel):
+    """
+    Summary of a pipeline run.
+
+    Attributes:
+         results: (list[StageResult]) Stage results in completion order.
+         seconds: (float) Wall-clock time of the whole run.
+    """
+
+    results: list[StageResult] = Field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if every stage succeeded."""
+        return all(r.status == "ok" for r in self.results)
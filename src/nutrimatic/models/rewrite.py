@@ -0,0 +1,80 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Bulk File Rewrite Models:
+(FileChange, RewriteReport)
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class FileChange(BaseModel):
+    """
+    Outcome of rewriting (or checking, in a dry run) a single file.
+
+    Attributes:
+         path: (Path) The file.
+         modified: (bool) True if the file was (or would be) changed.
+         bytes_read: (int) Bytes read from the file.
+         bytes_written: (int) Bytes written; 0 in a dry run.
+    """
+
+    path: Path
+    modified: bool = False
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+class RewriteReport(BaseModel):
+    """
+    Summary of a bulk rewrite of a directory.
+
+    Attributes:
+         files_scanned: (int) Files considered.
+         files_modified: (int) Files changed (or that would be, in a dry run).
+         bytes_read: (int) Total bytes read.
+         bytes_written: (int) Total bytes written; 0 in a dry run.
+         seconds: (float) Wall-clock time of the run.
+         dry_run: (bool) True if no file was written.
+         modified: (list[Path]) The files changed (or to be changed).
+    """
+
+    files_scanned: int = 0
+    files_modified: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+    modified: list[Path] = Field(default_factory=list)
+
+    @classmethod
+    def from_changes(
+        cls, changes: Iterable[FileChange], seconds: float, dry_run: bool = False
+    ) -> "RewriteReport":
+        report = cls(seconds=seconds, dry_run=dry_run)
+        for change in changes:
+            report.files_scanned += 1
+            report.bytes_read += change.bytes_read
+            report.bytes_written += change.bytes_written
+            if change.modified:
+                report.files_modified += 1
+                report.modified.append(change.path)
+        return report
+
+    def summary(self) -> str:
+        """One-line summary for logs and CLI output."""
+        mib = (self.bytes_read + self.bytes_written) / (1024 * 1024)
+        rate = mib / self.seconds if self.seconds else 0.0
+        verb = "would modify" if self.dry_run else "modified"
+        return (
+            f"{self.files_scanned} scanned, {verb} {self.files_modified}, "
+            f"{self.bytes_read} B read, {self.bytes_written} B written "
+            f"in {self.seconds:.2f}s ({rate:.1f} MiB/s)"
+        )
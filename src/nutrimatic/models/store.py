@@ -0,0 +1,45 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Template Store Models:
+(StoredTemplate, StoreManifest)
+"""
+
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class StoredTemplate(BaseModel):
+    """
+    A versioned template checkout in the local template store.
+
+    Attributes:
+         url: (str) Git URL or local path the template was synced from.
+         ref: (str) Branch, tag or ``HEAD`` (default branch) that was synced.
+         commit: (str) Commit SHA the checkout was exported from.
+         path: (Path) Directory holding the exported checkout.
+         synced_at: (float) Unix timestamp of the last sync.
+    """
+
+    url: str
+    ref: str = "HEAD"
+    commit: str
+    path: Path
+    synced_at: float = Field(default_factory=time.time)
+
+
+class StoreManifest(BaseModel):
+    """
+    Index of the template store, keyed by ``<normalized url>@<ref>``.
+
+    Attributes:
+         templates: (dict[str, StoredTemplate]) Stored templates by key.
+    """
+
+    templates: dict[str, StoredTemplate] = Field(default_factory=dict)
@@ -0,0 +1,156 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Wall-clock benchmarks for
+nutrimatic.hooks.post_gen_logic.auto_vars.replace_placeholders_in_dir
+with hundreds of placeholders over a large generated tree, and over a
+project holding .git, node_modules and large binary files, plus the peak
+memory of streaming a large data file.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nutrimatic.hooks.post_gen_logic.auto_vars import (
+    replace_placeholders_in_dir,
+    replace_placeholders_in_file,
+)
+
+PLACEHOLDERS = 300
+FILES = 200
+LINES_PER_FILE = 400
+
+
+def _generate_tree(root: Path, replacements: dict[str, Any]) -> None:
+    names = list(replacements)
+    for i in range(FILES):
+        directory = root / f"pkg_{i % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = [
+            f"line {n}: {names[(i * n) % len(names)]} and some filler text"
+            for n in range(LINES_PER_FILE)
+        ]
+        (directory / f"module_{i}.py").write_text("\n".join(lines))
+
+
+def _replace_per_placeholder(replacements: dict[str, Any], path: Path) -> None:
+    """The original implementation: one scan and one copy per placeholder."""
+    for root, _dirs, files in os.walk(path):
+        for file in files:
+            file_path = Path(root) / file
+            try:
+                text = file_path.read_text(encoding="utf-8")
+            except UnicodeDecodeError:
+                continue
+            changed = False
+            for placeholder, value in replacements.items():
+                if placeholder in text:
+                    text = text.replace(placeholder, str(value))
+                    changed = True
+            if changed:
+                file_path.write_text(text, encoding="utf-8")
+
+
+@pytest.mark.benchmark
+def test_replace_placeholders_single_pass(tmp_path: Path) -> None:
+    replacements = {
+        f"__PLACEHOLDER_{i:04d}__": f"value-{i}" for i in range(PLACEHOLDERS)
+    }
+    timings: dict[str, float] = {}
+    outputs: dict[str, list[str]] = {}
+
+    for name, replace in (
+        ("per-placeholder", _replace_per_placeholder),
+        ("single-pass", replace_placeholders_in_dir),
+    ):
+        root = tmp_path / name
+        _generate_tree(root, replacements)
+        start = time.perf_counter()
+        replace(replacements, root)
+        timings[name] = time.perf_counter() - start
+        outputs[name] = [p.read_text() for p in sorted(root.rglob("*.py"))]
+
+    report = ", ".join(f"{name}: {t:.3f}s" for name, t in timings.items())
+    print(  # noqa: T201
+        f"\nreplace_placeholders[{PLACEHOLDERS} placeholders, {FILES} files] {report}"
+    )
+
+    assert outputs["single-pass"] == outputs["per-placeholder"]
+    assert timings["single-pass"] < timings["per-placeholder"]
+
+
+def _generate_project(root: Path, replacements: dict[str, Any]) -> None:
+    """A generated project with vendored dirs and large binaries next to sources."""
+    _generate_tree(root / "src", replacements)
+    blob = os.urandom(1024 * 1024)
+    for vendored in (".git/objects", "node_modules/dep", ".venv/lib"):
+        directory = root / vendored
+        directory.mkdir(parents=True)
+        for i in range(FILES):
+            (directory / f"file_{i}.js").write_text("module.exports = {};\n" * 200)
+        for i in range(5):
+            (directory / f"blob_{i}.bin").write_bytes(blob)
+
+
+@pytest.mark.benchmark
+def test_replace_placeholders_skips_vendored_dirs(tmp_path: Path) -> None:
+    replacements = {
+        f"__PLACEHOLDER_{i:04d}__": f"value-{i}" for i in range(PLACEHOLDERS)
+    }
+    timings: dict[str, float] = {}
+
+    for name, replace in (
+        ("serial walk", _replace_per_placeholder),
+        ("pruned parallel walk", replace_placeholders_in_dir),
+    ):
+        root = tmp_path / name.replace(" ", "_")
+        _generate_project(root, replacements)
+        start = time.perf_counter()
+        replace(replacements, root)
+        timings[name] = time.perf_counter() - start
+
+    report = ", ".join(f"{name}: {t:.3f}s" for name, t in timings.items())
+    print(f"\nreplace_placeholders[project with vendored dirs] {report}")  # noqa: T201
+
+    assert timings["pruned parallel walk"] < timings["serial walk"]
+
+
+@pytest.mark.benchmark
+def test_streaming_bounds_memory(tmp_path: Path) -> None:
+    replacements = {"__YEAR__": 2024, "__PROJECT__": "nutri-matic"}
+    row = "id,name,year,__PROJECT__,some padding to widen the row\n"
+    size_mb = 40
+    results: dict[str, tuple[float, float]] = {}
+
+    for name, threshold in (("in-memory", 1 << 62), ("streamed", 0)):
+        path = tmp_path / f"{name}.csv"
+        with open(path, "w") as f:
+            for _ in range(size_mb * 1024 * 1024 // len(row)):
+                f.write(row)
+        tracemalloc.start()
+        start = time.perf_counter()
+        replace_placeholders_in_file(path, replacements, stream_threshold=threshold)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = (elapsed, peak / 1024 / 1024)
+
+    report = ", ".join(
+        f"{n}: {t:.2f}s, peak {m:.1f} MiB" for n, (t, m) in results.items()
+    )
+    print(f"\nreplace_placeholders_in_file[{size_mb} MiB csv] {report}")  # noqa: T201
+
+    assert results["streamed"][1] < results["in-memory"][1] / 10
@@ -0,0 +1,63 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Cold-start benchmark of the CLI entry points.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+# [project.scripts] entry points.
+ENTRY_POINTS = {
+    "nutrimatic": "nutrimatic.cli.main",
+    "nm-build": "nutrimatic.cli.build",
+    "nm-cfg": "nutrimatic.cli.config",
+    "nm-templates": "nutrimatic.cli.templates",
+}
+RUNS = 5
+# Target for --help/--version on top of what the CLI cannot avoid and which
+# varies a lot between machines: starting Python and importing typer (plus
+# typer's rich help renderer for --help).
+TARGET_SECONDS = 0.150
+BASELINES = {"--help": "import typer.rich_utils", "--version": "import typer"}
+
+
+def _cold_start(code: str, *args: str) -> float:
+    """Median wall-clock time of running ``code`` in a fresh interpreter."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, *args], capture_output=True, check=True
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("entry_point", list(ENTRY_POINTS))
+def test_cli_cold_start(entry_point: str) -> None:
+    code = f"from {ENTRY_POINTS[entry_point]} import app; app()"
+    flags = ["--help", "--version"] if entry_point == "nutrimatic" else ["--help"]
+
+    for flag in flags:
+        baseline = _cold_start(BASELINES[flag])
+        seconds = _cold_start(code, flag)
+        print(  # noqa: T201
+            f"\n{entry_point} {flag}: {seconds * 1000:.0f}ms "
+            f"({(seconds - baseline) * 1000:.0f}ms over the "
+            f"{baseline * 1000:.0f}ms baseline)"
+        )
+        assert seconds - baseline < TARGET_SECONDS
@@ -0,0 +1,47 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Wall-clock benchmark for nutrimatic.core.github.fetch_namespace
+against a local GitHub stand-in with simulated network latency.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+import nutrimatic.core.github as github_module
+
+if TYPE_CHECKING:
+    from conftest import GitHubStub
+
+LATENCY = 0.02  # seconds per simulated round trip
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("repo_count", [10, 50, 200])
+def test_fetch_namespace_scaling(github_stub: GitHubStub, repo_count: int) -> None:
+    github_stub.latency = LATENCY
+    github_stub.add_templates(repo_count)
+
+    timings: dict[int, float] = {}
+    for workers in (1, 8, 32):
+        start = time.perf_counter()
+        ns = github_module.fetch_namespace(
+            "octo", max_workers=workers, api_url=github_stub.url
+        )
+        timings[workers] = time.perf_counter() - start
+        assert len(ns.templates) == repo_count
+
+    report = ", ".join(f"{w} workers: {t:.3f}s" for w, t in timings.items())
+    print(f"\nfetch_namespace[{repo_count} repos] {report}")  # noqa: T201
+
+    assert timings[8] < timings[1]
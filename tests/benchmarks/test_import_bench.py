@@ -0,0 +1,61 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Import-time benchmark (``python -X importtime``) of the CLI.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+# Budget (microseconds) for the time spent in nutrimatic's own module bodies,
+# excluding third-party imports (about 5ms).  tests/core/test_logger.py checks
+# that the import has no side effects and loads no heavy dependencies.
+SELF_BUDGET_US = 25_000
+
+
+def _importtime(module: str, home: Path) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for a cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env={**os.environ, "HOME": str(home)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if match := IMPORTTIME_RE.match(line):
+            timings[match[4]] = (int(match[1]), int(match[2]))
+    return timings
+
+
+@pytest.mark.benchmark
+def test_cli_import_time(tmp_path: Path) -> None:
+    timings = _importtime("nutrimatic.cli.main", tmp_path)
+
+    own = {name: t for name, t in timings.items() if name.startswith("nutrimatic")}
+    self_us = sum(t[0] for t in own.values())
+    total_us = timings["nutrimatic.cli.main"][1]
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:10]
+    report = "\n".join(f"  {t[0] / 1000:8.1f}ms  {name}" for name, t in slowest)
+    print(  # noqa: T201
+        f"\nnutrimatic.cli.main: {total_us / 1000:.1f}ms cumulative, "
+        f"{self_us / 1000:.1f}ms in nutrimatic modules\n{report}"
+    )
+
+    assert self_us < SELF_BUDGET_US
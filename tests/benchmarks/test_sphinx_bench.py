@@ -0,0 +1,150 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Benchmarks of the nutrimatic.build.sphinx front matter hooks:
+the ``source-read`` hook on its own, and the time the hooks add to a
+Sphinx markdown build of thousands of MyST documents (needs myst-parser
+and sphinx-markdown-builder; skipped otherwise).
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from nutrimatic.build.sphinx import add_yaml_front_matter, init_yaml_front_matter
+from nutrimatic.build.yaml_front_matter import (
+    build_front_matter,
+    compute_folder_depth,
+)
+
+SECTIONS = 40
+PAGES_PER_SECTION = 50  # 2000 documents
+READS = 3  # source-read runs again for every re-read document
+
+CONF = """\
+project = "bench"
+extensions = ["myst_parser", "sphinx_markdown_builder"]
+source_suffix = {{".md": "markdown"}}
+suppress_warnings = ["toc.not_included"]
+
+
+def setup(app):
+    if {hooks}:
+        from nutrimatic.build.sphinx import setup_yaml_front_matter
+
+        setup_yaml_front_matter(app)
+"""
+
+
+class FakeApp:
+    def __init__(self) -> None:
+        self.builder = SimpleNamespace(name="markdown")
+        self.config = SimpleNamespace(project="bench")
+
+
+def _docnames() -> list[str]:
+    return [
+        f"section_{s}/page_{p}"
+        for s in range(SECTIONS)
+        for p in range(PAGES_PER_SECTION)
+    ]
+
+
+def _uncached_hook(app: Any, docname: str, source: list[str]) -> None:
+    """The hook before per-build state and memoization, for comparison."""
+    project_name = getattr(app.config, "project", "unknown_project")
+    if app.builder.name != "markdown":
+        return
+    relative_to_src = Path(docname)
+    depth = compute_folder_depth(relative_to_src)
+    extensions = {e.lower() for e in ["yml", "yaml", "md"]}
+    front_matter = build_front_matter(relative_to_src, extensions, depth, project_name)
+    source[0] = front_matter + source[0]
+
+
+@pytest.mark.benchmark
+def test_source_read_hook() -> None:
+    docnames = _docnames()
+    timings: dict[str, float] = {}
+    for name, hook in (("uncached", _uncached_hook), ("cached", add_yaml_front_matter)):
+        app: Any = FakeApp()
+        init_yaml_front_matter(app)
+        start = time.perf_counter()
+        for _ in range(READS):
+            for docname in docnames:
+                hook(app, docname, ["# Page\n"])
+        timings[name] = time.perf_counter() - start
+
+    report = ", ".join(f"{name}: {t * 1000:.1f}ms" for name, t in timings.items())
+    print(f"\nsource-read x {READS * len(docnames)}: {report}")  # noqa: T201
+    assert timings["cached"] < timings["uncached"]
+
+
+def _project(root: Path) -> Path:
+    src = root / "src"
+    lines = ["# Bench", "", "```{toctree}", ":glob:", "", "section_*/*", "```"]
+    (src / "index.md").parent.mkdir(parents=True)
+    (src / "index.md").write_text("\n".join(lines) + "\n")
+    for docname in _docnames():
+        page = src / f"{docname}.md"
+        page.parent.mkdir(exist_ok=True)
+        page.write_text(
+            f"# {page.stem}\n\nSome *text* with a [link](https://example.com).\n"
+        )
+    for hooks in (False, True):
+        conf_dir = root / f"conf_{hooks}"
+        conf_dir.mkdir()
+        (conf_dir / "conf.py").write_text(CONF.format(hooks=hooks))
+    return src
+
+
+@pytest.mark.benchmark
+def test_markdown_build_overhead(tmp_path: Path) -> None:
+    pytest.importorskip("myst_parser")
+    pytest.importorskip("sphinx_markdown_builder")
+    from sphinx.application import Sphinx  # noqa: PLC0415
+
+    src = _project(tmp_path)
+    timings: dict[str, float] = {}
+    metadata: dict[bool, dict[str, Any]] = {}
+    for hooks in (False, True):
+        app = Sphinx(
+            src,
+            tmp_path / f"conf_{hooks}",
+            tmp_path / f"out_{hooks}",
+            tmp_path / f"doctrees_{hooks}",
+            "markdown",
+            status=None,
+            freshenv=True,
+        )
+        start = time.perf_counter()
+        app.build()
+        timings["with hooks" if hooks else "without hooks"] = (
+            time.perf_counter() - start
+        )
+        assert app.statuscode == 0
+        metadata[hooks] = dict(app.env.metadata["section_0/page_1"])
+
+    # MyST turns the prepended front matter into docinfo metadata, so it is
+    # checked there rather than in the markdown output.
+    assert metadata[True]["title"] == "page_1"
+    assert metadata[True]["parent"] == "section_0"
+    assert "parent" not in metadata[False]
+
+    overhead = timings["with hooks"] - timings["without hooks"]
+    report = ", ".join(f"{name}: {t:.2f}s" for name, t in timings.items())
+    print(  # noqa: T201
+        f"\nmarkdown build of {len(_docnames()) + 1} docs: {report} "
+        f"(hooks: {overhead * 1000:+.0f}ms)"
+    )
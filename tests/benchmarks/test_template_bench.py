@@ -0,0 +1,64 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Wall-clock benchmark for nutrimatic.core.template.clean_config
+over large synthetic cookiecutter.json files.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from nutrimatic.core.template import clean_config
+
+SIZES = (1_000, 10_000, 100_000)
+REPEATS = 3  # best of, so a GC pause in one run does not skew the ratio
+
+
+def _synthetic_config(size: int) -> dict[str, object]:
+    """Build a config of ``size`` entries, a third templated, with nesting."""
+    data: dict[str, object] = {}
+    for i in range(size):
+        match i % 3:
+            case 0:
+                data[f"plain_{i}"] = f"value {i}"
+            case 1:
+                data[f"templated_{i}"] = f"{{{{ cookiecutter.plain_{i - 1} }}}}"
+            case _:
+                data[f"nested_{i}"] = {
+                    "items": ["a", "{% if cookiecutter.x %}b{% endif %}", i],
+                    "hook": f"hook_{i}.py",
+                }
+    return data
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("use_lexer", [False, True])
+def test_clean_config_scales_linearly(use_lexer: bool) -> None:
+    timings: dict[int, float] = {}
+    for size in SIZES:
+        data = _synthetic_config(size)
+        runs = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            cleaned = clean_config(data, use_lexer)
+            runs.append(time.perf_counter() - start)
+            assert len(cleaned) == size - size // 3
+        timings[size] = min(runs)
+
+    report = ", ".join(
+        f"{size} keys: {t:.4f}s ({t / size * 1e6:.2f}us/key)"
+        for size, t in timings.items()
+    )
+    print(f"\nclean_config[lexer={use_lexer}] {report}")  # noqa: T201
+
+    # 100x the keys should cost roughly 100x the time, not 10_000x.
+    assert timings[SIZES[-1]] / timings[SIZES[0]] < 300
@@ -0,0 +1,84 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Wall-clock benchmark of nutrimatic.core.walk.walk_files against
+the rglob and os.walk traversals it replaced, on a 100k-file tree.
+
+Run with: ``pytest -m benchmark -s``
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from nutrimatic.core.walk import walk_files
+
+DIRS = 500
+FILES_PER_DIR = 200  # 100k files, a fifth of them under node_modules
+IGNORE = ("node_modules", ".git")
+
+
+@pytest.fixture(scope="module")
+def big_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("tree")
+    for d in range(DIRS):
+        parent = "node_modules" if d % 5 == 0 else "docs"
+        directory = root / parent / f"section_{d}"
+        directory.mkdir(parents=True)
+        for f in range(FILES_PER_DIR):
+            ext = "md" if f % 2 else "png"
+            (directory / f"page_{f}.{ext}").touch()
+    return root
+
+
+def _rglob(root: Path) -> int:
+    return sum(
+        1
+        for p in root.rglob("*")
+        if p.is_file()
+        and p.suffix.lower().lstrip(".") == "md"
+        and not any(part in IGNORE for part in p.relative_to(root).parts)
+    )
+
+
+def _os_walk(root: Path) -> int:
+    count = 0
+    for dir_path, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORE]
+        for name in files:
+            if name.endswith(".md"):
+                count += 1
+                (Path(dir_path) / name).stat()
+    return count
+
+
+def _walk_files(root: Path) -> int:
+    return sum(1 for _ in walk_files(root, ignore=IGNORE, extensions={"md"}))
+
+
+@pytest.mark.benchmark
+def test_walk_files_100k(big_tree: Path) -> None:
+    expected = DIRS * 4 // 5 * FILES_PER_DIR // 2
+    timings: dict[str, float] = {}
+    walkers: dict[str, Callable[[Path], int]] = {
+        "rglob": _rglob,
+        "os.walk": _os_walk,
+        "walk_files": _walk_files,
+    }
+    for name, walker in walkers.items():
+        start = time.perf_counter()
+        assert walker(big_tree) == expected
+        timings[name] = time.perf_counter() - start
+
+    report = ", ".join(f"{name}: {t:.3f}s" for name, t in timings.items())
+    print(f"\n{DIRS * FILES_PER_DIR} files: {report}")  # noqa: T201
+    assert timings["walk_files"] < timings["rglob"]
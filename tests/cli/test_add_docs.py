@@ -0,0 +1,71 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for the add-docs command
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from git import Repo
+from typer.testing import CliRunner
+
+import nutrimatic.cli.commands.nmutils.docs as docs_command
+import nutrimatic.core.store as store_module
+from nutrimatic.cli import main
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.store import TemplateStore
+
+
+def test_add_docs_uses_synced_template_by_default(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_template_repo: Callable[..., Repo],
+) -> None:
+    cfg = ensure_config().model_copy(update={"cache_dir": tmp_path / "cache"})
+    monkeypatch.setattr(store_module, "ensure_config", lambda: cfg)
+    url = make_template_repo("docs-template", {"project_name": "docs"}).working_dir
+    stored = TemplateStore.from_config(cfg).sync(url)  # `template sync <url>`
+
+    rendered: list[tuple[str, Any]] = []
+
+    def fake_cookiecutter(template: str, checkout: Any = None, **kwargs: Any) -> str:
+        rendered.append((template, checkout))
+        return kwargs["output_dir"]
+
+    monkeypatch.setattr(docs_command, "cookiecutter", fake_cookiecutter)
+
+    result = CliRunner().invoke(
+        main.app, ["add-docs", str(tmp_path / "project"), "--template-repo", url]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert rendered == [(str(stored.path), None)]
+
+
+def test_add_docs_copies_empty_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_cookiecutter(template: str, **kwargs: Any) -> str:
+        rendered = Path(kwargs["output_dir"]) / "docs"
+        (rendered / "_static").mkdir(parents=True)
+        (rendered / "index.md").write_text("# Docs\n")
+        return str(rendered)
+
+    monkeypatch.setattr(docs_command, "cookiecutter", fake_cookiecutter)
+    monkeypatch.setattr(docs_command, "resolve_template", lambda url, ref: url)
+    project = tmp_path / "project"
+
+    result = CliRunner().invoke(main.app, ["add-docs", str(project)])
+
+    assert result.exit_code == 0, result.output
+    assert (project / "docs" / "index.md").read_text() == "# Docs\n"
+    assert (project / "docs" / "_static").is_dir()
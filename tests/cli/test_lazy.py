@@ -0,0 +1,77 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.cli.lazy and the lazy CLI registries
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+import nutrimatic
+from nutrimatic.cli import build, config, main, templates
+from nutrimatic.cli.lazy import LazyCommand, LazySpec
+from nutrimatic.models import DEFAULT_METADATA, Metadata
+
+HEAVY_MODULES = ("cookiecutter", "git", "jinja2", "pydantic", "requests", "sphinx")
+
+REGISTRIES = [
+    (name, spec)
+    for module in (main, build, config, templates)
+    for name, spec in module.COMMANDS.items()
+]
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    code = (
+        "import sys\n"
+        "import nutrimatic.cli.main, nutrimatic.cli.build\n"
+        "import nutrimatic.cli.config, nutrimatic.cli.templates\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize(("name", "spec"), REGISTRIES)
+def test_lazy_spec_matches_command(name: str, spec: LazySpec) -> None:
+    """The lazy help must be what the loaded command would list in --help."""
+    command = LazyCommand(name, spec).command
+
+    assert spec.help == command.get_short_help_str(limit=sys.maxsize), name
+
+
+def test_lazy_command_runs() -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(main.app, ["--help"])
+    assert result.exit_code == 0
+    assert "extract-batch" in result.output
+
+    result = runner.invoke(main.app, ["extract", "--help"])
+    assert result.exit_code == 0
+    assert "--jinja-lexer" in result.output
+
+    result = runner.invoke(main.app, ["config", "show", "--format", "yaml"])
+    assert result.exit_code == 0
+    assert "cache_dir:" in result.output
+
+
+def test_package_metadata_matches_model() -> None:
+    metadata = Metadata.from_package()
+
+    assert nutrimatic.__version__ == metadata.version
+    assert nutrimatic.__author__ == metadata.author
+    assert nutrimatic.__license__ == metadata.license
+    assert nutrimatic.__copyright__ == metadata.copyright
+    assert Metadata.from_package("not-installed") == DEFAULT_METADATA
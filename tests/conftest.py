@@ -0,0 +1,307 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Shared pytest fixtures.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from git import Actor, Repo
+
+import nutrimatic.core.logger as logger_module
+from nutrimatic.models import DEFAULT_CONFIG
+
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def fresh_logger(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[logging.Logger, None, None]:
+    """
+    Give every test its own console-only nutri-matic logger.  Handlers set
+    up during a test (e.g. on a CliRunner stream) must not outlive it.
+    """
+    logger = logging.getLogger(logger_module.LOGGER_NAME)
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "level", logger.level)
+    monkeypatch.setattr(logger_module, "_configured", set())
+    logger_module.setup_logging(DEFAULT_CONFIG, log_to_file=False)
+    yield logger
+    for handler in logger.handlers:
+        handler.close()
+
+
+# ---------------------------------------------------------------------------
+# Local GitHub stand-in
+# ---------------------------------------------------------------------------
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class GitHubStub:
+    """
+    Minimal local HTTP stand-in for the parts of GitHub nutri-matic talks to.
+
+    Serves ``/users/{namespace}/repos`` (paginated with ``Link`` headers,
+    like GitHub), ``/{namespace}/{repo}/raw/{branch}/config.json`` and a
+    ``POST /graphql`` that answers the namespace query of
+    :mod:`nutrimatic.core.github`.
+    Responses carry an ``ETag`` and honour ``If-None-Match`` with a
+    ``304 Not Modified``.  Every request path is recorded in ``requests``
+    and every response status in ``statuses``, and every ``Authorization``
+    header in ``auth_headers``.  Responses queued in ``queued`` as
+    ``(status, headers)`` are served before normal routing.
+    """
+
+    def __init__(self, namespace: str = "octo", latency: float = 0.0) -> None:
+        self.namespace = namespace
+        self.latency = latency
+        self.repos: list[dict[str, Any]] = []
+        self.configs: dict[str, dict[str, Any]] = {}
+        self.requests: list[str] = []
+        self.statuses: list[int] = []
+        self.auth_headers: list[str | None] = []
+        self.queued: list[tuple[int, dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._server = _StubServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add_repo(
+        self,
+        name: str,
+        config: dict[str, Any] | None = None,
+        default_branch: str = "main",
+        language: str = "Python",
+        topics: list[str] | None = None,
+    ) -> None:
+        """Register a repo; repos without a config are not templates."""
+        full_name = f"{self.namespace}/{name}"
+        self.repos.append(
+            {
+                "name": name,
+                "full_name": full_name,
+                "owner": {"login": self.namespace},
+                "description": f"{name} description",
+                "url": f"{self.url}/repos/{full_name}",
+                "html_url": f"{self.url}/{full_name}",
+                "ssh_url": f"git@example.com:{full_name}.git",
+                "clone_url": f"{self.url}/{full_name}.git",
+                "default_branch": default_branch,
+                "is_template": False,
+                "language": language,
+                "topics": topics or [],
+                "pushed_at": "2024-01-01T00:00:00Z",
+            }
+        )
+        if config is not None:
+            self.configs[f"/{full_name}/raw/{default_branch}/config.json"] = config
+
+    def add_templates(self, count: int) -> None:
+        """Register ``count`` template repos named ``template-000``..."""
+        for i in range(count):
+            name = f"template-{i:03d}"
+            self.add_repo(
+                name,
+                {
+                    "project_name": name,
+                    "author": "Stub Author",
+                    "version": "0.1.0",
+                    "description": f"Template {i}",
+                },
+            )
+
+    def _graphql_node(self, repo: dict[str, Any]) -> dict[str, Any]:
+        branch = repo["default_branch"]
+        config = self.configs.get(f"/{repo['full_name']}/raw/{branch}/config.json")
+        return {
+            "name": repo["name"],
+            "nameWithOwner": repo["full_name"],
+            "description": repo["description"],
+            "url": repo["html_url"],
+            "sshUrl": repo["ssh_url"],
+            "isTemplate": repo["is_template"],
+            "owner": repo["owner"],
+            "defaultBranchRef": {"name": branch},
+            "primaryLanguage": {"name": repo["language"]},
+            "repositoryTopics": {
+                "nodes": [{"topic": {"name": t}} for t in repo["topics"]]
+            },
+            "pushedAt": repo["pushed_at"],
+            "config": {"text": json.dumps(config)} if config is not None else None,
+        }
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+            def do_GET(self) -> None:
+                with stub._lock:
+                    stub.requests.append(self.path)
+                    stub.auth_headers.append(self.headers.get("Authorization"))
+                    queued = stub.queued.pop(0) if stub.queued else None
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if queued:
+                    self._send_empty(*queued)
+                    return
+
+                parsed = urlparse(self.path)
+                path = parsed.path
+                if path == f"/users/{stub.namespace}/repos":
+                    self._send_repo_page(parse_qs(parsed.query))
+                elif path in stub.configs:
+                    self._send_json(stub.configs[path])
+                else:
+                    self._send_empty(404)
+
+            def _send_empty(
+                self, status: int, headers: dict[str, str] | None = None
+            ) -> None:
+                with stub._lock:
+                    stub.statuses.append(status)
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.requests.append(self.path)
+                    stub.auth_headers.append(self.headers.get("Authorization"))
+                if urlparse(self.path).path != "/graphql":
+                    self._send_empty(404)
+                    return
+
+                variables = body.get("variables", {})
+                first = variables["first"]
+                start = int(variables.get("cursor") or 0)
+                end = start + first
+                nodes = [stub._graphql_node(r) for r in stub.repos[start:end]]
+                self._send_json(
+                    {
+                        "data": {
+                            "repositoryOwner": {
+                                "repositories": {
+                                    "pageInfo": {
+                                        "hasNextPage": end < len(stub.repos),
+                                        "endCursor": str(end),
+                                    },
+                                    "nodes": nodes,
+                                }
+                            }
+                        }
+                    }
+                )
+
+            def _send_repo_page(self, query: dict[str, list[str]]) -> None:
+                per_page = int(query.get("per_page", ["30"])[0])
+                page = int(query.get("page", ["1"])[0])
+                start = (page - 1) * per_page
+                headers = {}
+                if start + per_page < len(stub.repos):
+                    next_url = (
+                        f"{stub.url}/users/{stub.namespace}/repos"
+                        f"?per_page={per_page}&page={page + 1}"
+                    )
+                    headers["Link"] = f'<{next_url}>; rel="next"'
+                self._send_json(stub.repos[start : start + per_page], headers)
+
+            def _send_json(
+                self, payload: Any, headers: dict[str, str] | None = None
+            ) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send_empty(304)
+                    return
+
+                with stub._lock:
+                    stub.statuses.append(200)
+                self.send_response(200)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+@pytest.fixture
+def github_stub() -> Generator[GitHubStub, None, None]:
+    """Start a local GitHub stand-in for the duration of a test."""
+    stub = GitHubStub()
+    stub.start()
+    try:
+        yield stub
+    finally:
+        stub.stop()
+
+
+# ---------------------------------------------------------------------------
+# Local template git repos
+# ---------------------------------------------------------------------------
+
+GIT_AUTHOR = Actor("Stub Author", "stub@example.com")
+
+
+def commit_config(repo: Repo, config: dict[str, Any]) -> None:
+    """Commit ``config`` as the cookiecutter.json of ``repo``."""
+    path = Path(repo.working_dir) / "cookiecutter.json"
+    path.write_text(json.dumps(config))
+    repo.index.add([str(path)])
+    repo.index.commit("update config", author=GIT_AUTHOR, committer=GIT_AUTHOR)
+
+
+@pytest.fixture
+def make_template_repo(tmp_path: Path) -> Callable[..., Repo]:
+    """Return a factory creating local git repos with a cookiecutter.json."""
+
+    def factory(name: str, config: dict[str, Any] | None = None) -> Repo:
+        repo = Repo.init(tmp_path / "repos" / name, initial_branch="main")
+        commit_config(repo, config if config is not None else {"project_name": name})
+        return repo
+
+    return factory
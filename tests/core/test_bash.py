@@ -0,0 +1,120 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.bash
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from nutrimatic.core.bash import make_targets, stream_command
+
+needs_make = pytest.mark.skipif(shutil.which("make") is None, reason="needs make")
+
+MAKEFILE = """\
+slow:
+\t@sleep 0.5; echo slow >> order.log
+
+fast:
+\t@echo fast >> order.log
+
+after-slow:
+\t@echo after-slow >> order.log
+
+fail:
+\t@echo broken; exit 3
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "Makefile").write_text(MAKEFILE)
+    return tmp_path
+
+
+@needs_make
+def test_make_targets_respects_deps(project: Path) -> None:
+    report = make_targets(
+        ["slow", "fast", "after-slow"],
+        deps={"after-slow": ["slow"]},
+        cwd=project,
+    )
+
+    assert report.ok
+    assert [r.name for r in report.results] == [
+        "make fast",
+        "make slow",
+        "make after-slow",
+    ]
+    assert report.results[1].seconds >= 0.5
+    # fast ran concurrently with slow instead of waiting for it
+    assert (project / "order.log").read_text().split() == [
+        "fast",
+        "slow",
+        "after-slow",
+    ]
+
+
+@needs_make
+def test_make_targets_streams_output_and_exits(
+    project: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with (
+        caplog.at_level(logging.DEBUG, logger="nutri-matic"),
+        pytest.raises(SystemExit) as exc,
+    ):
+        make_targets(["fail", "slow"], deps={"slow": ["fail"]}, cwd=project)
+
+    assert exc.value.code == 2  # make exits 2 when a recipe fails
+    assert "[fail] broken" in caplog.text
+    assert not (project / "order.log").exists()
+
+
+def test_stream_command_forwards_lines_and_keeps_tail(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    script = (
+        "import sys\n"
+        "for i in range(20000):\n"
+        "    print(f'out {i}')\n"
+        "    print(f'err {i}', file=sys.stderr)\n"
+        "sys.stdout.write('partial')\n"
+        "sys.exit(4)\n"
+    )
+    with caplog.at_level(logging.INFO, logger="nutri-matic"):
+        result = stream_command([sys.executable, "-c", script], prefix="[py] ", tail=5)
+
+    assert result.returncode == 4
+    assert not result.ok
+    assert len(result.tail) == 5
+    # The two pipes interleave nondeterministically (stdout is block-buffered
+    # in the child), so the tail only holds lines from the end of the streams.
+    last = {"partial"} | {
+        f"{s} {i}" for s in ("out", "err") for i in range(18000, 20000)
+    }
+    assert set(result.tail) <= last
+    messages = [r.getMessage() for r in caplog.records]
+    assert "[py] partial" in messages
+    assert "[py] err 19999" in messages
+    assert messages.count("[py] out 0") == 1
+    assert sum(m.startswith("[py] ") for m in messages) == 40001
+
+
+def test_stream_command_splits_long_lines(caplog: pytest.LogCaptureFixture) -> None:
+    script = "print('x' * (2 * 64 * 1024) + '\\nend')"
+    with caplog.at_level(logging.INFO, logger="nutri-matic"):
+        result = stream_command([sys.executable, "-c", script])
+
+    assert result.ok
+    assert result.tail == ["x" * 64 * 1024, "x" * 64 * 1024, "end"]
+    assert len(caplog.records) == 3
@@ -0,0 +1,123 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.cache
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import nutrimatic.core.github as github_module
+from nutrimatic.core.cache import DiskCache
+
+if TYPE_CHECKING:
+    from conftest import GitHubStub
+
+# ---------------------------------------------------------------------------
+# DiskCache
+# ---------------------------------------------------------------------------
+
+
+def test_cache_roundtrip(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, ttl=60, max_bytes=0)
+    cache.set("config:a", {"x": 1})
+    entry = cache.get("config:a")
+    assert entry is not None
+    assert entry.value == {"x": 1}
+    assert cache.get("config:b") is None
+
+
+def test_cache_ttl_expires(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, ttl=0, max_bytes=0)
+    cache.set("config:a", {"x": 1})
+    assert cache.get("config:a") is None
+
+
+def test_cache_refresh_skips_reads(tmp_path: Path) -> None:
+    DiskCache(tmp_path, ttl=60, max_bytes=0).set("config:a", 1)
+    refreshing = DiskCache(tmp_path, ttl=60, max_bytes=0, refresh=True)
+    assert refreshing.get("config:a") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, ttl=60, max_bytes=0)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 100)
+    # Age every entry ("a" oldest), then touch "a" so "b" becomes the oldest.
+    now = time.time()
+    for age, key in ((300, "a"), (200, "b"), (100, "c")):
+        os.utime(cache._path(key), (now - age, now - age))
+    assert cache.get("a") is not None
+
+    entry_size = next(tmp_path.glob("*.json")).stat().st_size
+    cache.max_bytes = entry_size * 3 + 16
+    cache.set("d", "x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.get("d") is not None
+
+
+# ---------------------------------------------------------------------------
+# fetch_namespace with cache
+# ---------------------------------------------------------------------------
+
+
+def test_fetch_namespace_served_from_cache(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_repo("plain")
+    github_stub.add_templates(3)
+    cache = DiskCache(tmp_path, ttl=60, max_bytes=0)
+
+    first = github_module.fetch_namespace("octo", api_url=github_stub.url, cache=cache)
+    requests_after_first = len(github_stub.requests)
+    second = github_module.fetch_namespace("octo", api_url=github_stub.url, cache=cache)
+
+    assert [t.repo.name for t in second.templates] == [
+        t.repo.name for t in first.templates
+    ]
+    assert len(github_stub.requests) == requests_after_first
+
+
+def test_fetch_config_revalidates_stale_entry(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    repo_url = f"{github_stub.url}/octo/tpl"
+    cache = DiskCache(tmp_path, ttl=0, max_bytes=0)
+
+    first = github_module.fetch_config(repo_url, cache)
+    second = github_module.fetch_config(repo_url, cache)
+
+    assert first == second
+    assert github_stub.statuses == [200, 304]
+    assert cache.stats.downloads == 1
+    assert cache.stats.revalidations == 1
+    assert cache.stats.bytes_saved == cache.stats.bytes_downloaded
+
+
+def test_fetch_config_redownloads_changed_config(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    repo_url = f"{github_stub.url}/octo/tpl"
+    cache = DiskCache(tmp_path, ttl=0, max_bytes=0)
+
+    github_module.fetch_config(repo_url, cache)
+    github_stub.configs["/octo/tpl/raw/main/config.json"] = {"project_name": "new"}
+    config = github_module.fetch_config(repo_url, cache)
+
+    assert config is not None
+    assert config.project_name == "new"
+    assert github_stub.statuses == [200, 200]
+    assert cache.stats.downloads == 2
@@ -0,0 +1,84 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.client
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from nutrimatic.core.client import GitHubClient, GitHubTokenAuth
+
+if TYPE_CHECKING:
+    from conftest import GitHubStub
+
+# ---------------------------------------------------------------------------
+# GitHubTokenAuth
+# ---------------------------------------------------------------------------
+
+
+def test_token_sent_only_to_github_hosts(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    url = f"{github_stub.url}/octo/tpl/raw/main/config.json"
+
+    GitHubClient(token="secret").get(url)
+    client = GitHubClient()
+    client.session.auth = GitHubTokenAuth("secret", frozenset({"127.0.0.1"}))
+    client.get(url)
+
+    assert github_stub.auth_headers == [None, "Bearer secret"]
+
+
+# ---------------------------------------------------------------------------
+# GitHubClient
+# ---------------------------------------------------------------------------
+
+
+def test_client_retries_server_errors(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    github_stub.queued = [(503, {}), (502, {})]
+
+    client = GitHubClient(retries=3, backoff=0)
+    resp = client.get(f"{github_stub.url}/octo/tpl/raw/main/config.json")
+
+    assert resp.status_code == 200
+    assert github_stub.statuses == [503, 502, 200]
+
+
+def test_client_waits_for_rate_limit_reset(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    reset = time.time() + 0.3
+    github_stub.queued = [
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+    ]
+
+    client = GitHubClient(retries=0)
+    resp = client.get(f"{github_stub.url}/octo/tpl/raw/main/config.json")
+
+    assert resp.status_code == 200
+    assert time.time() >= reset
+    assert github_stub.statuses == [403, 200]
+
+
+def test_client_gives_up_on_long_rate_limit(github_stub: GitHubStub) -> None:
+    github_stub.queued = [
+        (
+            403,
+            {
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(time.time() + 3600),
+            },
+        )
+    ]
+
+    client = GitHubClient(retries=0, max_rate_limit_wait=1)
+    resp = client.get(f"{github_stub.url}/users/octo/repos")
+
+    assert resp.status_code == 403
+    assert client.rate_limit_remaining == 0
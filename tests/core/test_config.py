@@ -193,3 +193,5 @@ def test_ensure_config_uses_cache(
         mock_load.assert_called_once()
         assert c1 is c2
         assert c1 is mock_cli_config
+
+        config_module.ensure_config.cache_clear()
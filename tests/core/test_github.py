@@ -0,0 +1,162 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.github
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+
+import nutrimatic.core.github as github_module
+from nutrimatic.core.cache import DiskCache
+from nutrimatic.models import TemplateRepo
+
+if TYPE_CHECKING:
+    from conftest import GitHubStub
+
+# ---------------------------------------------------------------------------
+# fetch_config
+# ---------------------------------------------------------------------------
+
+
+def test_fetch_config_found(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl", "author": "me"})
+    cfg = github_module.fetch_config(f"{github_stub.url}/octo/tpl")
+    assert cfg is not None
+    assert cfg.project_name == "tpl"
+    assert cfg.author == "me"
+    assert cfg.variables == {"project_name": "tpl", "author": "me"}
+
+
+def test_fetch_config_missing(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("plain")
+    assert github_module.fetch_config(f"{github_stub.url}/octo/plain") is None
+
+
+def test_fetch_config_known_branch_single_request(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"}, default_branch="master")
+
+    cfg = github_module.fetch_config(f"{github_stub.url}/octo/tpl", branch="master")
+
+    assert cfg is not None
+    assert github_stub.requests == ["/octo/tpl/raw/master/config.json"]
+
+
+# ---------------------------------------------------------------------------
+# fetch_namespace
+# ---------------------------------------------------------------------------
+
+
+def test_fetch_namespace_skips_non_templates(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("plain")
+    github_stub.add_templates(2)
+
+    ns = github_module.fetch_namespace("octo", api_url=github_stub.url)
+
+    assert [t.repo.name for t in ns.templates] == ["template-000", "template-001"]
+    assert all(t.repo.owner == "octo" for t in ns.templates)
+
+
+def test_fetch_namespace_concurrent_order_is_stable(github_stub: GitHubStub) -> None:
+    github_stub.add_templates(20)
+
+    serial = github_module.fetch_namespace(
+        "octo", max_workers=1, api_url=github_stub.url
+    )
+    parallel = github_module.fetch_namespace(
+        "octo", max_workers=8, api_url=github_stub.url
+    )
+
+    expected = [f"template-{i:03d}" for i in range(20)]
+    assert [t.repo.name for t in serial.templates] == expected
+    assert [t.repo.name for t in parallel.templates] == expected
+
+
+def test_fetch_namespace_follows_pagination(github_stub: GitHubStub) -> None:
+    github_stub.add_templates(250)
+
+    ns = github_module.fetch_namespace("octo", api_url=github_stub.url)
+
+    assert len(ns.templates) == 250
+    pages = [r for r in github_stub.requests if r.startswith("/users/octo/repos")]
+    assert len(pages) == 3
+
+
+def test_iter_namespace_is_lazy(github_stub: GitHubStub) -> None:
+    github_stub.add_templates(150)
+
+    templates = github_module.iter_namespace("octo", api_url=github_stub.url)
+    first = next(templates)
+
+    assert first.repo.name == "template-000"
+    pages = [r for r in github_stub.requests if r.startswith("/users/octo/repos")]
+    assert len(pages) == 1
+
+
+def test_fetch_namespace_uses_default_branch(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("legacy", {"project_name": "legacy"}, default_branch="master")
+    github_stub.add_repo("plain")
+
+    ns = github_module.fetch_namespace("octo", api_url=github_stub.url)
+
+    assert [t.repo.default_branch for t in ns.templates] == ["master"]
+    # One listing request plus exactly one config lookup per repo.
+    assert len(github_stub.requests) == 3
+
+
+def test_fetch_namespace_graphql_batches_pages(github_stub: GitHubStub) -> None:
+    github_stub.add_repo("plain")
+    github_stub.add_templates(150)
+
+    rest = github_module.fetch_namespace("octo", api_url=github_stub.url)
+    github_stub.requests.clear()
+    batched = github_module.fetch_namespace(
+        "octo", api_url=github_stub.url, graphql=True
+    )
+
+    assert [t.repo for t in batched.templates] == [t.repo for t in rest.templates]
+    assert [t.config for t in batched.templates] == [t.config for t in rest.templates]
+    assert github_stub.requests == ["/graphql", "/graphql"]
+
+
+def test_fetch_config_does_not_cache_transient_failures(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_repo("tpl", {"project_name": "tpl"})
+    repo_url = f"{github_stub.url}/octo/tpl"
+    cache = DiskCache(tmp_path, ttl=3600, max_bytes=0)
+    github_stub.queued.append((403, {}))
+
+    with pytest.raises(requests.HTTPError):
+        github_module.fetch_config(repo_url, cache, branch="main")
+
+    cfg = github_module.fetch_config(repo_url, cache, branch="main")
+    assert cfg is not None
+    assert github_stub.statuses == [403, 200]
+
+
+def test_fetch_namespace_skips_repos_that_fail(
+    github_stub: GitHubStub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    github_stub.add_templates(2)
+    original = github_module.fetch_template
+
+    def flaky(repo: dict[str, Any], *args: Any) -> TemplateRepo | None:
+        if repo["name"] == "template-000":
+            raise requests.ConnectionError("boom")
+        return original(repo, *args)
+
+    monkeypatch.setattr(github_module, "fetch_template", flaky)
+
+    ns = github_module.fetch_namespace("octo", api_url=github_stub.url)
+
+    assert [t.repo.name for t in ns.templates] == ["template-001"]
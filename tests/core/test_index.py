@@ -0,0 +1,146 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.index
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+
+import nutrimatic.core.index as index_module
+from nutrimatic.core.index import TemplateIndex
+
+if TYPE_CHECKING:
+    from conftest import GitHubStub
+
+
+def _config_requests(stub: GitHubStub) -> list[str]:
+    return [path for path in stub.requests if path.endswith("config.json")]
+
+
+def test_refresh_only_refetches_pushed_repos(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_repo("plain")
+    github_stub.add_templates(3)
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        first = list(index.refresh_namespace("octo", api_url=github_stub.url))
+        assert len(first) == 3
+        fetched = len(_config_requests(github_stub))
+
+        github_stub.repos[2]["pushed_at"] = "2024-02-01T00:00:00Z"
+        github_stub.configs["/octo/template-001/raw/main/config.json"] = {
+            "project_name": "template-001",
+            "description": "Changed",
+        }
+        second = list(index.refresh_namespace("octo", api_url=github_stub.url))
+
+    assert [t.repo.name for t in second] == [t.repo.name for t in first]
+    assert _config_requests(github_stub)[fetched:] == [
+        "/octo/template-001/raw/main/config.json"
+    ]
+    assert second[1].config is not None
+    assert second[1].config.description == "Changed"
+
+
+def test_refresh_prunes_deleted_repos(tmp_path: Path, github_stub: GitHubStub) -> None:
+    github_stub.add_templates(2)
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+        del github_stub.repos[0]
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+
+        assert [e.name for e in index.search()] == ["template-001"]
+
+
+def test_failed_fetch_is_retried_on_next_refresh(
+    tmp_path: Path, github_stub: GitHubStub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    github_stub.add_templates(1)
+
+    def unavailable(*args: Any) -> None:
+        raise requests.HTTPError("502 Bad Gateway")
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        with monkeypatch.context() as m:
+            m.setattr(index_module, "fetch_template", unavailable)
+            assert list(index.refresh_namespace("octo", api_url=github_stub.url)) == []
+
+        refreshed = list(index.refresh_namespace("octo", api_url=github_stub.url))
+
+    assert [t.repo.name for t in refreshed] == ["template-000"]
+
+
+def test_full_refresh_refetches_every_repo(
+    tmp_path: Path, github_stub: GitHubStub
+) -> None:
+    github_stub.add_templates(2)
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+        fetched = len(_config_requests(github_stub))
+        list(index.refresh_namespace("octo", api_url=github_stub.url, full=True))
+
+    assert len(_config_requests(github_stub)) == 2 * fetched
+
+
+def test_namespace_is_case_insensitive(tmp_path: Path, github_stub: GitHubStub) -> None:
+    github_stub.add_templates(2)
+    for repo in github_stub.repos:
+        repo["owner"]["login"] = "Octo"  # GitHub returns the login's own casing
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+        assert index.has_namespace("octo")
+        assert index.has_namespace("Octo")
+        assert len(index.search(namespaces=["OCTO"])) == 2
+
+        del github_stub.repos[0]
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+        assert [e.name for e in index.search()] == ["template-001"]
+
+
+def test_search_filters(tmp_path: Path, github_stub: GitHubStub) -> None:
+    github_stub.add_repo("py-lib", {"description": "Python library"}, topics=["lib"])
+    github_stub.add_repo("go-svc", {"description": "Go service"}, language="Go")
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        list(index.refresh_namespace("octo", api_url=github_stub.url))
+        requests_before = len(github_stub.requests)
+
+        assert [e.name for e in index.search("LIBRARY")] == ["py-lib"]
+        assert [e.name for e in index.search(tag="lib")] == ["py-lib"]
+        assert [e.name for e in index.search(language="go")] == ["go-svc"]
+        assert index.search(namespaces=["other"]) == []
+        assert len(github_stub.requests) == requests_before
+
+
+def test_add_ccmeta(tmp_path: Path) -> None:
+    template_dir = tmp_path / "templates" / "python-lib"
+    template_dir.mkdir(parents=True)
+    (template_dir / "teabag.toml").write_text(
+        'tags = ["library"]\n'
+        "[template]\n"
+        'name = "python-lib"\n'
+        'description = "Python library"\n'
+        'path = "."\n'
+        'language = "python"\n'
+    )
+
+    with TemplateIndex(tmp_path / "index.sqlite3") as index:
+        assert index.add_ccmeta(tmp_path / "templates") == 1
+        results = index.search(tag="library", language="Python")
+
+    assert [e.name for e in results] == ["python-lib"]
+    assert results[0].source == "ccmeta"
@@ -0,0 +1,76 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.logger
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from nutrimatic.cli.options.verbose import verbose_mode
+from nutrimatic.core.config import ensure_config
+from nutrimatic.core.logger import lazy_logger
+
+HEAVY_MODULES = ("cookiecutter", "git", "pydantic", "requests", "sphinx")
+
+
+def test_lazy_logger_initializes_on_first_use() -> None:
+    calls: list[int] = []
+    target = logging.getLogger("nutri-matic.test-lazy")
+
+    def factory() -> logging.Logger:
+        calls.append(1)
+        return target
+
+    logger = lazy_logger(factory)
+    assert calls == []
+
+    assert logger.name == "nutri-matic.test-lazy"
+    assert calls == [1]
+
+
+def test_import_has_no_side_effects(tmp_path: Path) -> None:
+    """
+    Importing the CLI or the hooks must not read or write the config or the
+    log file, and the CLI must not import the heavy dependencies that its
+    commands load on first use.
+    """
+    env = {**os.environ, "HOME": str(tmp_path)}
+    code = (
+        "import sys\n"
+        "import nutrimatic.cli.main\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        "import nutrimatic.hooks.post_gen_logic\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_lazy_logger_keeps_verbose_setup(
+    tmp_path: Path, fresh_logger: logging.Logger
+) -> None:
+    cfg = ensure_config().model_copy(update={"log_file": tmp_path / "nutri-matic.log"})
+    verbose_mode(cfg, verbose=True)
+
+    logger = lazy_logger()
+    logger.debug("first lazy use")
+
+    assert fresh_logger.level == logging.DEBUG
+    assert logger.isEnabledFor(logging.DEBUG)
@@ -0,0 +1,69 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.mirror
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from conftest import commit_config
+from nutrimatic.core.mirror import MirrorCache
+
+
+@pytest.fixture
+def template_repo(make_template_repo: Callable[..., Repo]) -> Repo:
+    return make_template_repo("template", {"project_name": "v1"})
+
+
+def test_read_file_without_checkout(tmp_path: Path, template_repo: Repo) -> None:
+    mirrors = MirrorCache(tmp_path / "mirrors", ttl=60)
+    url = template_repo.working_dir
+
+    text = mirrors.read_file(url, "main", "cookiecutter.json")
+
+    assert text is not None
+    assert json.loads(text) == {"project_name": "v1"}
+    mirror = mirrors.path(url)
+    assert (mirror / "HEAD").exists()
+    assert not (mirror / "cookiecutter.json").exists()
+    assert mirrors.read_file(url, "main", "missing.json") is None
+
+
+def test_fresh_mirror_is_not_fetched(
+    tmp_path: Path, template_repo: Repo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mirrors = MirrorCache(tmp_path / "mirrors", ttl=60)
+    url = template_repo.working_dir
+    mirrors.read_file(url, "main", "cookiecutter.json")
+
+    fetches: list[Path] = []
+    monkeypatch.setattr(mirrors, "_fetch", lambda repo, path: fetches.append(path))
+    commit_config(template_repo, {"project_name": "v2"})
+    text = mirrors.read_file(url, "main", "cookiecutter.json")
+
+    assert text is not None
+    assert json.loads(text) == {"project_name": "v1"}
+    assert fetches == []
+
+
+def test_refresh_fetches_new_commits(tmp_path: Path, template_repo: Repo) -> None:
+    url = template_repo.working_dir
+    MirrorCache(tmp_path / "mirrors", ttl=60).read_file(url, "main", "x")
+
+    commit_config(template_repo, {"project_name": "v2"})
+    mirrors = MirrorCache(tmp_path / "mirrors", ttl=60, refresh=True)
+    text = mirrors.read_file(url, "main", "cookiecutter.json")
+
+    assert text is not None
+    assert json.loads(text) == {"project_name": "v2"}
@@ -0,0 +1,76 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.pipeline
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from nutrimatic.core.pipeline import Pipeline
+
+
+def test_independent_stages_run_concurrently() -> None:
+    # Both stages must be inside the barrier at the same time to pass it.
+    barrier = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+
+    pipeline = Pipeline(max_workers=4)
+    pipeline.add("a", lambda: order.append(f"a:{barrier.wait()}"))
+    pipeline.add("b", lambda: order.append(f"b:{barrier.wait()}"))
+    pipeline.add("c", lambda: order.append("c"), after=["a", "b"])
+    report = pipeline.run()
+
+    assert report.ok
+    assert order[-1] == "c"
+    assert {r.name for r in report.results} == {"a", "b", "c"}
+    assert all(r.seconds >= 0 for r in report.results)
+
+
+def test_failed_stage_skips_dependents() -> None:
+    ran: list[str] = []
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline(max_workers=2)
+    pipeline.add("fail", fail)
+    pipeline.add("after-fail", lambda: ran.append("after-fail"), after=["fail"])
+    report = pipeline.run(raise_on_error=False)
+
+    assert not report.ok
+    assert ran == []
+    statuses = {r.name: r.status for r in report.results}
+    assert statuses == {"fail": "failed", "after-fail": "skipped"}
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run()
+
+
+def test_system_exit_is_a_stage_failure() -> None:
+    def exit_stage() -> None:
+        raise SystemExit(2)
+
+    report = Pipeline(max_workers=1).add("exit", exit_stage).run(raise_on_error=False)
+
+    assert report.results[0].status == "failed"
+
+
+def test_invalid_graphs_are_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown"):
+        Pipeline().add("a", lambda: None, after=["missing"]).order()
+
+    cyclic = Pipeline().add("a", lambda: None, after=["b"])
+    cyclic.add("b", lambda: None, after=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        cyclic.order()
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        Pipeline().add("a", lambda: None).add("a", lambda: None)
@@ -0,0 +1,127 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.store
+"""
+
+from __future__ import annotations
+
+import json
+import tarfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from conftest import commit_config
+from nutrimatic.core.mirror import MirrorCache
+from nutrimatic.core.store import TemplateStore, _extract, normalize_url
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TemplateStore:
+    return TemplateStore(
+        tmp_path / "templates", MirrorCache(tmp_path / "mirrors", ttl=0)
+    )
+
+
+def test_normalize_url() -> None:
+    assert (
+        normalize_url("git@github.com:jcook3701/sphinx-cookiecutter.git")
+        == normalize_url("https://github.com/jcook3701/sphinx-cookiecutter")
+        == "github.com/jcook3701/sphinx-cookiecutter"
+    )
+
+
+def test_sync_exports_checkout(
+    store: TemplateStore, make_template_repo: Callable[..., Repo]
+) -> None:
+    repo = make_template_repo("template", {"project_name": "v1"})
+    url = repo.working_dir
+
+    stored = store.sync(url)
+
+    assert stored.commit == repo.head.commit.hexsha
+    config = json.loads((stored.path / "cookiecutter.json").read_text())
+    assert config == {"project_name": "v1"}
+    assert not (stored.path / ".git").exists()
+    assert store.resolve(url) == stored
+
+
+def test_sync_without_tarfile_filters(
+    store: TemplateStore,
+    make_template_repo: Callable[..., Repo],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Python before 3.11.4 has no tarfile extraction filters."""
+    monkeypatch.delattr(tarfile, "data_filter")
+    url = make_template_repo("template", {"project_name": "v1"}).working_dir
+
+    stored = store.sync(url)
+
+    config = json.loads((stored.path / "cookiecutter.json").read_text())
+    assert config == {"project_name": "v1"}
+
+
+@pytest.mark.parametrize("name", ["../evil", "/tmp/evil", "link"])
+def test_extract_without_tarfile_filters_rejects_escapes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    monkeypatch.delattr(tarfile, "data_filter")
+    archive = tmp_path / "tree.tar"
+    with tarfile.open(archive, "w") as tar:
+        member = tarfile.TarInfo(name)
+        if name == "link":
+            member.type, member.linkname = tarfile.SYMTYPE, "../../outside"
+        tar.addfile(member)
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        _extract(archive, tmp_path / "tree")
+    assert not (tmp_path / "tree").exists()
+
+
+def test_sync_replaces_older_version(
+    store: TemplateStore, make_template_repo: Callable[..., Repo]
+) -> None:
+    repo = make_template_repo("template", {"project_name": "v1"})
+    url = repo.working_dir
+    old = store.sync(url, "main")
+
+    commit_config(repo, {"project_name": "v2"})
+    new = store.sync(url, "main")
+
+    assert new.commit != old.commit
+    assert not old.path.exists()
+    config = json.loads((new.path / "cookiecutter.json").read_text())
+    assert config == {"project_name": "v2"}
+    assert store.resolve(url, "main") == new
+    assert store.resolve(url) is None
+
+
+def test_resolve_is_offline(
+    store: TemplateStore,
+    make_template_repo: Callable[..., Repo],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = make_template_repo("template").working_dir
+    stored = store.sync(url)
+
+    def no_network(*_: object) -> None:
+        raise AssertionError("resolve must not fetch")
+
+    monkeypatch.setattr(store.mirrors, "mirror", no_network)
+    assert store.resolve(url) == stored
+    assert store.resolve("https://github.com/example/missing.git") is None
+
+
+def test_unknown_ref(
+    store: TemplateStore, make_template_repo: Callable[..., Repo]
+) -> None:
+    url = make_template_repo("template").working_dir
+    with pytest.raises(ValueError, match="Unknown ref"):
+        store.sync(url, "no-such-branch")
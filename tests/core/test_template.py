@@ -0,0 +1,111 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.template
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from git import Repo
+
+from nutrimatic.core.mirror import MirrorCache
+from nutrimatic.core.template import clean_config, extract_many, read_manifest
+from nutrimatic.models import ExtractJob
+
+
+def test_clean_config_is_recursive() -> None:
+    data: dict[str, object] = {
+        "project_name": "demo",
+        "slug": "{{ cookiecutter.project_name|lower }}",
+        "license": ["MIT", "{% if cookiecutter.x %}BSD{% endif %}"],
+        "_hooks": {"pre": "{{ cookiecutter.pre }}", "post": "post.py"},
+        "_copy_without_render": ["*.html"],
+        "year": 2024,
+    }
+
+    assert clean_config(data) == {
+        "project_name": "demo",
+        "license": ["MIT"],
+        "_hooks": {"post": "post.py"},
+        "_copy_without_render": ["*.html"],
+        "year": 2024,
+    }
+
+
+def test_clean_config_lexer_honours_custom_delimiters() -> None:
+    data: dict[str, object] = {
+        "_jinja2_env_vars": {
+            "variable_start_string": "[[",
+            "variable_end_string": "]]",
+        },
+        "slug": "[[ cookiecutter.name ]]",
+        "literal": "{{ kept }}",
+    }
+
+    assert clean_config(data, use_lexer=True) == {
+        "_jinja2_env_vars": data["_jinja2_env_vars"],
+        "literal": "{{ kept }}",
+    }
+
+
+def test_extract_many_writes_configs_and_reports_failures(
+    tmp_path: Path, make_template_repo: Callable[..., Repo]
+) -> None:
+    good = make_template_repo(
+        "good", {"project_name": "good", "slug": "{{ cookiecutter.project_name }}"}
+    )
+    other = make_template_repo("other")
+    jobs = [
+        ExtractJob(repo=good.working_dir),
+        ExtractJob(repo=other.working_dir, branch="missing"),
+        ExtractJob(repo=str(tmp_path / "nope")),
+    ]
+    mirrors = MirrorCache(tmp_path / "mirrors", ttl=60)
+
+    report = extract_many(jobs, tmp_path / "out", mirrors, max_workers=3)
+
+    assert [r.repo for r in report.results] == [job.repo for job in jobs]
+    assert json.loads((tmp_path / "out" / "good.json").read_text()) == {
+        "project_name": "good"
+    }
+    assert report.results[0].error is None
+    assert report.results[0].seconds > 0
+    assert [r.repo for r in report.failures] == [jobs[1].repo, jobs[2].repo]
+    assert "FileNotFoundError" in (report.results[1].error or "")
+
+
+def test_extract_many_dedupes_output_names(
+    tmp_path: Path, make_template_repo: Callable[..., Repo]
+) -> None:
+    repo = make_template_repo("tpl")
+    jobs = [ExtractJob(repo=repo.working_dir), ExtractJob(repo=repo.working_dir)]
+
+    report = extract_many(jobs, tmp_path / "out", MirrorCache(tmp_path / "m", ttl=60))
+
+    assert [r.output for r in report.results] == [
+        tmp_path / "out" / "tpl.json",
+        tmp_path / "out" / "tpl-2.json",
+    ]
+
+
+def test_read_manifest(tmp_path: Path) -> None:
+    manifest = tmp_path / "templates.txt"
+    manifest.write_text(
+        "# cookiecutter templates\n"
+        "git@github.com:octo/a.git\n"
+        "\n"
+        "https://github.com/octo/b develop  # feature branch\n"
+    )
+
+    assert read_manifest(manifest, branch="main") == [
+        ExtractJob(repo="git@github.com:octo/a.git", branch="main"),
+        ExtractJob(repo="https://github.com/octo/b", branch="develop"),
+    ]
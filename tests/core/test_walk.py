@@ -0,0 +1,70 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.core.walk
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import nutrimatic.core.walk as walk_module
+from nutrimatic.core.walk import walk_files
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel, content in {
+        "README.md": "readme",
+        "docs/index.MD": "index",
+        "docs/api/module.md": "api",
+        "docs/api/data.json": "{}",
+        "node_modules/pkg/README.md": "vendored",
+        ".git/HEAD": "ref",
+        "big.md": "x" * 100,
+    }.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    (tmp_path / "link").symlink_to(tmp_path / "docs", target_is_directory=True)
+    return tmp_path
+
+
+def test_walk_files_filters(tree: Path) -> None:
+    found = {
+        e.rel_path: e.stat().st_size
+        for e in walk_files(
+            tree, ignore=(".git", "node_modules"), extensions={"md"}, max_bytes=50
+        )
+    }
+    assert found == {"README.md": 6, "docs/index.MD": 5, "docs/api/module.md": 3}
+
+
+def test_walk_files_prunes_ignored_dirs(
+    tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    scanned: list[str] = []
+    scandir = os.scandir
+
+    def spy(path: str) -> object:
+        scanned.append(os.path.relpath(path, tree))
+        return scandir(path)
+
+    monkeypatch.setattr(walk_module.os, "scandir", spy)
+    entries = list(walk_files(tree, ignore=("node_modules", "docs/api")))
+
+    assert sorted(scanned) == [".", ".git", "docs"]
+    assert {e.rel_path for e in entries} == {
+        "README.md",
+        "big.md",
+        ".git/HEAD",
+        "docs/index.MD",
+    }
+    assert all(e.path == tree / e.rel_path for e in entries)
@@ -0,0 +1,183 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.hooks.post_gen_logic.auto_vars
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from nutrimatic.hooks.post_gen_logic.auto_vars import (
+    DEFAULT_IGNORE,
+    replace_placeholders_in_dir,
+    replace_placeholders_in_file,
+)
+
+
+def test_replaces_all_placeholders_in_one_pass(tmp_path: Path) -> None:
+    (tmp_path / "pkg").mkdir()
+    readme = tmp_path / "README.md"
+    readme.write_text("PKG_NAME (PKG) © YEAR")
+    module = tmp_path / "pkg" / "mod.py"
+    module.write_text("# YEAR\n")
+
+    report = replace_placeholders_in_dir(
+        {"PKG": "short", "PKG_NAME": "long YEAR", "YEAR": 2024}, tmp_path
+    )
+
+    # The longest placeholder wins, and replaced values are not re-scanned.
+    assert readme.read_text() == "long YEAR (short) © 2024"
+    assert module.read_text() == "# 2024\n"
+    assert report.files_scanned == 2
+    assert sorted(report.modified) == [readme, module]
+    assert report.bytes_written > 0
+
+
+def test_skips_hook_script_and_binary_files(tmp_path: Path) -> None:
+    hook = tmp_path / "post_gen_project.py"
+    hook.write_text("YEAR")
+    binary = tmp_path / "logo.png"
+    binary.write_bytes(b"\x89PNG\xff\xfeYEAR")
+    untouched = tmp_path / "plain.txt"
+    untouched.write_text("nothing here")
+    mtime = untouched.stat().st_mtime_ns
+
+    replace_placeholders_in_dir({"YEAR": 2024}, tmp_path)
+
+    assert hook.read_text() == "YEAR"
+    assert binary.read_bytes() == b"\x89PNG\xff\xfeYEAR"
+    assert untouched.stat().st_mtime_ns == mtime
+
+
+def test_dry_run_reports_without_writing(tmp_path: Path) -> None:
+    small = tmp_path / "small.txt"
+    small.write_text("© YEAR")
+    big = tmp_path / "big.txt"
+    big.write_text("x" * 64 + "YEAR")
+    (tmp_path / "plain.txt").write_text("nothing here")
+
+    report = replace_placeholders_in_dir({"YEAR": 2024}, tmp_path, dry_run=True)
+
+    assert report.dry_run
+    assert (report.files_scanned, report.files_modified) == (3, 2)
+    assert sorted(report.modified) == [big, small]
+    assert report.bytes_written == 0
+    assert small.read_text() == "© YEAR"
+
+    change = replace_placeholders_in_file(
+        big, {"YEAR": 2024}, stream_threshold=0, dry_run=True
+    )
+    assert change.modified
+    assert big.read_text().endswith("YEAR")
+
+
+def test_prunes_ignored_dirs_and_large_files(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    for rel in (".git/config", "node_modules/pkg/index.js", "docs/big.txt"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+    (tmp_path / ".git" / "config").write_text("YEAR")
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("YEAR")
+    (tmp_path / "docs" / "big.txt").write_text("YEAR" + " " * 100)
+    (tmp_path / "docs" / "notes.md").write_text("YEAR")
+    (tmp_path / "docs" / "skip.md").write_text("YEAR")
+
+    with caplog.at_level(logging.INFO, logger="nutri-matic"):
+        replace_placeholders_in_dir(
+            {"YEAR": 2024},
+            tmp_path,
+            ignore=(*DEFAULT_IGNORE, "docs/skip.md"),
+            max_bytes=50,
+            max_workers=2,
+        )
+
+    assert (tmp_path / ".git" / "config").read_text() == "YEAR"
+    assert (tmp_path / "node_modules" / "pkg" / "index.js").read_text() == "YEAR"
+    assert (tmp_path / "docs" / "big.txt").read_text().startswith("YEAR")
+    assert (tmp_path / "docs" / "skip.md").read_text() == "YEAR"
+    assert (tmp_path / "docs" / "notes.md").read_text() == "2024"
+    assert f"Skipping file over 50 bytes: {tmp_path / 'docs' / 'big.txt'}" in (
+        caplog.text
+    )
+
+
+def test_large_files_are_streamed_not_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"YEAR," + b"x" * (11 * 1024 * 1024))  # over the old 10 MiB cap
+
+    report = replace_placeholders_in_dir({"YEAR": 2024}, tmp_path)
+
+    assert report.modified == [path]
+    with open(path, "rb") as f:
+        assert f.read(5) == b"2024,"
+
+
+def test_failed_stream_is_not_reported_modified(tmp_path: Path) -> None:
+    path = tmp_path / "broken.txt"
+    data = b"YEAR " + b"x" * 100 + b"\xff\xfe"  # invalid UTF-8 after the match
+    path.write_bytes(data)
+
+    change = replace_placeholders_in_file(path, {"YEAR": 2024}, stream_threshold=0)
+
+    assert not change.modified
+    assert change.bytes_written == 0
+    assert path.read_bytes() == data
+    assert os.listdir(tmp_path) == ["broken.txt"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+@pytest.mark.parametrize("multiline", [False, True])
+def test_streaming_matches_in_memory_result(
+    tmp_path: Path, chunk_size: int, multiline: bool
+) -> None:
+    replacements: dict[str, object] = {"PKG": "short", "PKG_NAME": "lüng", "YEAR": 2024}
+    if multiline:
+        replacements["END\nSTART"] = "joined"
+    text = "ä PKG_NAME\nSTART\r\n" * 5 + "PKGYEAR PKG_NAM €YEAR END\nSTART"
+    streamed = tmp_path / "streamed.txt"
+    streamed.write_bytes(text.encode("utf-8"))
+    streamed.chmod(0o755)
+    in_memory = tmp_path / "in_memory.txt"
+    in_memory.write_bytes(text.encode("utf-8"))
+
+    replace_placeholders_in_file(
+        streamed, replacements, stream_threshold=0, chunk_size=chunk_size
+    )
+    replace_placeholders_in_file(in_memory, replacements)
+
+    assert streamed.read_bytes() == in_memory.read_bytes()
+    assert streamed.stat().st_mode & 0o777 == 0o755
+    assert sorted(os.listdir(tmp_path)) == ["in_memory.txt", "streamed.txt"]
+
+
+@pytest.mark.parametrize("stream_threshold", [0, 1024 * 1024])
+def test_line_endings_are_kept(tmp_path: Path, stream_threshold: int) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"a YEAR\r\nb\r\n")
+
+    change = replace_placeholders_in_file(
+        path, {"YEAR": 2026}, stream_threshold=stream_threshold
+    )
+
+    assert change.modified
+    assert path.read_bytes() == b"a 2026\r\nb\r\n"
+
+
+def test_streaming_leaves_files_without_matches_alone(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c\n" * 1000)
+    before = path.stat()
+
+    replace_placeholders_in_file(path, {"YEAR": 2024}, stream_threshold=0)
+
+    after = path.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
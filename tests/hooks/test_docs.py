@@ -0,0 +1,88 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.hooks.post_gen_logic.docs
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from pathlib import Path
+
+import pytest
+
+import nutrimatic.hooks.post_gen_logic.docs as docs_module
+from nutrimatic.core.config import ensure_config
+
+REPOS = ("jcook3701/github-docs-cookiecutter", "jcook3701/sphinx-cookiecutter")
+
+
+@pytest.fixture
+def local_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Serve both docs templates from local directories instead of GitHub."""
+    root = tmp_path / "templates"
+    for repo in REPOS:
+        template = root / repo
+        project = template / "{{ cookiecutter.project_name }}"
+        project.mkdir(parents=True)
+        (template / "cookiecutter.json").write_text(
+            json.dumps({"project_name": "docs", "author": "nobody"})
+        )
+        (project / "index.md").write_text(f"{repo} by {{{{ cookiecutter.author }}}}")
+    monkeypatch.setattr(docs_module, "TEMPLATE_URL", f"{root}/{{repo}}")
+    cache_dir = tmp_path / "cache"
+    cfg = ensure_config().model_copy(update={"cache_dir": cache_dir})
+    monkeypatch.setattr(docs_module, "ensure_config", lambda: cfg)
+    return root
+
+
+def test_generate_docs_renders_each_template_and_caches(
+    tmp_path: Path, local_templates: Path
+) -> None:
+    context = {"project_name": "demo", "author": "Ada"}
+    project = tmp_path / "project"
+
+    docs_module.generate_docs_templates(context, project)
+
+    jekyll = project / "docs" / "jekyll" / "index.md"
+    sphinx = project / "docs" / "sphinx" / "index.md"
+    assert jekyll.read_text() == f"{REPOS[0]} by Ada"
+    assert sphinx.read_text() == f"{REPOS[1]} by Ada"
+    assert sorted(p.name for p in (project / "docs").iterdir()) == ["jekyll", "sphinx"]
+
+    # A second project with the same settings is served from the cache.
+    shutil.rmtree(local_templates)
+    other = tmp_path / "other"
+    docs_module.generate_docs_templates(context, other)
+
+    assert (other / "docs" / "jekyll" / "index.md").read_text() == jekyll.read_text()
+    assert (other / "docs" / "sphinx" / "index.md").read_text() == sphinx.read_text()
+
+
+def test_generate_docs_skips_sub_templates(
+    tmp_path: Path, local_templates: Path
+) -> None:
+    docs_module.generate_docs_templates({"_is_sub_template": True}, tmp_path)
+
+    assert not (tmp_path / "docs").exists()
+
+
+def test_failed_render_is_skipped_and_cleaned_up(
+    tmp_path: Path, local_templates: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    shutil.rmtree(local_templates / REPOS[0])
+    project = tmp_path / "project"
+
+    with caplog.at_level(logging.INFO, logger="nutri-matic"):
+        docs_module.generate_docs_templates({"project_name": "demo"}, project)
+
+    assert sorted(p.name for p in (project / "docs").iterdir()) == ["sphinx"]
+    assert (project / "docs" / "sphinx" / "index.md").exists()
+    assert "Docs generation failed for: Github" in caplog.text
+    assert "generated successfully" not in caplog.text
@@ -0,0 +1,87 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.hooks.post_gen_logic.pipeline
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from nutrimatic.core.pipeline import Pipeline
+from nutrimatic.hooks.post_gen_logic import post_gen_pipeline
+
+
+def test_post_gen_pipeline_stages(tmp_path: Path) -> None:
+    (tmp_path / "README.md").write_text("© __YEAR__")
+
+    pipeline = post_gen_pipeline(
+        {},
+        project_dir=tmp_path,
+        ansible=True,
+        changelogs=True,
+        replacements={"__YEAR__": 2024},
+    )
+    assert pipeline.stages["auto-vars"].after == ["ansible-dirs", "changelog-dirs"]
+    assert "make" not in pipeline.stages
+
+    report = pipeline.run()
+
+    assert report.ok
+    assert (tmp_path / "playbooks" / "tasks").is_dir()
+    assert (tmp_path / "changelogs" / "releases").is_dir()
+    assert (tmp_path / "README.md").read_text() == "© 2024"
+
+
+def test_post_gen_pipeline_make_runs_last(tmp_path: Path) -> None:
+    targets = ["install", "git-init", "pre-commit-init", "build-docs"]
+    context = {"_hooks": {"post_gen_make_cmds": dict.fromkeys(targets, True)}}
+
+    pipeline = post_gen_pipeline(context, project_dir=tmp_path, changelogs=True)
+
+    stages = pipeline.stages
+    assert stages["make install"].after == ["changelog-dirs"]
+    assert stages["make git-init"].after == ["changelog-dirs"]
+    assert stages["make pre-commit-init"].after == [
+        "changelog-dirs",
+        "make install",
+        "make git-init",
+    ]
+    assert stages["make build-docs"].after == [
+        "changelog-dirs",
+        "make install",
+        "make git-init",
+    ]
+    order = pipeline.order()
+    assert order[0] == "changelog-dirs"
+    assert set(order[-2:]) == {"make pre-commit-init", "make build-docs"}
+
+
+def _ancestors(pipeline: Pipeline, name: str) -> set[str]:
+    found: set[str] = set()
+    pending = list(pipeline.stages[name].after)
+    while pending:
+        stage = pending.pop()
+        if stage not in found:
+            found.add(stage)
+            pending.extend(pipeline.stages[stage].after)
+    return found
+
+
+def test_post_gen_pipeline_orders_git_targets() -> None:
+    targets = ["install", "git-init", "pre-commit-init", "changelog", "build-docs"]
+    context = {"_hooks": {"post_gen_make_cmds": dict.fromkeys(targets, True)}}
+
+    pipeline = post_gen_pipeline(context, project_dir=Path())
+
+    # changelog and build-docs both stage files with ``git add``: they must
+    # never run at the same time, and only once the repository and the
+    # project's tools exist.
+    changelog = _ancestors(pipeline, "make changelog")
+    build_docs = _ancestors(pipeline, "make build-docs")
+    assert {"make install", "make git-init"} <= changelog
+    assert {"make install", "make git-init", "make changelog"} <= build_docs
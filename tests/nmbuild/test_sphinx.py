@@ -0,0 +1,67 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.build.sphinx
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import nutrimatic.build.sphinx as sphinx_module
+from nutrimatic.build.sphinx import add_yaml_front_matter, init_yaml_front_matter
+from nutrimatic.build.yaml_front_matter import build_front_matter
+
+
+class FakeApp:
+    """The parts of a Sphinx application the front matter hooks use."""
+
+    def __init__(self, builder: str = "markdown", project: str = "proj") -> None:
+        self.builder = SimpleNamespace(name=builder)
+        self.config = SimpleNamespace(project=project)
+
+
+def read(app: Any, docname: str) -> str:
+    source = ["# Body\n"]
+    add_yaml_front_matter(app, docname, source)
+    return source[0]
+
+
+def test_front_matter_is_prepended_once_per_docname(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def spy(file_path: Any, *args: Any) -> str:
+        calls.append(str(file_path))
+        return build_front_matter(file_path, *args)
+
+    monkeypatch.setattr(sphinx_module, "build_front_matter", spy)
+    app: Any = FakeApp()
+    init_yaml_front_matter(app)
+
+    index = read(app, "index")
+    assert index.startswith("---\ntitle: index\n")
+    assert "parent: proj" in index
+    assert index.endswith("---\n# Body\n")
+    assert "parent: guide" in read(app, "guide/install")
+
+    assert read(app, "index") == index
+    assert calls == ["index", "guide/install"]
+
+
+def test_state_is_per_build_and_skips_other_builders() -> None:
+    html: Any = FakeApp(builder="html")
+    init_yaml_front_matter(html)
+    assert read(html, "index") == "# Body\n"
+
+    # Without builder-inited, the state is computed on the first source-read.
+    other: Any = FakeApp(project="other")
+    assert "parent: other" in read(other, "index")
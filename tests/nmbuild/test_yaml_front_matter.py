@@ -0,0 +1,162 @@
+"""nutri-matic Package
+
+© All rights reserved. Jared Cook
+
+See the LICENSE file for more details.
+
+Author: Jared Cook
+Description: Tests for nutrimatic.build.yaml_front_matter
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+import nutrimatic.build.yaml_front_matter as fm_module
+from nutrimatic.build.yaml_front_matter import (
+    SNIFF_BYTES,
+    add_front_matter_to_dir,
+    add_front_matter_to_file,
+    has_front_matter,
+)
+from nutrimatic.cli import build
+from nutrimatic.models import FileChange, RewriteReport
+
+EXTENSIONS = {"md"}
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> Path:
+    root = tmp_path / "docs"
+    (root / "guide").mkdir(parents=True)
+    (root / "index.md").write_text("# Home\n")
+    (root / "guide" / "install.md").write_text("# Install\n")
+    (root / "guide" / "done.md").write_text("---\ntitle: done\n---\n# Done\n")
+    (root / "guide" / "image.png").write_bytes(b"\x89PNG")
+    return root
+
+
+@pytest.fixture
+def opened(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the files rewrite_front_matter is called for."""
+    calls: list[str] = []
+    original = fm_module.rewrite_front_matter
+
+    def spy(file_path: Path, *args: Any, **kwargs: Any) -> FileChange:
+        calls.append(file_path.name)
+        return original(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(fm_module, "rewrite_front_matter", spy)
+    return calls
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_add_front_matter_to_dir(docs: Path, tmp_path: Path, max_workers: int) -> None:
+    report = add_front_matter_to_dir(
+        docs, EXTENSIONS, "proj", max_workers=max_workers, cache_dir=tmp_path
+    )
+
+    assert report.files_scanned == 3
+    assert report.files_modified == 2
+    assert sorted(p.name for p in report.modified) == ["index.md", "install.md"]
+    assert report.bytes_written > report.bytes_read > 0
+    index = (docs / "index.md").read_text()
+    assert index.startswith("---\ntitle: index\n")
+    assert "parent: proj" in index
+    assert "parent: guide" in (docs / "guide" / "install.md").read_text()
+    assert (docs / "guide" / "done.md").read_text().count("---") == 2
+
+
+def test_incremental_skips_unchanged_files(
+    docs: Path, tmp_path: Path, opened: list[str]
+) -> None:
+    cache = tmp_path / "cache"
+    report = add_front_matter_to_dir(
+        docs, EXTENSIONS, incremental=True, cache_dir=cache
+    )
+    assert report.files_modified == 2
+    assert sorted(opened) == ["done.md", "index.md", "install.md"]
+
+    opened.clear()
+    index = docs / "index.md"
+    os.utime(index, ns=(0, 0))  # touched, content unchanged
+    (docs / "guide" / "install.md").write_text("# Rewritten\n")
+    (docs / "new.md").write_text("# New\n")
+
+    report = add_front_matter_to_dir(
+        docs, EXTENSIONS, incremental=True, cache_dir=cache
+    )
+
+    assert report.files_modified == 2
+    assert sorted(opened) == ["install.md", "new.md"]
+
+    opened.clear()
+    report = add_front_matter_to_dir(
+        docs, EXTENSIONS, incremental=True, cache_dir=cache
+    )
+    assert report.files_modified == 0
+    assert report.bytes_read == 0
+    assert opened == []
+
+
+def test_dry_run_writes_nothing(docs: Path, tmp_path: Path) -> None:
+    before = {p: p.read_bytes() for p in docs.rglob("*.md")}
+
+    report = add_front_matter_to_dir(
+        docs, EXTENSIONS, incremental=True, cache_dir=tmp_path, dry_run=True
+    )
+
+    assert report.dry_run
+    assert sorted(p.name for p in report.modified) == ["index.md", "install.md"]
+    assert report.bytes_written == 0
+    assert {p: p.read_bytes() for p in docs.rglob("*.md")} == before
+    assert not (tmp_path / "front_matter").exists()
+
+
+def test_has_front_matter_reads_past_leading_whitespace(tmp_path: Path) -> None:
+    path = tmp_path / "page.md"
+    path.write_text(" \n" * SNIFF_BYTES + "---\ntitle: x\n---\n")
+    assert has_front_matter(path)
+
+    path.write_text("# Title\n" + "---\n" * 10)
+    assert not has_front_matter(path)
+
+    path.write_text("")
+    assert not has_front_matter(path)
+
+
+def test_add_front_matter_streams_large_file(tmp_path: Path) -> None:
+    path = tmp_path / "big.md"
+    body = b"line\r\n" * 1_000_000  # ~6 MB, CRLF preserved byte for byte
+    path.write_bytes(body)
+    path.chmod(0o640)
+
+    assert add_front_matter_to_file(path, {"md"}, depth=1, project="proj")
+
+    data = path.read_bytes()
+    assert data.startswith(b"---\ntitle: big\n")
+    assert data.endswith(body)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["big.md"]
+    assert not add_front_matter_to_file(path, {"md"}, depth=1, project="proj")
+
+
+def test_cli_dry_run_reports_each_file_once(docs: Path, tmp_path: Path) -> None:
+    report_path = tmp_path / "report.json"
+
+    result = CliRunner().invoke(
+        build.app,
+        ["add-yaml-front-matter", str(docs), "--dry-run", "--report", str(report_path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("would add front matter") == 2
+    assert result.output.count("would modify 2") == 1
+    assert RewriteReport.model_validate_json(report_path.read_text()).dry_run
+    assert not has_front_matter(docs / "index.md")